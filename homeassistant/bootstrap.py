@@ -34,9 +34,9 @@ from .setup import (
     async_setup_component,
 )
 from .util import dt as dt_util
-from .util.async_ import gather_with_concurrency
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_virtual_env
+from .util.yaml import ParseCache
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -122,6 +122,10 @@ async def async_setup_hass(
 
     if not (safe_mode := runtime_config.safe_mode):
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
+        # Only a running instance caches parsed YAML, not check_config or tests
+        hass.data[conf_util.DATA_YAML_PARSE_CACHE] = ParseCache(
+            hass.config.path(conf_util.YAML_PARSE_CACHE_FILE)
+        )
 
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
@@ -476,14 +480,9 @@ async def _async_set_up_integrations(
 
         integrations_to_process = [
             int_or_exc
-            for int_or_exc in await gather_with_concurrency(
-                loader.MAX_LOAD_CONCURRENTLY,
-                *(
-                    loader.async_get_integration(hass, domain)
-                    for domain in old_to_resolve
-                ),
-                return_exceptions=True,
-            )
+            for int_or_exc in (
+                await loader.async_get_integrations(hass, old_to_resolve)
+            ).values()
             if isinstance(int_or_exc, loader.Integration)
         ]
         resolve_dependencies_tasks = [
@@ -5,8 +5,9 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import ActionTrace, async_store_trace
-from homeassistant.components.trace.const import CONF_STORED_TRACES
+from homeassistant.components.trace.const import CONF_LEVEL, CONF_STORED_TRACES
 from homeassistant.core import Context
+from homeassistant.helpers.trace import TRACE_LEVEL_OFF, trace_level_cv
 
 from .const import DOMAIN
 
@@ -50,7 +51,9 @@ def trace_automation(
 ):
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    if (trace_level := trace_config[CONF_LEVEL]) != TRACE_LEVEL_OFF:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_level_cv.set(trace_level)
 
     try:
         yield trace
@@ -59,5 +62,6 @@ def trace_automation(
             trace.set_error(ex)
         raise ex
     finally:
+        trace_level_cv.reset(token)
         if automation_id:
             trace.finished()
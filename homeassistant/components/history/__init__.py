@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from contextlib import closing
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 import logging
+import threading
 import time
 from typing import Literal, cast
 
@@ -39,6 +41,11 @@ HISTORY_USE_INCLUDE_ORDER = "history_use_include_order"
 
 CONF_ORDER = "use_include_order"
 
+# Number of states after which a chunk of a streamed history is sent
+HISTORY_STREAM_CHUNK_SIZE = 10000
+# Number of chunks of a streamed history that may wait to be written
+HISTORY_STREAM_MAX_CHUNKS_IN_FLIGHT = 2
+
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -205,6 +212,90 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    cancel: threading.Event,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    filters: Filters | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Fetch history significant_states and send them in chunks in the executor.
+
+    The database is only read ahead while at most
+    HISTORY_STREAM_MAX_CHUNKS_IN_FLIGHT chunks wait to be written to the
+    client, so a slow client can't make the send queue grow unbounded.
+    """
+    in_flight = threading.Semaphore(HISTORY_STREAM_MAX_CHUNKS_IN_FLIGHT)
+    chunk: dict[str, list] = {}
+    chunk_size = 0
+    with closing(
+        history.stream_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+    ) as entity_states:
+        for entity_id, states in entity_states:
+            if cancel.is_set():
+                return
+            chunk[entity_id] = states
+            chunk_size += len(states)
+            if chunk_size >= HISTORY_STREAM_CHUNK_SIZE:
+                if not _send_history_chunk(
+                    hass, connection, msg_id, cancel, in_flight, chunk, False
+                ):
+                    return
+                chunk = {}
+                chunk_size = 0
+
+    _send_history_chunk(hass, connection, msg_id, cancel, in_flight, chunk, True)
+
+
+def _send_history_chunk(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    cancel: threading.Event,
+    in_flight: threading.Semaphore,
+    states: dict[str, list],
+    done: bool,
+) -> bool:
+    """Serialize a chunk of a streamed history and send it from the executor.
+
+    Waits until the writer has taken an earlier chunk off the send queue
+    if too many are in flight. Returns False if the stream was cancelled
+    while waiting.
+    """
+    message = JSON_DUMP(
+        messages.event_message(msg_id, {"states": states, "done": done})
+    )
+    while not in_flight.acquire(timeout=1):
+        if cancel.is_set():
+            return False
+
+    def _chunk_message() -> str:
+        """Release the chunk when the writer takes it off the queue."""
+        in_flight.release()
+        return message
+
+    hass.loop.call_soon_threadsafe(connection.send_message, _chunk_message)
+    return True
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -215,13 +306,20 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("stream", default=False): bool,
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    With stream the result is sent right away and the states follow in
+    event messages of at most about HISTORY_STREAM_CHUNK_SIZE states.
+    The last event has done set. The states of an entity are never
+    split over events and the include order is not applied.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -240,25 +338,51 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
-    if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
-        return
-
     entity_ids = msg.get("entity_ids")
     include_start_time_state = msg["include_start_time_state"]
 
-    if (
+    if start_time > dt_util.utcnow() or (
         not include_start_time_state
         and entity_ids
         and not _entities_may_have_state_changes_after(hass, entity_ids, start_time)
     ):
-        connection.send_result(msg["id"], {})
+        if not msg["stream"]:
+            connection.send_result(msg["id"], {})
+            return
+        connection.send_result(msg["id"])
+        connection.send_message(
+            messages.event_message(msg["id"], {"states": {}, "done": True})
+        )
         return
 
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
 
+    if msg["stream"]:
+        cancel = threading.Event()
+        connection.subscriptions[msg["id"]] = cancel.set
+        connection.send_result(msg["id"])
+        try:
+            await get_instance(hass).async_add_executor_job(
+                _ws_stream_significant_states,
+                hass,
+                connection,
+                msg["id"],
+                cancel,
+                start_time,
+                end_time,
+                entity_ids,
+                hass.data[HISTORY_FILTERS],
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        finally:
+            connection.subscriptions.pop(msg["id"], None)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
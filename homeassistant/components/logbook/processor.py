@@ -1,15 +1,19 @@
 """Event parser and human readable log generator."""
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable, Generator
+from concurrent.futures import Future
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 from typing import Any
 
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.query import Query
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import (
     process_datetime_to_timestamp,
@@ -58,6 +62,21 @@ from .models import EventAsRow, LazyEventPartialState, async_event_to_row
 from .queries import statement_for_request
 from .queries.common import PSUEDO_EVENT_STATE_CHANGED
 
+# The maximum number of windows a long request is split into
+# to run the queries in parallel on the database executor
+MAX_QUERY_WINDOWS = 4
+# The smallest time range we split into windows
+MIN_QUERY_WINDOW = timedelta(days=1)
+# The number of windows fetched ahead on the database executor, their rows
+# are held in memory until the windows before them have been processed
+MAX_WINDOWS_IN_FLIGHT = 1
+# The number of rows buffered when a window is streamed
+WINDOW_YIELD_PER = 1024
+
+# The bounds of the context lookup of a live stream
+MAX_LIVE_CONTEXTS = 4096
+MAX_LIVE_CONTEXT_AGE = timedelta(hours=1)
+
 
 @dataclass
 class LogbookRun:
@@ -121,10 +140,12 @@ class EventProcessor:
     def switch_to_live(self) -> None:
         """Switch to live stream.
 
-        Clear caches so we can reduce memory pressure.
+        Clear the event cache and bound the context lookup so we can
+        reduce memory pressure. The recent context origins are kept so
+        live events caused by them can still be augmented.
         """
         self.logbook_run.event_cache.clear()
-        self.logbook_run.context_lookup.clear()
+        self.logbook_run.context_lookup.bound(MAX_LIVE_CONTEXTS, MAX_LIVE_CONTEXT_AGE)
 
     def get_events(
         self,
@@ -132,6 +153,8 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        if not self.context_id and (windows := _query_windows(start_day, end_day)):
+            return self.humanify(self._yield_window_rows(windows))
 
         def yield_rows(query: Query) -> Generator[Row, None, None]:
             """Yield rows from the database."""
@@ -163,6 +186,72 @@ class EventProcessor:
         with session_scope(hass=self.hass) as session:
             return self.humanify(yield_rows(session.execute(stmt)))
 
+    def _window_statement(self, start_day: dt, end_day: dt) -> StatementLambdaElement:
+        """Return the statement for the rows of one window."""
+        return statement_for_request(
+            start_day,
+            end_day,
+            self.event_types,
+            self.entity_ids,
+            self.device_ids,
+            self.filters,
+        )
+
+    def _get_window_rows(self, start_day: dt, end_day: dt) -> list[Row]:
+        """Get the rows of one window."""
+        stmt = self._window_statement(start_day, end_day)
+        with session_scope(hass=self.hass) as session:
+            return session.execute(stmt).all()  # type: ignore[no-any-return]
+
+    def _stream_window_rows(
+        self, start_day: dt, end_day: dt
+    ) -> Generator[Row, None, None]:
+        """Stream the rows of one window."""
+        stmt = self._window_statement(start_day, end_day)
+        with session_scope(hass=self.hass) as session:
+            yield from session.execute(stmt).yield_per(WINDOW_YIELD_PER)
+
+    def _yield_window_rows(
+        self, windows: list[tuple[dt, dt]]
+    ) -> Generator[Row, None, None]:
+        """Yield the rows of the windows in order while they are fetched in parallel.
+
+        The window being processed is streamed in this thread while at most
+        MAX_WINDOWS_IN_FLIGHT of the following windows are fetched by the
+        executor. A window that has not been started by the executor when we
+        get to it is streamed here as well so we never wait on an executor
+        that is busy with our caller.
+        """
+        instance = get_instance(self.hass)
+        remaining = iter(windows)
+        in_flight: deque[tuple[tuple[dt, dt], Future[list[Row]]]] = deque()
+
+        def fetch_ahead() -> None:
+            """Fill the executor up to the windows in flight."""
+            while len(in_flight) < MAX_WINDOWS_IN_FLIGHT and (
+                window := next(remaining, None)
+            ):
+                in_flight.append(
+                    (window, instance.add_executor_job(self._get_window_rows, *window))
+                )
+
+        first_window = next(remaining)
+        try:
+            fetch_ahead()
+            yield from self._stream_window_rows(*first_window)
+            while in_flight:
+                window, future = in_flight.popleft()
+                if future.cancel():
+                    fetch_ahead()
+                    yield from self._stream_window_rows(*window)
+                    continue
+                rows = future.result()
+                fetch_ahead()
+                yield from rows
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
     def humanify(
         self, row_generator: Generator[Row | EventAsRow, None, None]
     ) -> list[dict[str, str]]:
@@ -177,6 +266,24 @@ class EventProcessor:
         )
 
 
+def _query_windows(start_day: dt, end_day: dt) -> list[tuple[dt, dt]] | None:
+    """Split a long time range into windows.
+
+    The queries exclude both ends of the range so every window but the
+    first starts a microsecond before the end of the previous window.
+    """
+    if (
+        num_windows := min(MAX_QUERY_WINDOWS, (end_day - start_day) // MIN_QUERY_WINDOW)
+    ) < 2:
+        return None
+    window = (end_day - start_day) / num_windows
+    boundaries = [start_day + window * idx for idx in range(1, num_windows)]
+    starts = [start_day] + [
+        boundary - timedelta(microseconds=1) for boundary in boundaries
+    ]
+    return list(zip(starts, boundaries + [end_day]))
+
+
 def _humanify(
     rows: Generator[Row | EventAsRow, None, None],
     ent_reg: er.EntityRegistry,
@@ -255,28 +362,66 @@ def _humanify(
 
 
 class ContextLookup:
-    """A lookup class for context origins."""
+    """A lookup class for context origins.
+
+    The origins are memorized in the order of the rows, which is the
+    order they happened in. Once the lookup is bounded the oldest origins
+    are evicted when there are too many or they are too old.
+    """
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Memorize context origin."""
         self.hass = hass
-        self._memorize_new = True
-        self._lookup: dict[str | None, Row | EventAsRow | None] = {None: None}
-
-    def memorize(self, row: Row) -> str | None:
-        """Memorize a context from the database."""
-        if self._memorize_new:
-            context_id: str = row.context_id
-            self._lookup.setdefault(context_id, row)
+        self._lookup: dict[str, Row | EventAsRow] = {}
+        self._max_size: int | None = None
+        self._max_age: float | None = None
+
+    def memorize(self, row: Row | EventAsRow) -> str | None:
+        """Memorize a context from the database or a live event."""
+        context_id: str | None = row.context_id
+        if context_id is None or context_id in self._lookup:
             return context_id
-        return None
+        # A live event carries the event that created its context
+        # which is a better origin than the first event we see
+        if (
+            isinstance(row, EventAsRow)
+            and (origin_event := row.context.origin_event) is not None
+            and (origin_row := async_event_to_row(origin_event)) is not None
+        ):
+            row = origin_row
+        self._lookup[context_id] = row
+        if self._max_size is not None:
+            self._evict(_row_time_fired_timestamp(row))
+        return context_id
+
+    def bound(self, max_size: int, max_age: timedelta) -> None:
+        """Bound the number and age of the memorized context origins."""
+        self._max_size = max_size
+        self._max_age = max_age.total_seconds()
+        if self._lookup:
+            newest_row = self._lookup[next(reversed(self._lookup))]
+            self._evict(_row_time_fired_timestamp(newest_row))
+
+    def _evict(self, newest_timestamp: float) -> None:
+        """Evict the oldest context origins that exceed the bounds."""
+        assert self._max_size is not None and self._max_age is not None
+        lookup = self._lookup
+        oldest_timestamp = newest_timestamp - self._max_age
+        while lookup:
+            oldest_context_id = next(iter(lookup))
+            if (
+                len(lookup) <= self._max_size
+                and _row_time_fired_timestamp(lookup[oldest_context_id])
+                >= oldest_timestamp
+            ):
+                return
+            del lookup[oldest_context_id]
 
     def clear(self) -> None:
-        """Clear the context origins and stop recording new ones."""
+        """Clear the context origins."""
         self._lookup.clear()
-        self._memorize_new = False
 
-    def get(self, context_id: str) -> Row | None:
+    def get(self, context_id: str) -> Row | EventAsRow | None:
         """Get the context origin."""
         return self._lookup.get(context_id)
 
@@ -2,15 +2,15 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
-from functools import lru_cache, partial, wraps
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+import datetime as dt
+from functools import partial, wraps
 import inspect
-from itertools import groupby
 import logging
-from operator import attrgetter
 import ssl
 import time
-from typing import TYPE_CHECKING, Any, Union, cast
+from typing import TYPE_CHECKING, Union, cast
 import uuid
 
 import attr
@@ -69,6 +69,12 @@ _LOGGER = logging.getLogger(__name__)
 
 DISCOVERY_COOLDOWN = 2
 TIMEOUT_ACK = 10
+# Subscriptions and unsubscriptions are collected for this many seconds and
+# sent to the broker in as few SUBSCRIBE/UNSUBSCRIBE packets as possible
+SUBSCRIBE_COOLDOWN = 0.1
+MAX_TOPICS_PER_PACKET = 500
+# Maximum number of received messages handled in one event loop iteration
+MAX_MESSAGES_PER_BATCH = 1000
 
 SubscribePayloadType = Union[str, bytes]  # Only bytes if encoding is None
 
@@ -235,12 +241,88 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+class _TopicTrieNode:
+    """Node of the subscription trie, one per topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Match topics against subscriptions with `+` and `#` wildcards.
+
+    Subscriptions are stored by topic level, so matching a topic only visits
+    the nodes along its levels and the wildcard branches next to them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+
+    def is_subscribed(self, topic: str) -> bool:
+        """Return if there are subscriptions on exactly this topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription and prune the nodes left empty."""
+        node = self._root
+        path: list[tuple[_TopicTrieNode, str]] = []
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards at the first level don't match topics starting with $
+        normal = not topic.startswith("$")
+        matches: list[Subscription] = []
+        pending = [(self._root, 0)]
+        while pending:
+            node, idx = pending.pop()
+            children = node.children
+            if (wildcard := children.get("#")) is not None and (normal or idx):
+                matches.extend(wildcard.subscriptions)
+            if idx == depth:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get("+")) is not None and (normal or idx):
+                pending.append((child, idx + 1))
+            if (child := children.get(levels[idx])) is not None:
+                pending.append((child, idx + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -311,11 +393,18 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscription_trie = SubscriptionTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
         self._mqttc: mqtt.Client = None
         self._paho_lock = asyncio.Lock()
+        self._pending_subscriptions: dict[str, int] = {}
+        self._pending_unsubscribes: set[str] = set()
+        self._subscribe_timer: asyncio.TimerHandle | None = None
+        self._pending_flush: asyncio.Future[None] | None = None
+        self._pending_messages: deque[mqtt.MQTTMessage] = deque()
+        self._messages_scheduled = False
 
         self._pending_operations: dict[str, asyncio.Event] = {}
 
@@ -399,6 +488,9 @@ class MQTT:
 
     async def async_disconnect(self):
         """Stop the MQTT client."""
+        if self._subscribe_timer is not None:
+            self._subscribe_timer.cancel()
+            self._subscribe_timer = None
 
         def stop():
             """Stop the MQTT client."""
@@ -416,21 +508,23 @@ class MQTT:
     ) -> Callable[[], None]:
         """Set up a subscription to a topic with the provided qos.
 
+        When connected, returns once the broker acknowledged the batch the
+        subscription was sent in.
+
         This method is a coroutine.
         """
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscription_trie.add(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
             self._last_subscribe = time.time()
-            await self._async_perform_subscription(topic, qos)
+            # Shield the flush shared with other subscribers from cancellation
+            await asyncio.shield(self._async_queue_subscriptions(((topic, qos),)))
 
         @callback
         def async_remove() -> None:
@@ -438,42 +532,116 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscription_trie.remove(subscription)
 
-            # Only unsubscribe if currently connected.
-            if self.connected:
-                self.hass.async_create_task(self._async_unsubscribe(topic))
+            # Only unsubscribe if currently connected and there are no
+            # other subscriptions on the topic remaining.
+            if self.connected and not self._subscription_trie.is_subscribed(topic):
+                self._pending_subscriptions.pop(topic, None)
+                self._pending_unsubscribes.add(topic)
+                self._async_schedule_pending()
 
         return async_remove
 
-    async def _async_unsubscribe(self, topic: str) -> None:
-        """Unsubscribe from a topic.
+    @callback
+    def _async_queue_subscriptions(
+        self, subscriptions: Iterable[tuple[str, int]]
+    ) -> asyncio.Future[None]:
+        """Queue topics to subscribe to with the highest requested qos.
 
-        This method is a coroutine.
+        Returns a future which is done when the queued topics were sent.
         """
-        if any(other.topic == topic for other in self.subscriptions):
-            # Other subscriptions on topic remaining - don't unsubscribe.
-            return
+        pending = self._pending_subscriptions
+        for topic, qos in subscriptions:
+            if topic not in pending or pending[topic] < qos:
+                pending[topic] = qos
+            self._pending_unsubscribes.discard(topic)
+        return self._async_schedule_pending()
 
-        async with self._paho_lock:
-            result: int | None = None
-            result, mid = await self.hass.async_add_executor_job(
-                self._mqttc.unsubscribe, topic
-            )
-            _LOGGER.debug("Unsubscribing from %s, mid: %s", topic, mid)
-            _raise_on_error(result)
-        await self._wait_for_mid(mid)
+    @callback
+    def _async_schedule_pending(self) -> asyncio.Future[None]:
+        """Schedule sending the pending (un)subscriptions to the broker.
 
-    async def _async_perform_subscription(self, topic: str, qos: int) -> None:
-        """Perform a paho-mqtt subscription."""
-        async with self._paho_lock:
-            result: int | None = None
-            result, mid = await self.hass.async_add_executor_job(
-                self._mqttc.subscribe, topic, qos
+        Returns a future which is done when they were sent.
+        """
+        if self._pending_flush is None:
+            self._pending_flush = self.hass.loop.create_future()
+            self._subscribe_timer = self.hass.loop.call_later(
+                SUBSCRIBE_COOLDOWN, self._async_flush_pending
             )
-            _LOGGER.debug("Subscribing to %s, mid: %s", topic, mid)
-            _raise_on_error(result)
-        await self._wait_for_mid(mid)
+        return self._pending_flush
+
+    @callback
+    def _async_flush_pending(self) -> None:
+        """Send the (un)subscriptions collected during the cooldown."""
+        assert self._pending_flush is not None
+        flush = self._pending_flush
+        self._subscribe_timer = self._pending_flush = None
+        topics = list(self._pending_unsubscribes)
+        self._pending_unsubscribes.clear()
+        subscriptions = list(self._pending_subscriptions.items())
+        self._pending_subscriptions.clear()
+        self.hass.async_create_task(
+            self._async_perform_pending(topics, subscriptions, flush)
+        )
+
+    async def _async_perform_pending(
+        self,
+        topics: list[str],
+        subscriptions: list[tuple[str, int]],
+        flush: asyncio.Future[None],
+    ) -> None:
+        """Send the pending (un)subscriptions and mark the flush done."""
+        try:
+            if topics:
+                await self._async_perform_unsubscribes(topics)
+            if subscriptions:
+                await self._async_perform_subscriptions(subscriptions)
+        finally:
+            flush.set_result(None)
+
+    async def _async_perform_unsubscribes(self, topics: list[str]) -> None:
+        """Unsubscribe from topics.
+
+        This method is a coroutine.
+        """
+        for idx in range(0, len(topics), MAX_TOPICS_PER_PACKET):
+            chunk = topics[idx : idx + MAX_TOPICS_PER_PACKET]
+            try:
+                async with self._paho_lock:
+                    result: int | None = None
+                    result, mid = await self.hass.async_add_executor_job(
+                        self._mqttc.unsubscribe, chunk
+                    )
+                    _LOGGER.debug("Unsubscribing from %s, mid: %s", chunk, mid)
+                    _raise_on_error(result)
+            except HomeAssistantError as err:
+                # Keep sending the other chunks
+                _LOGGER.error("Unable to unsubscribe from %s: %s", chunk, err)
+                continue
+            await self._wait_for_mid(mid)
+
+    async def _async_perform_subscriptions(
+        self, subscriptions: list[tuple[str, int]]
+    ) -> None:
+        """Perform paho-mqtt subscriptions."""
+        for idx in range(0, len(subscriptions), MAX_TOPICS_PER_PACKET):
+            chunk = subscriptions[idx : idx + MAX_TOPICS_PER_PACKET]
+            try:
+                async with self._paho_lock:
+                    result: int | None = None
+                    result, mid = await self.hass.async_add_executor_job(
+                        self._mqttc.subscribe, chunk
+                    )
+                    _LOGGER.debug("Subscribing to %s, mid: %s", chunk, mid)
+                    _raise_on_error(result)
+            except HomeAssistantError as err:
+                # Keep sending the other chunks
+                _LOGGER.error(
+                    "Unable to subscribe to %s: %s", [topic for topic, _ in chunk], err
+                )
+                continue
+            await self._wait_for_mid(mid)
 
     def _mqtt_on_connect(self, _mqttc, _userdata, _flags, result_code: int) -> None:
         """On connect callback.
@@ -500,12 +668,14 @@ class MQTT:
             result_code,
         )
 
-        # Group subscriptions to only re-subscribe once for each topic.
-        keyfunc = attrgetter("topic")
-        for topic, subs in groupby(sorted(self.subscriptions, key=keyfunc), keyfunc):
-            # Re-subscribe with the highest requested qos
-            max_qos = max(subscription.qos for subscription in subs)
-            self.hass.add_job(self._async_perform_subscription, topic, max_qos)
+        # Re-subscribe to all topics, duplicates are merged by the highest qos
+        self.hass.loop.call_soon_threadsafe(
+            self._async_queue_subscriptions,
+            [
+                (subscription.topic, subscription.qos)
+                for subscription in self.subscriptions
+            ],
+        )
 
         if (
             CONF_BIRTH_MESSAGE in self.conf
@@ -528,35 +698,51 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are buffered and handed to the event loop in batches, the loop
+        is only woken up when the buffer was drained already.
+        """
+        self._pending_messages.append(msg)
+        if not self._messages_scheduled:
+            self._messages_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_handle_pending_messages)
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+    @callback
+    def _async_handle_pending_messages(self) -> None:
+        """Handle the messages received since the last batch."""
+        # Reset before draining, messages appended from now on schedule a new batch
+        self._messages_scheduled = False
+        pending = self._pending_messages
+        timestamp = dt_util.utcnow()
+        for _ in range(min(len(pending), MAX_MESSAGES_PER_BATCH)):
+            self._mqtt_handle_message(pending.popleft(), timestamp)
+        if pending and not self._messages_scheduled:
+            # Give other jobs a chance to run during a flood of messages
+            self._messages_scheduled = True
+            self.hass.loop.call_soon(self._async_handle_pending_messages)
 
     @callback
-    def _mqtt_handle_message(self, msg) -> None:
+    def _mqtt_handle_message(self, msg, timestamp: dt.datetime | None = None) -> None:
         _LOGGER.debug(
             "Received message on %s%s: %s",
             msg.topic,
             " (retained)" if msg.retain else "",
             msg.payload[0:8192],
         )
-        timestamp = dt_util.utcnow()
+        if timestamp is None:
+            timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscription_trie.matches(msg.topic)
+        # Payloads are decoded once per encoding and shared by the subscriptions
+        decoded: dict[str | None, SubscribePayloadType] = {None: msg.payload}
 
         for subscription in subscriptions:
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+            encoding = subscription.encoding
+            if encoding is not None and encoding not in decoded:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    decoded[encoding] = msg.payload.decode(encoding)
                 except (AttributeError, UnicodeDecodeError):
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
@@ -571,7 +757,7 @@ class MQTT:
                 subscription.job,
                 ReceiveMessage(
                     msg.topic,
-                    payload,
+                    decoded[encoding],
                     msg.qos,
                     msg.retain,
                     subscription.topic,
@@ -647,13 +833,3 @@ def _raise_on_error(result_code: int | None) -> None:
         raise HomeAssistantError(
             f"Error talking to MQTT: {mqtt.error_string(result_code)}"
         )
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
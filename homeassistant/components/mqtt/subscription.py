@@ -1,6 +1,7 @@
 """Helper to handle a set of topics to subscribe to."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Coroutine
 from typing import Any
 
@@ -122,8 +123,8 @@ async def async_subscribe_topics(
     """(Re)Subscribe to a set of MQTT topics."""
     if sub_state is None:
         return
-    for sub in sub_state.values():
-        await sub.subscribe()
+    # Subscribe concurrently so the topics are sent to the broker together
+    await asyncio.gather(*(sub.subscribe() for sub in sub_state.values()))
 
 
 def async_unsubscribe_topics(
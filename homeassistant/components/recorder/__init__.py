@@ -41,6 +41,17 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
+# The number of seconds a purge may block the recorder queue before it
+# yields to the events that were queued meanwhile
+DEFAULT_PURGE_TIME_BUDGET = 1.0
+# The number of attribute and event data ids to cache in memory
+#
+# Based on:
+# - The number of overlapping attributes
+# - How frequently states with overlapping attributes will change
+# - How much memory our low end hardware has
+DEFAULT_STATE_ATTRIBUTES_CACHE_SIZE = 2048
+DEFAULT_EVENT_DATA_CACHE_SIZE = 2048
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
@@ -49,8 +60,12 @@ CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PURGE_TIME_BUDGET = "purge_time_budget"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_WRITE = "bulk_write"
+CONF_STATE_ATTRIBUTES_CACHE_SIZE = "state_attributes_cache_size"
+CONF_EVENT_DATA_CACHE_SIZE = "event_data_cache_size"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -87,10 +102,22 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
+                    vol.Optional(
+                        CONF_PURGE_TIME_BUDGET, default=DEFAULT_PURGE_TIME_BUDGET
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_BULK_WRITE, default=False): cv.boolean,
+                    vol.Optional(
+                        CONF_STATE_ATTRIBUTES_CACHE_SIZE,
+                        default=DEFAULT_STATE_ATTRIBUTES_CACHE_SIZE,
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_EVENT_DATA_CACHE_SIZE,
+                        default=DEFAULT_EVENT_DATA_CACHE_SIZE,
+                    ): cv.positive_int,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -137,6 +164,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_write = conf[CONF_BULK_WRITE]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -154,7 +182,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         auto_purge=auto_purge,
         auto_repack=auto_repack,
         keep_days=keep_days,
+        purge_time_budget=conf[CONF_PURGE_TIME_BUDGET],
         commit_interval=commit_interval,
+        bulk_write=bulk_write,
+        state_attributes_cache_size=conf[CONF_STATE_ATTRIBUTES_CACHE_SIZE],
+        event_data_cache_size=conf[CONF_EVENT_DATA_CACHE_SIZE],
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
@@ -178,4 +210,6 @@ async def _process_recorder_platform(
 ) -> None:
     """Process a recorder platform."""
     instance: Recorder = hass.data[DATA_INSTANCE]
+    if hasattr(platform, "async_setup_statistics"):
+        platform.async_setup_statistics(hass)
     instance.queue_task(AddRecorderPlatformTask(domain, platform))
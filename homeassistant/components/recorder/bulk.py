@@ -0,0 +1,287 @@
+"""Bulk writes of events and states for the recorder."""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Column, bindparam, func, insert, select, update
+from sqlalchemy.orm.session import Session
+
+from homeassistant.core import Event, State
+
+from .models import EVENT_ORIGIN_TO_IDX, EventData, Events, StateAttributes, States
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+# pylint: disable=protected-access
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BulkWriter:
+    """Buffer events and states and insert them with executemany.
+
+    The ORM creates, tracks and flushes an object for every row which
+    dominates the cost of a commit on busy systems. The bulk writer
+    keeps plain rows instead and inserts each table with a single
+    executemany statement when the event session is committed.
+    """
+
+    def __init__(self, recorder: Recorder) -> None:
+        """Initialize the bulk writer."""
+        self.recorder = recorder
+        # entity_id -> state_id of the last committed state of the entity
+        self.old_state_ids: dict[str, int] = {}
+        self._events: list[tuple[dict[str, Any], str | None]] = []
+        self._states: list[tuple[dict[str, Any], str | None, int | None]] = []
+        # shared_attrs / shared_data -> hash of the rows to insert
+        self._pending_state_attributes: dict[str, int] = {}
+        self._pending_event_data: dict[str, int] = {}
+        # entity_id -> index in _states of the pending state of the entity
+        self._pending_old_states: dict[str, int] = {}
+        self._written_attributes_ids: dict[str, int] = {}
+        self._written_data_ids: dict[str, int] = {}
+        self._written_state_ids: list[int] = []
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """Return if there are rows waiting to be written."""
+        return bool(self._events or self._states)
+
+    def add_event(self, event: Event) -> None:
+        """Buffer any event except state changed."""
+        row: dict[str, Any] = {
+            "event_type": event.event_type,
+            "event_data": None,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "time_fired": event.time_fired,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+            "data_id": None,
+        }
+        if not event.data:
+            self._events.append((row, None))
+            return
+
+        try:
+            shared_data = EventData.shared_data_from_event(event)
+        except (TypeError, ValueError) as ex:
+            _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+            return
+
+        recorder = self.recorder
+        # Matching data found in the pending commit
+        if shared_data in self._pending_event_data:
+            self._events.append((row, shared_data))
+        # Matching data id found in the cache
+        elif data_id := recorder._event_data_ids.get(shared_data):
+            row["data_id"] = data_id
+            self._events.append((row, None))
+        else:
+            data_hash = EventData.hash_shared_data(shared_data)
+            # Matching data found in the database
+            if data_id := recorder._find_shared_data_in_db(data_hash, shared_data):
+                recorder._event_data_ids[shared_data] = row["data_id"] = data_id
+                self._events.append((row, None))
+            # No matching data found, save it in the DB
+            else:
+                self._pending_event_data[shared_data] = data_hash
+                self._events.append((row, shared_data))
+
+    def add_state_changed_event(self, event: Event) -> None:
+        """Buffer a state_changed event."""
+        recorder = self.recorder
+        try:
+            shared_attrs = StateAttributes.shared_attrs_from_event(
+                event, recorder._exclude_attributes_by_domain
+            )
+        except (TypeError, ValueError) as ex:
+            _LOGGER.warning(
+                "State is not JSON serializable: %s: %s",
+                event.data.get("new_state"),
+                ex,
+            )
+            return
+
+        entity_id: str = event.data["entity_id"]
+        state: State | None = event.data.get("new_state")
+        row: dict[str, Any] = {
+            "entity_id": entity_id,
+            "state": None,
+            "attributes": None,
+            "last_changed": None,
+            "last_updated": event.time_fired,
+            "old_state_id": None,
+            "attributes_id": None,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+        }
+        # None state means the state was removed from the state machine
+        if state is not None:
+            row["state"] = state.state
+            row["last_updated"] = state.last_updated
+            if state.last_updated != state.last_changed:
+                row["last_changed"] = state.last_changed
+
+        pending_shared_attrs: str | None = None
+        # Matching attributes found in the pending commit
+        if shared_attrs in self._pending_state_attributes:
+            pending_shared_attrs = shared_attrs
+        # Matching attributes id found in the cache
+        elif attributes_id := recorder._state_attributes_ids.get(shared_attrs):
+            row["attributes_id"] = attributes_id
+        else:
+            attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+            # Matching attributes found in the database
+            if attributes_id := recorder._find_shared_attr_in_db(
+                attr_hash, shared_attrs
+            ):
+                recorder._state_attributes_ids[shared_attrs] = attributes_id
+                row["attributes_id"] = attributes_id
+            # No matching attributes found, save them in the DB
+            else:
+                self._pending_state_attributes[shared_attrs] = attr_hash
+                pending_shared_attrs = shared_attrs
+
+        # The old state is either in this batch and gets linked once its
+        # state_id is known, or it has already been committed.
+        old_state_idx = self._pending_old_states.pop(entity_id, None)
+        if old_state_idx is None:
+            row["old_state_id"] = self.old_state_ids.pop(entity_id, None)
+        if state is not None:
+            self._pending_old_states[entity_id] = len(self._states)
+        self._states.append((row, pending_shared_attrs, old_state_idx))
+
+    def write_rows(self, session: Session) -> None:
+        """Insert the buffered rows in the transaction of the session.
+
+        The rows are kept until rows_committed is called so the
+        write can be retried if the commit fails.
+        """
+        self._written_attributes_ids = attributes_ids = _insert_shared_rows(
+            session,
+            StateAttributes.__table__.c.attributes_id,
+            StateAttributes.__table__.c.shared_attrs,
+            self._pending_state_attributes,
+        )
+        self._written_data_ids = data_ids = _insert_shared_rows(
+            session,
+            EventData.__table__.c.data_id,
+            EventData.__table__.c.shared_data,
+            self._pending_event_data,
+        )
+
+        if self._events:
+            event_rows = []
+            for row, shared_data in self._events:
+                if shared_data is not None:
+                    row["data_id"] = data_ids[shared_data]
+                event_rows.append(row)
+            session.execute(insert(Events.__table__), event_rows)
+
+        if not self._states:
+            self._written_state_ids = []
+            return
+
+        state_rows = []
+        for row, shared_attrs, _ in self._states:
+            if shared_attrs is not None:
+                row["attributes_id"] = attributes_ids[shared_attrs]
+            state_rows.append(row)
+        max_state_id = session.execute(select(func.max(States.state_id))).scalar()
+        session.execute(insert(States.__table__), state_rows)
+
+        # The recorder thread is the only writer so every state_id above
+        # the previous maximum belongs to this batch. The ids of an
+        # entity are assigned in insertion order.
+        entity_state_ids: dict[str, list[int]] = {}
+        for state_id, entity_id in session.execute(
+            select(States.state_id, States.entity_id)
+            .where(States.state_id > (max_state_id or 0))
+            .order_by(States.state_id)
+        ):
+            entity_state_ids.setdefault(entity_id, []).append(state_id)
+        entity_state_ids_iter = {
+            entity_id: iter(state_ids)
+            for entity_id, state_ids in entity_state_ids.items()
+        }
+        self._written_state_ids = state_ids = [
+            next(entity_state_ids_iter[row["entity_id"]]) for row in state_rows
+        ]
+
+        if old_state_links := [
+            {"b_state_id": state_ids[idx], "b_old_state_id": state_ids[old_state_idx]}
+            for idx, (_, _, old_state_idx) in enumerate(self._states)
+            if old_state_idx is not None
+        ]:
+            session.execute(
+                update(States.__table__)
+                .where(States.state_id == bindparam("b_state_id"))
+                .values(old_state_id=bindparam("b_old_state_id")),
+                old_state_links,
+            )
+
+    def rows_committed(self) -> None:
+        """Clear the buffers after the rows have been committed."""
+        recorder = self.recorder
+        # We just committed the state attributes and event data to the
+        # database and we now know their ids. We can save many selects
+        # for matching attributes by loading them into the LRU cache now.
+        for shared_attrs, attributes_id in self._written_attributes_ids.items():
+            recorder._state_attributes_ids[shared_attrs] = attributes_id
+        for shared_data, data_id in self._written_data_ids.items():
+            recorder._event_data_ids[shared_data] = data_id
+        for entity_id, idx in self._pending_old_states.items():
+            self.old_state_ids[entity_id] = self._written_state_ids[idx]
+        self._clear_pending()
+
+    def evict_purged_states(self, purged_state_ids: set[int]) -> None:
+        """Evict purged states from the old state ids."""
+        old_state_reversed = {
+            state_id: entity_id for entity_id, state_id in self.old_state_ids.items()
+        }
+        for purged_state_id in purged_state_ids.intersection(old_state_reversed):
+            self.old_state_ids.pop(old_state_reversed[purged_state_id], None)
+
+    def reset(self) -> None:
+        """Drop all buffered rows and the old state ids."""
+        self.old_state_ids = {}
+        self._clear_pending()
+
+    def _clear_pending(self) -> None:
+        """Drop all buffered rows."""
+        self._events = []
+        self._states = []
+        self._pending_state_attributes = {}
+        self._pending_event_data = {}
+        self._pending_old_states = {}
+        self._written_attributes_ids = {}
+        self._written_data_ids = {}
+        self._written_state_ids = []
+
+
+def _insert_shared_rows(
+    session: Session, id_column: Column, shared_column: Column, pending: dict[str, int]
+) -> dict[str, int]:
+    """Insert shared attributes or event data and return their ids."""
+    if not pending:
+        return {}
+    max_id = session.execute(select(func.max(id_column))).scalar()
+    session.execute(
+        insert(id_column.table),
+        [
+            {shared_column.key: shared, "hash": shared_hash}
+            for shared, shared_hash in pending.items()
+        ],
+    )
+    return {
+        shared: row_id
+        for row_id, shared in session.execute(
+            select(id_column, shared_column).where(id_column > (max_id or 0))
+        )
+        if shared in pending
+    }
@@ -1,12 +1,10 @@
 """Recorder constants."""
 
-from functools import partial
-import json
 from typing import Final
 
 from homeassistant.backports.enum import StrEnum
 from homeassistant.const import ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 
 DATA_INSTANCE = "recorder_instance"
 SQLITE_URL_PREFIX = "sqlite://"
@@ -25,9 +23,30 @@ MAX_QUEUE_BACKLOG = 40000
 # have upgraded their sqlite version
 MAX_ROWS_TO_PURGE = 998
 
+# The number of attributes ids looked up per query when the state
+# attributes cache is pre-warmed at startup
+PREWARM_ATTRIBUTES_CHUNK_SIZE = 998
+
+# The maximum number of bound parameters in one statement
+#
+# The limit of SQLite is read from the connection when possible,
+# these are the compiled-in defaults before and after 3.32.0
+SQLITE_MAX_BIND_VARS = 998
+SQLITE_MODERN_MAX_BIND_VARS = 32766
+# The limits of a prepared statement of MySQL and PostgreSQL
+MYSQL_MAX_BIND_VARS = 65535
+POSTGRESQL_MAX_BIND_VARS = 32767
+
+# The state ids of a purge slice are bound in one statement together with
+# the boundary of the slice, this many bound parameters are kept free
+PURGE_BIND_VARS_HEADROOM = 16
+# The most rows purged in one slice of a database server, fewer round trips
+# pay off there while a slice of SQLite costs the same per row at any size
+SERVER_MAX_ROWS_TO_PURGE = 4000
+
 DB_WORKER_PREFIX = "DbWorker"
 
-JSON_DUMP: Final = partial(json.dumps, cls=JSONEncoder, separators=(",", ":"))
+JSON_DUMP: Final = json_dumps
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
+import concurrent.futures
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
@@ -14,7 +15,6 @@ import time
 from typing import Any, TypeVar, cast
 
 from awesomeversion import AwesomeVersion
-from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
@@ -40,15 +40,19 @@ from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 
 from . import migration, statistics
+from .bulk import BulkWriter
 from .const import (
     DB_WORKER_PREFIX,
     KEEPALIVE_TIME,
     MAX_QUEUE_BACKLOG,
     MYSQLDB_URL_PREFIX,
+    PREWARM_ATTRIBUTES_CHUNK_SIZE,
+    SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .id_cache import SharedIdCache
 from .models import (
     SCHEMA_VERSION,
     Base,
@@ -63,12 +67,19 @@ from .models import (
     process_timestamp,
 )
 from .pool import POOL_SIZE, MutexPool, RecorderPool
-from .queries import find_shared_attributes_id, find_shared_data_id
+from .purge import PurgeProgress
+from .queries import (
+    find_recent_states_attributes_ids,
+    find_shared_attributes,
+    find_shared_attributes_id,
+    find_shared_data_id,
+)
 from .run_history import RunHistory
 from .tasks import (
     AdjustStatisticsTask,
     ClearStatisticsTask,
     CommitTask,
+    CompilePeriodStatisticsTask,
     DatabaseLockTask,
     EventTask,
     ExternalStatisticsTask,
@@ -84,6 +95,7 @@ from .tasks import (
 )
 from .util import (
     build_mysqldb_conv,
+    chunked,
     dburl_to_path,
     end_incomplete_runs,
     is_second_sunday,
@@ -104,15 +116,6 @@ DEFAULT_URL = "sqlite:///{hass_config_path}"
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
-# The number of attribute ids to cache in memory
-#
-# Based on:
-# - The number of overlapping attributes
-# - How frequently states with overlapping attributes will change
-# - How much memory our low end hardware has
-STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
-EVENT_DATA_ID_CACHE_SIZE = 2048
-
 SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
@@ -141,7 +144,11 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         auto_repack: bool,
         keep_days: int,
+        purge_time_budget: float,
         commit_interval: int,
+        bulk_write: bool,
+        state_attributes_cache_size: int,
+        event_data_cache_size: int,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
@@ -156,6 +163,10 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_time_budget = purge_time_budget
+        self.purge_progress = PurgeProgress()
+        # Updated from the limits of the database when the first connection is made
+        self.max_bind_vars = SQLITE_MAX_BIND_VARS
         self._hass_started: asyncio.Future[object] = asyncio.Future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
@@ -173,14 +184,18 @@ class Recorder(threading.Thread):
         self.exclude_t = exclude_t
 
         self.schema_version = 0
+        # The time zone the daily and monthly statistics are compiled in
+        self.period_statistics_time_zone: str | None = None
+        self._period_statistics_compiling: str | None = None
         self._commits_without_expire = 0
         self._old_states: dict[str, States] = {}
-        self._state_attributes_ids: LRU = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
-        self._event_data_ids: LRU = LRU(EVENT_DATA_ID_CACHE_SIZE)
+        self._state_attributes_ids = SharedIdCache(state_attributes_cache_size)
+        self._event_data_ids = SharedIdCache(event_data_cache_size)
         self._pending_state_attributes: dict[str, StateAttributes] = {}
         self._pending_event_data: dict[str, EventData] = {}
         self._pending_expunge: list[States] = []
         self.event_session: Session | None = None
+        self._bulk_writer = BulkWriter(self) if bulk_write else None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
@@ -284,6 +299,13 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    def add_executor_job(
+        self, target: Callable[..., T], *args: Any
+    ) -> concurrent.futures.Future[T]:
+        """Add an executor job from any thread."""
+        assert self._db_executor is not None
+        return self._db_executor.submit(target, *args)
+
     def _stop_executor(self) -> None:
         """Stop the executor."""
         assert self._db_executor is not None
@@ -699,7 +721,12 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event) -> None:
         if not self.enabled:
             return
-        if event.event_type == EVENT_STATE_CHANGED:
+        if self._bulk_writer:
+            if event.event_type == EVENT_STATE_CHANGED:
+                self._bulk_writer.add_state_changed_event(event)
+            else:
+                self._bulk_writer.add_event(event)
+        elif event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
@@ -840,7 +867,12 @@ class Recorder(threading.Thread):
 
     def _event_session_has_pending_writes(self) -> bool:
         return bool(
-            self.event_session and (self.event_session.new or self.event_session.dirty)
+            self.event_session
+            and (
+                self.event_session.new
+                or self.event_session.dirty
+                or (self._bulk_writer and self._bulk_writer.has_pending_writes)
+            )
         )
 
     def _commit_event_session_or_retry(self) -> None:
@@ -869,7 +901,18 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         self._commits_without_expire += 1
 
-        self.event_session.commit()
+        if self._bulk_writer:
+            try:
+                self._bulk_writer.write_rows(self.event_session)
+                self.event_session.commit()
+            except SQLAlchemyError:
+                # Start the next attempt with a new transaction
+                with contextlib.suppress(SQLAlchemyError):
+                    self.event_session.rollback()
+                raise
+            self._bulk_writer.rows_committed()
+        else:
+            self.event_session.commit()
         if self._pending_expunge:
             for dbstate in self._pending_expunge:
                 # Expunge the state so its not expired
@@ -910,8 +953,10 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self._old_states = {}
-        self._state_attributes_ids = {}
-        self._event_data_ids = {}
+        if self._bulk_writer:
+            self._bulk_writer.reset()
+        self._state_attributes_ids.clear()
+        self._event_data_ids.clear()
         self._pending_state_attributes = {}
         self._pending_event_data = {}
 
@@ -1079,9 +1124,50 @@ class Recorder(threading.Thread):
             end_incomplete_runs(session, self.run_history.recording_start)
             self.run_history.start(session)
             self._schedule_compile_missing_statistics(session)
+            self.period_statistics_time_zone = (
+                statistics.get_period_statistics_time_zone(session)
+            )
+        self.schedule_compile_period_statistics()
 
+        self._pre_warm_state_attributes_cache()
         self._open_event_session()
 
+    def _pre_warm_state_attributes_cache(self) -> None:
+        """Load the attributes of the most recently recorded states into the cache.
+
+        Without this every state change after a restart needs a query
+        to find its attributes until the cache has filled up.
+        """
+        state_attributes_ids = self._state_attributes_ids
+        with session_scope(
+            session=self.get_session(),
+            exception_filter=lambda err: isinstance(err, SQLAlchemyError),
+        ) as session:
+            attributes_ids = [
+                attributes_id
+                for (attributes_id,) in session.execute(
+                    find_recent_states_attributes_ids(state_attributes_ids.size)
+                )
+            ]
+            shared_attrs_by_id: dict[int, str] = {}
+            for attributes_ids_chunk in chunked(
+                attributes_ids, PREWARM_ATTRIBUTES_CHUNK_SIZE
+            ):
+                for attributes_id, shared_attrs in session.execute(
+                    find_shared_attributes(attributes_ids_chunk)
+                ):
+                    shared_attrs_by_id[attributes_id] = shared_attrs
+            # Load the least recently used attributes first
+            state_attributes_ids.load(
+                (shared_attrs_by_id[attributes_id], attributes_id)
+                for attributes_id in reversed(attributes_ids)
+                if attributes_id in shared_attrs_by_id
+            )
+        _LOGGER.debug(
+            "Pre-warmed the state attributes cache with %s entries",
+            len(state_attributes_ids),
+        )
+
     def _schedule_compile_missing_statistics(self, session: Session) -> None:
         """Add tasks for missing statistics runs."""
         now = dt_util.utcnow()
@@ -1101,6 +1187,18 @@ class Recorder(threading.Thread):
             self.queue_task(StatisticsTask(start))
             start = end
 
+    def schedule_compile_period_statistics(self) -> None:
+        """Compile the daily and monthly statistics if the time zone changed."""
+        time_zone = str(dt_util.DEFAULT_TIME_ZONE)
+        if time_zone in (
+            self.period_statistics_time_zone,
+            self._period_statistics_compiling,
+        ):
+            return
+        _LOGGER.debug("Compiling daily and monthly statistics in %s", time_zone)
+        self._period_statistics_compiling = time_zone
+        self.queue_task(CompilePeriodStatisticsTask(time_zone, None))
+
     def _end_session(self) -> None:
         """End the recorder session."""
         if self.event_session is None:
@@ -18,10 +18,7 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Subquery
 
 from homeassistant.components import recorder
-from homeassistant.components.websocket_api.const import (
-    COMPRESSED_STATE_LAST_UPDATED,
-    COMPRESSED_STATE_STATE,
-)
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -305,6 +302,53 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant state changes of each entity.
+
+    Takes the same arguments as get_significant_states, but the rows
+    are fetched with yield_per when the period is longer than a day
+    and every entity is yielded as soon as its states are complete,
+    so only the states of one entity are held in memory.
+
+    The entities are yielded in the order of their entity_id, followed
+    by the entities that only have a state at start_time.
+    """
+    with session_scope(hass=hass) as session:
+        stmt = _significant_states_stmt(
+            _schema_version(hass),
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+            no_attributes,
+        )
+        states = execute_stmt_lambda_element(session, stmt, start_time, end_time)
+        yield from _sorted_states_to_entity_states(
+            hass,
+            session,
+            states,
+            start_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+        )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -639,6 +683,49 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    result: dict[str, list[State | dict[str, Any]]] = defaultdict(list)
+    # Set all entity IDs to empty lists in result set to maintain the order
+    if entity_ids is not None:
+        for ent_id in entity_ids:
+            result[ent_id] = []
+
+    for ent_id, ent_results in _sorted_states_to_entity_states(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    ):
+        result[ent_id] = ent_results
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_entity_states(
+    hass: HomeAssistant,
+    session: Session,
+    states: Iterable[Row],
+    start_time: datetime,
+    entity_ids: list[str] | None,
+    filters: Filters | None,
+    include_start_time_state: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into JSON friendly states of each entity.
+
+    Every entity is yielded once as soon as all its rows have been
+    processed so the rows can be consumed with yield_per.
+
+    States must be sorted by entity_id and last_updated
+    """
     if compressed_state_format:
         state_class = row_to_compressed_state
         _process_timestamp: Callable[
@@ -652,12 +739,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    result: dict[str, list[State | dict[str, Any]]] = defaultdict(list)
-    # Set all entity IDs to empty lists in result set to maintain the order
-    if entity_ids is not None:
-        for ent_id in entity_ids:
-            result[ent_id] = []
-
     # Get the states at the start time
     timer_start = time.perf_counter()
     initial_states: dict[str, Row] = {}
@@ -676,7 +757,9 @@ def _sorted_states_to_dict(
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
+        _LOGGER.debug(
+            "getting %d first datapoints took %fs", len(initial_states), elapsed
+        )
 
     if entity_ids and len(entity_ids) == 1:
         states_iter: Iterable[tuple[str | Column, Iterator[States]]] = (
@@ -689,13 +772,15 @@ def _sorted_states_to_dict(
     for ent_id, group in states_iter:
         attr_cache: dict[str, dict[str, Any]] = {}
         prev_state: Column | str
-        ent_results = result[ent_id]
+        ent_results: list[State | dict[str, Any]] = []
         if row := initial_states.pop(ent_id, None):
             prev_state = row.state
             ent_results.append(state_class(row, attr_cache, start_time))
 
         if not minimal_response or split_entity_id(ent_id)[0] in NEED_ATTRIBUTE_DOMAINS:
             ent_results.extend(state_class(db_state, attr_cache) for db_state in group)
+            if ent_results:
+                yield ent_id, ent_results
             continue
 
         # With minimal response we only provide a native
@@ -727,10 +812,9 @@ def _sorted_states_to_dict(
             )
             prev_state = state
 
+        yield ent_id, ent_results
+
     # If there are no states beyond the initial state,
     # the state a was never popped from initial_states
     for ent_id, row in initial_states.items():
-        result[ent_id].append(state_class(row, {}, start_time))
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+        yield ent_id, [state_class(row, {}, start_time)]
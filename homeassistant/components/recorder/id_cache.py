@@ -0,0 +1,70 @@
+"""Caches of the ids of shared state attributes and event data."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from lru import LRU  # pylint: disable=no-name-in-module
+
+
+class SharedIdCache:
+    """A bounded LRU cache of the ids of shared json strings.
+
+    The cache is keyed by the shared json string so a lookup is a
+    hash lookup that is verified against the string. The fnv hash
+    stored in the database is only calculated on a miss.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the cache."""
+        self._ids: LRU = LRU(size)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached ids."""
+        return len(self._ids)
+
+    def __contains__(self, shared: str) -> bool:
+        """Return if the id of a shared string is cached."""
+        return shared in self._ids
+
+    def __setitem__(self, shared: str, shared_id: int) -> None:
+        """Cache the id of a shared string."""
+        self._ids[shared] = shared_id
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the percentage of lookups that found the id in the cache."""
+        if not (lookups := self.hits + self.misses):
+            return None
+        return 100 * self.hits / lookups
+
+    @property
+    def size(self) -> int:
+        """Return the maximum number of cached ids."""
+        return int(self._ids.get_size())
+
+    def get(self, shared: str) -> int | None:
+        """Return the id of a shared string and count the hit or miss."""
+        if (shared_id := self._ids.get(shared)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return int(shared_id)
+
+    def pop(self, shared: str, default: int | None = None) -> int | None:
+        """Remove a shared string from the cache."""
+        return self._ids.pop(shared, default)  # type: ignore[no-any-return]
+
+    def items(self) -> list[tuple[str, int]]:
+        """Return the cached shared strings and ids."""
+        return self._ids.items()  # type: ignore[no-any-return]
+
+    def load(self, shared_ids: Iterable[tuple[str, int]]) -> None:
+        """Load shared strings and ids from least to most recently used."""
+        for shared, shared_id in shared_ids:
+            self._ids[shared] = shared_id
+
+    def clear(self) -> None:
+        """Remove all ids from the cache."""
+        self._ids.clear()
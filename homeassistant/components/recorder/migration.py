@@ -28,7 +28,10 @@ from .models import (
     Base,
     SchemaChanges,
     Statistics,
+    StatisticsCalendar,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
@@ -734,6 +737,17 @@ def _apply_update(  # noqa: C901
             _create_index(
                 session_maker, "statistics_meta", "ix_statistics_meta_statistic_id"
             )
+    elif new_version == 30:
+        # Add the daily and monthly statistics tables, they are compiled from the
+        # hourly statistics by the recorder once the time zone is known
+        Base.metadata.create_all(
+            engine,
+            tables=[
+                StatisticsDaily.__table__,
+                StatisticsMonthly.__table__,
+                StatisticsCalendar.__table__,
+            ],
+        )
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
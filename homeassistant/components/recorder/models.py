@@ -32,13 +32,11 @@ from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import aliased, declarative_base, relationship
 from sqlalchemy.orm.session import Session
 
-from homeassistant.components.websocket_api.const import (
+from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
     COMPRESSED_STATE_LAST_CHANGED,
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
-)
-from homeassistant.const import (
     MAX_LENGTH_EVENT_CONTEXT_ID,
     MAX_LENGTH_EVENT_EVENT_TYPE,
     MAX_LENGTH_EVENT_ORIGIN,
@@ -54,7 +52,7 @@ from .const import ALL_DOMAIN_EXCLUDE_ATTRS, JSON_DUMP
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 29
+SCHEMA_VERSION = 30
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,6 +68,9 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
+TABLE_STATISTICS_CALENDAR = "statistics_calendar"
 
 ALL_TABLES = [
     TABLE_STATES,
@@ -82,6 +83,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
+    TABLE_STATISTICS_CALENDAR,
 ]
 
 TABLES_TO_CHECK = [
@@ -391,7 +395,7 @@ class StateAttributes(Base):  # type: ignore[misc,valid-type]
         state: State | None = event.data.get("new_state")
         # None state means the state was removed from the state machine
         dbstate = StateAttributes(
-            shared_attrs="{}" if state is None else JSON_DUMP(state.attributes)
+            shared_attrs="{}" if state is None else state.attributes_json()
         )
         dbstate.hash = StateAttributes.hash_shared_attrs(dbstate.shared_attrs)
         return dbstate
@@ -409,6 +413,9 @@ class StateAttributes(Base):  # type: ignore[misc,valid-type]
         exclude_attrs = (
             exclude_attrs_by_domain.get(domain, set()) | ALL_DOMAIN_EXCLUDE_ATTRS
         )
+        # Reuse the JSON memoized on the state if nothing is excluded
+        if exclude_attrs.isdisjoint(state.attributes):
+            return state.attributes_json()
         return JSON_DUMP(
             {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
         )
@@ -516,6 +523,42 @@ class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore[misc,valid-type
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsDaily(Base, StatisticsBase):  # type: ignore[misc,valid-type]
+    """Long term statistics reduced to local days."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start",
+            "metadata_id",
+            "start",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+    # Number of hourly means averaged in mean
+    mean_count = Column(Integer)
+
+
+class StatisticsMonthly(Base, StatisticsBase):  # type: ignore[misc,valid-type]
+    """Long term statistics reduced to local months."""
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start",
+            "metadata_id",
+            "start",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+    # Number of hourly means averaged in mean
+    mean_count = Column(Integer)
+
+
 class StatisticMetaData(TypedDict):
     """Statistic meta data class."""
 
@@ -632,6 +675,23 @@ class StatisticsRuns(Base):  # type: ignore[misc,valid-type]
         )
 
 
+class StatisticsCalendar(Base):  # type: ignore[misc,valid-type]
+    """The time zone the daily and monthly statistics were compiled in."""
+
+    __tablename__ = TABLE_STATISTICS_CALENDAR
+    id = Column(Integer, Identity(), primary_key=True)
+    time_zone = Column(String(64))
+    created = Column(DATETIME_TYPE, default=dt_util.utcnow)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatisticsCalendar("
+            f"id={self.id}, time_zone='{self.time_zone}'"
+            f")>"
+        )
+
+
 EVENT_DATA_JSON = type_coerce(
     EventData.shared_data.cast(JSONB_VARIENT_CAST), JSONLiteral(none_as_null=True)
 )
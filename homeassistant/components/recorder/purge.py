@@ -2,19 +2,25 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime
-from functools import partial
-from itertools import islice, zip_longest
+from itertools import zip_longest
 import logging
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING
 
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
 from homeassistant.const import EVENT_STATE_CHANGED
 
-from .const import MAX_ROWS_TO_PURGE, SupportedDialect
-from .models import Events, StateAttributes, States
+from .const import (
+    MAX_ROWS_TO_PURGE,
+    PURGE_BIND_VARS_HEADROOM,
+    SERVER_MAX_ROWS_TO_PURGE,
+    SupportedDialect,
+)
+from .models import Events, StateAttributes, States, process_timestamp
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_sqlite,
@@ -22,22 +28,30 @@ from .queries import (
     data_ids_exist_in_events_sqlite,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_until,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_rows,
+    delete_states_rows_until,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_after,
+    find_events_purge_boundary,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_newest_event_to_purge,
+    find_newest_state_to_purge,
+    find_oldest_state,
     find_short_term_statistics_to_purge,
+    find_states_purge_boundary,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
 from .repack import repack_database
-from .util import retryable_database_job, session_scope
+from .util import chunked, retryable_database_job, session_scope
 
 if TYPE_CHECKING:
     from . import Recorder
@@ -49,20 +63,46 @@ DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
 
-def take(take_num: int, iterable: Iterable) -> list[Any]:
-    """Return first n items of the iterable as a list.
-
-    From itertools recipes
-    """
-    return list(islice(iterable, take_num))
-
-
-def chunked(iterable: Iterable, chunked_num: int) -> Iterable[Any]:
-    """Break *iterable* into lists of length *n*.
-
-    From more-itertools
-    """
-    return iter(partial(take, chunked_num, iter(iterable)), [])
+@dataclass
+class PurgeProgress:
+    """Progress of the running or the last purge."""
+
+    purge_before: datetime | None = None
+    # The oldest state when the purge started
+    oldest: datetime | None = None
+    # All states up to and including purged_until have been purged
+    purged_until: datetime | None = None
+    rows: int = 0
+    seconds: float = 0.0
+    finished: bool = False
+
+    def start(self, purge_before: datetime, oldest: datetime | None) -> None:
+        """Start tracking a new purge."""
+        self.purge_before = purge_before
+        self.oldest = oldest
+        self.purged_until = None
+        self.rows = 0
+        self.seconds = 0.0
+        self.finished = False
+
+    @property
+    def percent(self) -> float | None:
+        """Return the percentage of the time range that has been purged."""
+        if self.finished:
+            return 100.0
+        if self.purge_before is None or self.oldest is None:
+            return None
+        if self.purged_until is None or self.purge_before <= self.oldest:
+            return 0.0
+        purged = (self.purged_until - self.oldest) / (self.purge_before - self.oldest)
+        return min(100.0, max(0.0, purged * 100))
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of purged rows per second spent purging."""
+        if not self.seconds:
+            return None
+        return self.rows / self.seconds
 
 
 @retryable_database_job("purge")
@@ -76,15 +116,49 @@ def purge_old_data(
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    States and events are purged in slices of the oldest rows until the
+    batches are exhausted or the time budget of the recorder is used up.
+    Returns False if the purge has not completed yet.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    started = time.monotonic()
+    try:
+        return _purge_old_data(
+            instance,
+            purge_before,
+            repack,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+            started + instance.purge_time_budget,
+        )
+    finally:
+        instance.purge_progress.seconds += time.monotonic() - started
+
+
+def _purge_old_data(
+    instance: Recorder,
+    purge_before: datetime,
+    repack: bool,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+    deadline: float,
+) -> bool:
+    """Purge events and states older than purge_before until the deadline."""
     using_sqlite = instance.dialect_name == SupportedDialect.SQLITE
+    progress = instance.purge_progress
+    slice_size = _purge_slice_size(instance, using_sqlite)
 
     with session_scope(session=instance.get_session()) as session:
+        if progress.finished or progress.purge_before != purge_before:
+            progress.start(
+                purge_before,
+                process_timestamp(session.execute(find_oldest_state()).scalar()),
+            )
         # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
         has_more_to_purge = False
         if _purging_legacy_format(session):
@@ -100,10 +174,22 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before, using_sqlite
+                instance,
+                session,
+                states_batch_size,
+                purge_before,
+                using_sqlite,
+                slice_size,
+                deadline,
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before, using_sqlite
+                instance,
+                session,
+                events_batch_size,
+                purge_before,
+                using_sqlite,
+                slice_size,
+                deadline,
             )
 
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
@@ -126,11 +212,22 @@ def purge_old_data(
             return False
 
         _purge_old_recorder_runs(instance, session, purge_before)
+    progress.finished = True
     if repack:
         repack_database(instance)
     return True
 
 
+def _purge_slice_size(instance: Recorder, using_sqlite: bool) -> int:
+    """Return the number of rows purged in one slice.
+
+    All state ids of a slice are bound in a single statement so a slice
+    stays below the bound parameter limit of the database.
+    """
+    max_rows = MAX_ROWS_TO_PURGE if using_sqlite else SERVER_MAX_ROWS_TO_PURGE
+    return min(max_rows, instance.max_bind_vars - PURGE_BIND_VARS_HEADROOM)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -153,6 +250,7 @@ def _purge_legacy_format(
     _purge_unused_attributes_ids(instance, session, attributes_ids, using_sqlite)
     if event_ids:
         _purge_event_ids(session, event_ids)
+    instance.purge_progress.rows += len(state_ids) + len(event_ids)
     _purge_unused_data_ids(instance, session, data_ids, using_sqlite)
     return bool(event_ids or state_ids or attributes_ids or data_ids)
 
@@ -163,6 +261,8 @@ def _purge_states_and_attributes_ids(
     states_batch_size: int,
     purge_before: datetime,
     using_sqlite: bool,
+    slice_size: int,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -175,14 +275,19 @@ def _purge_states_and_attributes_ids(
     # MAX_ROWS_TO_PURGE
     attributes_ids_batch: set[int] = set()
     for _ in range(states_batch_size):
-        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before
-        )
-        if not state_ids:
+        if (
+            boundary := _select_states_purge_boundary(session, purge_before, slice_size)
+        ) is None:
             has_remaining_state_ids_to_purge = False
             break
-        _purge_state_ids(instance, session, state_ids)
+        state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
+            session, boundary
+        )
+        _purge_states_until(instance, session, state_ids, boundary)
+        instance.purge_progress.purged_until = process_timestamp(boundary[0])
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if time.monotonic() > deadline:
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch, using_sqlite)
     _LOGGER.debug(
@@ -198,6 +303,8 @@ def _purge_events_and_data_ids(
     events_batch_size: int,
     purge_before: datetime,
     using_sqlite: bool,
+    slice_size: int,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -210,12 +317,16 @@ def _purge_events_and_data_ids(
     # MAX_ROWS_TO_PURGE
     data_ids_batch: set[int] = set()
     for _ in range(events_batch_size):
-        event_ids, data_ids = _select_event_data_ids_to_purge(session, purge_before)
-        if not event_ids:
+        if (
+            boundary := _select_events_purge_boundary(session, purge_before, slice_size)
+        ) is None:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        data_ids = _select_event_data_ids_to_purge(session, boundary)
+        _purge_events_until(instance, session, boundary)
         data_ids_batch = data_ids_batch | data_ids
+        if time.monotonic() > deadline:
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch, using_sqlite)
     _LOGGER.debug(
@@ -225,13 +336,44 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _select_states_purge_boundary(
+    session: Session, purge_before: datetime, slice_size: int
+) -> tuple[datetime, int] | None:
+    """Return the last_updated and state_id of the last state of the oldest slice.
+
+    The states are ordered by the last_updated index and then by state_id
+    so a slice is a range of exactly slice_size states, except for the
+    last slice.
+    """
+    if (
+        row := session.execute(
+            find_states_purge_boundary(purge_before, slice_size)
+        ).first()
+    ) or (row := session.execute(find_newest_state_to_purge(purge_before)).first()):
+        return row.last_updated, row.state_id
+    return None
+
+
+def _select_events_purge_boundary(
+    session: Session, purge_before: datetime, slice_size: int
+) -> tuple[datetime, int] | None:
+    """Return the time_fired and event_id of the last event of the oldest slice."""
+    if (
+        row := session.execute(
+            find_events_purge_boundary(purge_before, slice_size)
+        ).first()
+    ) or (row := session.execute(find_newest_event_to_purge(purge_before)).first()):
+        return row.time_fired, row.event_id
+    return None
+
+
 def _select_state_attributes_ids_to_purge(
-    session: Session, purge_before: datetime
+    session: Session, boundary: tuple[datetime, int]
 ) -> tuple[set[int], set[int]]:
     """Return sets of state and attribute ids to purge."""
     state_ids = set()
     attributes_ids = set()
-    for state in session.execute(find_states_to_purge(purge_before)).all():
+    for state in session.execute(find_states_to_purge(*boundary)).all():
         state_ids.add(state.state_id)
         if state.attributes_id:
             attributes_ids.add(state.attributes_id)
@@ -244,23 +386,20 @@ def _select_state_attributes_ids_to_purge(
 
 
 def _select_event_data_ids_to_purge(
-    session: Session, purge_before: datetime
-) -> tuple[set[int], set[int]]:
-    """Return sets of event and data ids to purge."""
-    event_ids = set()
-    data_ids = set()
-    for event in session.execute(find_events_to_purge(purge_before)).all():
-        event_ids.add(event.event_id)
-        if event.data_id:
-            data_ids.add(event.data_id)
-    _LOGGER.debug(
-        "Selected %s event ids and %s data_ids to remove", len(event_ids), len(data_ids)
-    )
-    return event_ids, data_ids
+    session: Session, boundary: tuple[datetime, int]
+) -> set[int]:
+    """Return the set of data ids of the events to purge."""
+    data_ids = {
+        event.data_id
+        for event in session.execute(find_events_to_purge(*boundary)).all()
+        if event.data_id
+    }
+    _LOGGER.debug("Selected %s data_ids to remove", len(data_ids))
+    return data_ids
 
 
 def _select_unused_attributes_ids(
-    session: Session, attributes_ids: set[int], using_sqlite: bool
+    session: Session, attributes_ids: set[int], using_sqlite: bool, max_bind_vars: int
 ) -> set[int]:
     """Return a set of attributes ids that are not used by any states in the database."""
     if not attributes_ids:
@@ -281,8 +420,9 @@ def _select_unused_attributes_ids(
         #
         seen_ids = {
             state[0]
+            for attributes_ids_chunk in chunked(attributes_ids, max_bind_vars)
             for state in session.execute(
-                attributes_ids_exist_in_states_sqlite(attributes_ids)
+                attributes_ids_exist_in_states_sqlite(attributes_ids_chunk)
             ).all()
         }
     else:
@@ -334,13 +474,13 @@ def _purge_unused_attributes_ids(
     using_sqlite: bool,
 ) -> None:
     if unused_attribute_ids_set := _select_unused_attributes_ids(
-        session, attributes_ids_batch, using_sqlite
+        session, attributes_ids_batch, using_sqlite, instance.max_bind_vars
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
-    session: Session, data_ids: set[int], using_sqlite: bool
+    session: Session, data_ids: set[int], using_sqlite: bool, max_bind_vars: int
 ) -> set[int]:
     """Return a set of event data ids that are not used by any events in the database."""
     if not data_ids:
@@ -351,8 +491,9 @@ def _select_unused_event_data_ids(
     if using_sqlite:
         seen_ids = {
             state[0]
+            for data_ids_chunk in chunked(data_ids, max_bind_vars)
             for state in session.execute(
-                data_ids_exist_in_events_sqlite(data_ids)
+                data_ids_exist_in_events_sqlite(data_ids_chunk)
             ).all()
         }
     else:
@@ -376,7 +517,7 @@ def _purge_unused_data_ids(
 ) -> None:
 
     if unused_data_ids_set := _select_unused_event_data_ids(
-        session, data_ids_batch, using_sqlite
+        session, data_ids_batch, using_sqlite, instance.max_bind_vars
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
 
@@ -453,6 +594,35 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     _evict_purged_states_from_old_states_cache(instance, state_ids)
 
 
+def _purge_states_until(
+    instance: Recorder,
+    session: Session,
+    state_ids: set[int],
+    boundary: tuple[datetime, int],
+) -> None:
+    """Disconnect states and delete the range up to and including the boundary."""
+    disconnected_rows = session.execute(
+        disconnect_states_rows_after(state_ids, *boundary)
+    )
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+
+    deleted_rows = session.execute(delete_states_rows_until(*boundary)).rowcount
+    _LOGGER.debug("Deleted %s states", deleted_rows)
+    instance.purge_progress.rows += deleted_rows
+
+    # Evict eny entries in the old_states cache referring to a purged state
+    _evict_purged_states_from_old_states_cache(instance, state_ids)
+
+
+def _purge_events_until(
+    instance: Recorder, session: Session, boundary: tuple[datetime, int]
+) -> None:
+    """Delete the range of events up to and including the boundary."""
+    deleted_rows = session.execute(delete_event_rows_until(*boundary)).rowcount
+    _LOGGER.debug("Deleted %s events", deleted_rows)
+    instance.purge_progress.rows += deleted_rows
+
+
 def _evict_purged_states_from_old_states_cache(
     instance: Recorder, purged_state_ids: set[int]
 ) -> None:
@@ -469,6 +639,9 @@ def _evict_purged_states_from_old_states_cache(
     for purged_state_id in purged_state_ids.intersection(old_state_reversed):
         old_states.pop(old_state_reversed[purged_state_id], None)
 
+    if bulk_writer := instance._bulk_writer:  # pylint: disable=protected-access
+        bulk_writer.evict_purged_states(purged_state_ids)
+
 
 def _evict_purged_data_from_data_cache(
     instance: Recorder, purged_data_ids: set[int]
@@ -510,8 +683,8 @@ def _evict_purged_attributes_from_attributes_cache(
 def _purge_batch_attributes_ids(
     instance: Recorder, session: Session, attributes_ids: set[int]
 ) -> None:
-    """Delete old attributes ids in batches of MAX_ROWS_TO_PURGE."""
-    for attributes_ids_chunk in chunked(attributes_ids, MAX_ROWS_TO_PURGE):
+    """Delete old attributes ids in batches of the maximum bound parameters."""
+    for attributes_ids_chunk in chunked(attributes_ids, instance.max_bind_vars):
         deleted_rows = session.execute(
             delete_states_attributes_rows(attributes_ids_chunk)
         )
@@ -524,8 +697,8 @@ def _purge_batch_attributes_ids(
 def _purge_batch_data_ids(
     instance: Recorder, session: Session, data_ids: set[int]
 ) -> None:
-    """Delete old event data ids in batches of MAX_ROWS_TO_PURGE."""
-    for data_ids_chunk in chunked(data_ids, MAX_ROWS_TO_PURGE):
+    """Delete old event data ids in batches of the maximum bound parameters."""
+    for data_ids_chunk in chunked(data_ids, instance.max_bind_vars):
         deleted_rows = session.execute(delete_event_data_rows(data_ids_chunk))
         _LOGGER.debug("Deleted %s data events", deleted_rows)
 
@@ -619,7 +792,10 @@ def _purge_filtered_states(
     _purge_state_ids(instance, session, set(state_ids))
     _purge_event_ids(session, event_ids)
     unused_attribute_ids_set = _select_unused_attributes_ids(
-        session, {id_ for id_ in attributes_ids if id_ is not None}, using_sqlite
+        session,
+        {id_ for id_ in attributes_ids if id_ is not None},
+        using_sqlite,
+        instance.max_bind_vars,
     )
     _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
 
@@ -647,12 +823,12 @@ def _purge_filtered_events(
     _purge_state_ids(instance, session, state_ids)
     _purge_event_ids(session, event_ids)
     if unused_data_ids_set := _select_unused_event_data_ids(
-        session, set(data_ids), using_sqlite
+        session, set(data_ids), using_sqlite, instance.max_bind_vars
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
     if EVENT_STATE_CHANGED in excluded_event_types:
         session.query(StateAttributes).delete(synchronize_session=False)
-        instance._state_attributes_ids = {}  # pylint: disable=protected-access
+        instance._state_attributes_ids.clear()  # pylint: disable=protected-access
 
 
 @retryable_database_job("purge")
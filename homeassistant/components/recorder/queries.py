@@ -4,7 +4,19 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    and_,
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    not_,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -40,6 +52,26 @@ def find_shared_data_id(attr_hash: int, shared_data: str) -> StatementLambdaElem
     )
 
 
+def find_recent_states_attributes_ids(limit: int) -> StatementLambdaElement:
+    """Find the distinct attributes_ids of the most recently recorded states."""
+    return lambda_stmt(
+        lambda: select(States.attributes_id)
+        .filter(States.attributes_id.isnot(None))
+        .group_by(States.attributes_id)
+        .order_by(func.max(States.state_id).desc())
+        .limit(limit)
+    )
+
+
+def find_shared_attributes(attributes_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find the shared_attrs of attributes_ids."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).filter(StateAttributes.attributes_id.in_(attributes_ids))
+    )
+
+
 def _state_attrs_exist(attr: int | None) -> Select:
     """Check if a state attributes id exists in the states table."""
     return select(func.min(States.attributes_id)).where(States.attributes_id == attr)
@@ -578,21 +610,126 @@ def delete_recorder_runs_rows(
     )
 
 
-def find_events_to_purge(purge_before: datetime) -> StatementLambdaElement:
-    """Find events to purge."""
+def _states_until(purge_until: datetime, state_id: int) -> ColumnElement:
+    """Return a filter for the states up to and including the boundary."""
+    return or_(
+        States.last_updated < purge_until,
+        and_(States.last_updated == purge_until, States.state_id <= state_id),
+    )
+
+
+def _events_until(purge_until: datetime, event_id: int) -> ColumnElement:
+    """Return a filter for the events up to and including the boundary."""
+    return or_(
+        Events.time_fired < purge_until,
+        and_(Events.time_fired == purge_until, Events.event_id <= event_id),
+    )
+
+
+def disconnect_states_rows_after(
+    state_ids: Iterable[int], purge_until: datetime, state_id: int
+) -> StatementLambdaElement:
+    """Disconnect the states after the boundary from the purged states.
+
+    The states up to the boundary are deleted right after so they are not
+    updated as well.
+    """
+    after = not_(_states_until(purge_until, state_id))
     return lambda_stmt(
-        lambda: select(Events.event_id, Events.data_id)
+        lambda: update(States)
+        .where(States.old_state_id.in_(state_ids))
+        .where(after)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_rows_until(
+    purge_until: datetime, state_id: int
+) -> StatementLambdaElement:
+    """Delete states rows up to and including the boundary."""
+    until = _states_until(purge_until, state_id)
+    return lambda_stmt(
+        lambda: delete(States).where(until).execution_options(synchronize_session=False)
+    )
+
+
+def delete_event_rows_until(
+    purge_until: datetime, event_id: int
+) -> StatementLambdaElement:
+    """Delete events rows up to and including the boundary."""
+    until = _events_until(purge_until, event_id)
+    return lambda_stmt(
+        lambda: delete(Events).where(until).execution_options(synchronize_session=False)
+    )
+
+
+def find_events_purge_boundary(
+    purge_before: datetime, slice_size: int
+) -> StatementLambdaElement:
+    """Find the last event of the oldest slice to purge."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired, Events.event_id)
         .filter(Events.time_fired < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
+        .order_by(Events.time_fired, Events.event_id)
+        .offset(slice_size - 1)
+        .limit(1)
+    )
+
+
+def find_newest_event_to_purge(purge_before: datetime) -> StatementLambdaElement:
+    """Find the newest event to purge."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired, Events.event_id)
+        .filter(Events.time_fired < purge_before)
+        .order_by(Events.time_fired.desc(), Events.event_id.desc())
+        .limit(1)
+    )
+
+
+def find_events_to_purge(
+    purge_until: datetime, event_id: int
+) -> StatementLambdaElement:
+    """Find events up to and including the boundary."""
+    until = _events_until(purge_until, event_id)
+    return lambda_stmt(lambda: select(Events.event_id, Events.data_id).filter(until))
+
+
+def find_states_purge_boundary(
+    purge_before: datetime, slice_size: int
+) -> StatementLambdaElement:
+    """Find the last state of the oldest slice to purge."""
+    return lambda_stmt(
+        lambda: select(States.last_updated, States.state_id)
+        .filter(States.last_updated < purge_before)
+        .order_by(States.last_updated, States.state_id)
+        .offset(slice_size - 1)
+        .limit(1)
     )
 
 
-def find_states_to_purge(purge_before: datetime) -> StatementLambdaElement:
-    """Find states to purge."""
+def find_newest_state_to_purge(purge_before: datetime) -> StatementLambdaElement:
+    """Find the newest state to purge."""
     return lambda_stmt(
-        lambda: select(States.state_id, States.attributes_id)
+        lambda: select(States.last_updated, States.state_id)
         .filter(States.last_updated < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
+        .order_by(States.last_updated.desc(), States.state_id.desc())
+        .limit(1)
+    )
+
+
+def find_oldest_state() -> StatementLambdaElement:
+    """Find the last_updated of the oldest state."""
+    return lambda_stmt(lambda: select(func.min(States.last_updated)))
+
+
+def find_states_to_purge(
+    purge_until: datetime, state_id: int
+) -> StatementLambdaElement:
+    """Find states up to and including the boundary."""
+    until = _states_until(purge_until, state_id)
+    return lambda_stmt(
+        lambda: select(States.state_id, States.attributes_id).filter(until)
     )
 
 
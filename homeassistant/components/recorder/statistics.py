@@ -1,6 +1,7 @@
 """Statistics helper."""
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 import contextlib
@@ -11,7 +12,6 @@ import json
 import logging
 import os
 import re
-from statistics import mean
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 from sqlalchemy import bindparam, func, lambda_stmt, select
@@ -47,7 +47,10 @@ from .models import (
     StatisticMetaData,
     StatisticResult,
     Statistics,
+    StatisticsCalendar,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
@@ -113,6 +116,27 @@ QUERY_STATISTICS_SUMMARY_SUM_LEGACY = [
     StatisticsShortTerm.sum,
 ]
 
+QUERY_STATISTICS_PERIOD_MEAN = [
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+    func.count(Statistics.mean),
+]
+
+QUERY_STATISTICS_PERIOD_SUM = [
+    Statistics.metadata_id,
+    Statistics.last_reset,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start.desc(),
+    )
+    .label("rownum"),
+]
+
 QUERY_STATISTIC_META = [
     StatisticsMeta.id,
     StatisticsMeta.statistic_id,
@@ -507,7 +531,7 @@ def compile_hourly_statistics(
     end_time = start_time + timedelta(hours=1)
 
     # Compute last hour's average, min, max
-    summary: dict[str, StatisticData] = {}
+    summary: dict[int, StatisticData] = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time, end_time)
     stats = execute_stmt_lambda_element(session, stmt)
 
@@ -558,6 +582,175 @@ def compile_hourly_statistics(
     for metadata_id, stat in summary.items():
         session.add(Statistics.from_stats(metadata_id, stat))
 
+    # Update the daily and monthly statistics with the compiled hour
+    if summary:
+        _update_period_statistics(session, start_time, summary)
+
+
+def _compile_period_statistics(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start_time: datetime,
+    end_time: datetime,
+    metadata_ids: list[int] | None,
+) -> None:
+    """Compile daily or monthly statistics of one period.
+
+    The hourly statistics are reduced like statistics_during_period reduces
+    them, replacing any statistics of the period which were compiled before:
+    - average, min max is computed by a database query
+    - sum is taken from the last hourly entry during the period
+    """
+    summary: dict[int, StatisticData] = {}
+    query = (
+        session.query(*QUERY_STATISTICS_PERIOD_MEAN)
+        .filter(Statistics.start >= start_time)
+        .filter(Statistics.start < end_time)
+    )
+    if metadata_ids is not None:
+        query = query.filter(Statistics.metadata_id.in_(metadata_ids))
+    mean_counts: dict[int, int] = {}
+    for metadata_id, _mean, _min, _max, mean_count in query.group_by(
+        Statistics.metadata_id
+    ):
+        summary[metadata_id] = {
+            "start": start_time,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+        mean_counts[metadata_id] = mean_count
+
+    query = (
+        session.query(*QUERY_STATISTICS_PERIOD_SUM)
+        .filter(Statistics.start >= start_time)
+        .filter(Statistics.start < end_time)
+    )
+    if metadata_ids is not None:
+        query = query.filter(Statistics.metadata_id.in_(metadata_ids))
+    subquery = query.subquery()
+    for metadata_id, last_reset, state, _sum, _ in session.query(subquery).filter(
+        subquery.c.rownum == 1
+    ):
+        summary[metadata_id].update(
+            {
+                "last_reset": process_timestamp(last_reset),
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    query = session.query(table).filter(table.start == start_time)
+    if metadata_ids is not None:
+        query = query.filter(table.metadata_id.in_(metadata_ids))
+    query.delete(synchronize_session=False)
+    for metadata_id, stat in summary.items():
+        row = table.from_stats(metadata_id, stat)
+        row.mean_count = mean_counts[metadata_id]
+        session.add(row)
+
+
+def _update_period_statistics(
+    session: Session,
+    start_time: datetime,
+    summary: dict[int, StatisticData],
+) -> None:
+    """Add one compiled hour to the daily and monthly statistics.
+
+    The hour is folded into the statistics of the day and month it belongs to,
+    the other hours of the period are not read again.
+    """
+    for table, period_start_end, _ in PERIOD_STATISTICS.values():
+        period_start, _ = period_start_end(start_time)
+        rows = {
+            row.metadata_id: row
+            for row in session.query(table)
+            .filter(table.start == period_start)
+            .filter(table.metadata_id.in_(list(summary)))
+        }
+        for metadata_id, stat in summary.items():
+            if (row := rows.get(metadata_id)) is None:
+                row = table.from_stats(metadata_id, {**stat, "start": period_start})
+                row.mean_count = int(stat.get("mean") is not None)
+                session.add(row)
+                continue
+            if (_mean := stat.get("mean")) is not None:
+                row.mean_count += 1
+                if row.mean is None:
+                    row.mean = _mean
+                else:
+                    row.mean += (_mean - row.mean) / row.mean_count
+            if (_min := stat.get("min")) is not None:
+                row.min = _min if row.min is None else min(row.min, _min)
+            if (_max := stat.get("max")) is not None:
+                row.max = _max if row.max is None else max(row.max, _max)
+            if "sum" in stat:
+                row.last_reset = stat.get("last_reset")
+                row.state = stat.get("state")
+                row.sum = stat.get("sum")
+
+
+def _compile_period_statistics_range(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime,
+    metadata_ids: list[int] | None,
+) -> None:
+    """Compile the daily and monthly statistics of the periods overlapping a range."""
+    for table, period_start_end, next_period_start in PERIOD_STATISTICS.values():
+        period_start = period_start_end(start_time)[0]
+        while period_start < end_time:
+            period_end = next_period_start(period_start)
+            _compile_period_statistics(
+                session, table, period_start, period_end, metadata_ids
+            )
+            period_start = period_end
+
+
+def get_period_statistics_time_zone(session: Session) -> str | None:
+    """Return the time zone the daily and monthly statistics were compiled in."""
+    calendar = (
+        session.query(StatisticsCalendar.time_zone)
+        .order_by(StatisticsCalendar.id.desc())
+        .first()
+    )
+    return calendar.time_zone if calendar else None
+
+
+def compile_period_statistics(
+    instance: Recorder, time_zone: str, start: datetime | None
+) -> datetime | None:
+    """Compile the daily and monthly statistics of one month of hourly statistics.
+
+    The statistics are compiled from scratch, starting with the oldest month,
+    when start is None. Returns the start of the next month to compile, or None
+    when all statistics are compiled or the time zone has changed.
+    """
+    if time_zone != str(dt_util.DEFAULT_TIME_ZONE):
+        return None
+
+    with session_scope(session=instance.get_session()) as session:
+        if start is None:
+            instance.period_statistics_time_zone = None
+            session.query(StatisticsCalendar).delete(synchronize_session=False)
+            session.query(StatisticsDaily).delete(synchronize_session=False)
+            session.query(StatisticsMonthly).delete(synchronize_session=False)
+            if first_start := session.query(func.min(Statistics.start)).scalar():
+                start = month_start_end(process_timestamp(first_start))[0]
+
+        if start is not None:
+            _LOGGER.debug("Compiling daily and monthly statistics from %s", start)
+            end = _next_month_start(start)
+            _compile_period_statistics_range(session, start, end, None)
+            last_start = session.query(func.max(Statistics.start)).scalar()
+            if last_start and process_timestamp(last_start) >= end:
+                return end
+
+        session.add(StatisticsCalendar(time_zone=time_zone))
+
+    instance.period_statistics_time_zone = time_zone
+    return None
+
 
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
@@ -613,6 +806,8 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
         if start.minute == 55:
             # A full hour is ready, summarize it
             compile_hourly_statistics(instance, session, start)
+            # Recompile the daily and monthly statistics if the time zone changed
+            instance.schedule_compile_period_statistics()
 
         session.add(StatisticsRuns(start=start))
 
@@ -621,7 +816,7 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
 
 def _adjust_sum_statistics(
     session: Session,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[Statistics | StatisticsShortTerm | StatisticsDaily | StatisticsMonthly],
     metadata_id: int,
     start_time: datetime,
     adj: float,
@@ -883,50 +1078,66 @@ def list_statistic_ids(
     ]
 
 
+def _period_slices(
+    starts: list[datetime],
+    period_start_end: Callable[[datetime], tuple[datetime, datetime]],
+    next_period_start: Callable[[datetime], datetime],
+) -> list[tuple[int, datetime, datetime]]:
+    """Split sorted start times into periods.
+
+    Returns the index of the first row, the start and the end of each
+    period. The boundaries are calculated once per period instead of
+    converting every row to local time.
+    """
+    slices: list[tuple[int, datetime, datetime]] = []
+    idx = 0
+    while idx < len(starts):
+        start, end = period_start_end(starts[idx])
+        slices.append((idx, start, end))
+        idx = bisect_left(starts, next_period_start(starts[idx]), idx + 1)
+    return slices
+
+
+def _column_values(rows: list[dict[str, Any]], key: str) -> list[float]:
+    """Return the values of a column of statistics which are not None."""
+    return [value for row in rows if (value := row.get(key)) is not None]
+
+
 def _reduce_statistics(
     stats: dict[str, list[dict[str, Any]]],
-    same_period: Callable[[datetime, datetime], bool],
     period_start_end: Callable[[datetime], tuple[datetime, datetime]],
-    period: timedelta,
+    next_period_start: Callable[[datetime], datetime],
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to daily or monthly statistics."""
     result: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: dict[str, Any] = stat_list[0]
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(
-            stat_list, ({"start": stat_list[-1]["start"] + period},)
-        ):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                result[statistic_id].append(
-                    {
-                        "statistic_id": statistic_id,
-                        "start": start.isoformat(),
-                        "end": end.isoformat(),
-                        "mean": mean(mean_values) if mean_values else None,
-                        "min": min(min_values) if min_values else None,
-                        "max": max(max_values) if max_values else None,
-                        "last_reset": prev_stat.get("last_reset"),
-                        "state": prev_stat.get("state"),
-                        "sum": prev_stat["sum"],
-                    }
-                )
-                max_values = []
-                mean_values = []
-                min_values = []
-            if statistic.get("max") is not None:
-                max_values.append(statistic["max"])
-            if statistic.get("mean") is not None:
-                mean_values.append(statistic["mean"])
-            if statistic.get("min") is not None:
-                min_values.append(statistic["min"])
-            prev_stat = statistic
+        if not stat_list:
+            continue
+        slices = _period_slices(
+            [stat["start"] for stat in stat_list], period_start_end, next_period_start
+        )
+        reduced = result[statistic_id]
+        ends = [idx for idx, _, _ in slices[1:]] + [len(stat_list)]
+        for (first, start, end), last in zip(slices, ends):
+            rows = stat_list[first:last]
+            means = _column_values(rows, "mean")
+            mins = _column_values(rows, "min")
+            maxs = _column_values(rows, "max")
+            # The last statistic of the period holds its state and sum
+            last_stat = rows[-1]
+            reduced.append(
+                {
+                    "statistic_id": statistic_id,
+                    "start": start.isoformat(),
+                    "end": end.isoformat(),
+                    "mean": sum(means) / len(means) if means else None,
+                    "min": min(mins) if mins else None,
+                    "max": max(maxs) if maxs else None,
+                    "last_reset": last_stat.get("last_reset"),
+                    "state": last_stat.get("state"),
+                    "sum": last_stat["sum"],
+                }
+            )
 
     return result
 
@@ -947,12 +1158,24 @@ def day_start_end(time: datetime) -> tuple[datetime, datetime]:
     return (start, end)
 
 
+def _next_day_start(time: datetime) -> datetime:
+    """Return the start of the day after the day time is within.
+
+    Unlike the end returned by day_start_end this is the next local
+    midnight, also when the day is not 24 hours long.
+    """
+    start_local = dt_util.as_local(time).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return dt_util.as_utc(start_local + timedelta(days=1))
+
+
 def _reduce_statistics_per_day(
     stats: dict[str, list[dict[str, Any]]]
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to daily statistics."""
 
-    return _reduce_statistics(stats, same_day, day_start_end, timedelta(days=1))
+    return _reduce_statistics(stats, day_start_end, _next_day_start)
 
 
 def same_month(time1: datetime, time2: datetime) -> bool:
@@ -973,12 +1196,30 @@ def month_start_end(time: datetime) -> tuple[datetime, datetime]:
     return (start, end)
 
 
+def _next_month_start(time: datetime) -> datetime:
+    """Return the start of the month after the month time is within."""
+    return month_start_end(time)[1]
+
+
 def _reduce_statistics_per_month(
     stats: dict[str, list[dict[str, Any]]],
 ) -> dict[str, list[dict[str, Any]]]:
     """Reduce hourly statistics to monthly statistics."""
 
-    return _reduce_statistics(stats, same_month, month_start_end, timedelta(days=31))
+    return _reduce_statistics(stats, month_start_end, _next_month_start)
+
+
+PERIOD_STATISTICS: dict[
+    str,
+    tuple[
+        type[StatisticsDaily | StatisticsMonthly],
+        Callable[[datetime], tuple[datetime, datetime]],
+        Callable[[datetime], datetime],
+    ],
+] = {
+    "day": (StatisticsDaily, day_start_end, _next_day_start),
+    "month": (StatisticsMonthly, month_start_end, _next_month_start),
+}
 
 
 def _statistics_during_period_stmt(
@@ -1025,6 +1266,124 @@ def _statistics_during_period_stmt_short_term(
     return stmt
 
 
+def _period_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: Literal["day", "month"],
+) -> dict[str, list[dict[str, Any]]]:
+    """Return daily or monthly statistics during UTC period start_time - end_time.
+
+    Periods which are entirely within the requested time range are read from
+    the daily or monthly statistics, the hours before the first and after the
+    last of those periods are reduced from the hourly statistics.
+    """
+    table, period_start_end, next_period_start = PERIOD_STATISTICS[period]
+    first_period = period_start_end(start_time)[0]
+    if first_period < start_time:
+        first_period = next_period_start(start_time)
+    last_period = None if end_time is None else period_start_end(end_time)[0]
+
+    head_stats: list[Row] = []
+    period_stats: list[Row] = []
+    tail_stats: list[Row] = []
+    if last_period is not None and last_period < first_period:
+        head_stats = list(
+            execute_stmt_lambda_element(
+                session,
+                _statistics_during_period_stmt(start_time, end_time, metadata_ids),
+            )
+        )
+    else:
+        if start_time < first_period:
+            head_stats = list(
+                execute_stmt_lambda_element(
+                    session,
+                    _statistics_during_period_stmt(
+                        start_time, first_period, metadata_ids
+                    ),
+                )
+            )
+        query = session.query(
+            table.metadata_id,
+            table.start,
+            table.mean,
+            table.min,
+            table.max,
+            table.last_reset,
+            table.state,
+            table.sum,
+        ).filter(table.start >= first_period)
+        if last_period is not None:
+            query = query.filter(table.start < last_period)
+        if metadata_ids:
+            query = query.filter(table.metadata_id.in_(metadata_ids))
+        period_stats = execute(query.order_by(table.metadata_id, table.start))
+        if last_period is not None and end_time is not None and last_period < end_time:
+            tail_stats = list(
+                execute_stmt_lambda_element(
+                    session,
+                    _statistics_during_period_stmt(last_period, end_time, metadata_ids),
+                )
+            )
+
+    if not (
+        found_ids := {
+            stat.metadata_id for stat in chain(head_stats, period_stats, tail_stats)
+        }
+    ):
+        return {}
+
+    # The last known statistics before start_time are added to statistics which
+    # don't have a statistic at start_time, like statistics_during_period does
+    if need_stat_at_start_time := found_ids - {
+        metadata_id
+        for (metadata_id,) in session.query(Statistics.metadata_id)
+        .filter(Statistics.start == start_time)
+        .filter(Statistics.metadata_id.in_(found_ids))
+    }:
+        head_stats.extend(
+            _statistics_at_time(
+                session, need_stat_at_start_time, Statistics, start_time
+            )
+            or ()
+        )
+        head_stats.sort(key=lambda stat: (stat.metadata_id, stat.start))
+
+    def reduce_hourly(stats: list[Row]) -> dict[str, list[dict[str, Any]]]:
+        """Reduce hourly statistics to the period."""
+        return _reduce_statistics(
+            _sorted_statistics_to_dict(
+                hass, session, stats, None, metadata, True, Statistics, None, True
+            ),
+            period_start_end,
+            next_period_start,
+        )
+
+    head = reduce_hourly(head_stats)
+    tail = reduce_hourly(tail_stats)
+    # The table is only used for the end of the statistics, which is replaced
+    # by the end of the period
+    periods = _sorted_statistics_to_dict(
+        hass, session, period_stats, None, metadata, True, Statistics, None, True
+    )
+    result: dict[str, list[dict[str, Any]]] = {}
+    for statistic_id, _ in sorted(metadata.items(), key=lambda item: item[1][0]):
+        stat_list = head.get(statistic_id, [])
+        for stat in periods.get(statistic_id, ()):
+            start, end = period_start_end(stat["start"])
+            stat_list.append(
+                {**stat, "start": start.isoformat(), "end": end.isoformat()}
+            )
+        stat_list.extend(tail.get(statistic_id, ()))
+        if stat_list:
+            result[statistic_id] = stat_list
+    return result
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -1049,6 +1408,14 @@ def statistics_during_period(
         if statistic_ids is not None:
             metadata_ids = [metadata_id for metadata_id, _ in metadata.values()]
 
+        if period in PERIOD_STATISTICS and (
+            hass.data[DATA_INSTANCE].period_statistics_time_zone
+            == str(dt_util.DEFAULT_TIME_ZONE)
+        ):
+            return _period_statistics_during_period(
+                hass, session, start_time, end_time, metadata, metadata_ids, period
+            )
+
         if period == "5minute":
             table = StatisticsShortTerm
             stmt = _statistics_during_period_stmt_short_term(
@@ -1458,6 +1825,11 @@ def add_external_statistics(
             else:
                 _insert_statistics(session, Statistics, metadata_id, stat)
 
+        if starts := [stat["start"] for stat in statistics]:
+            _compile_period_statistics_range(
+                session, min(starts), max(starts) + timedelta(hours=1), [metadata_id]
+            )
+
     return True
 
 
@@ -1499,4 +1871,21 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # The periods after the adjusted hour are adjusted like the hourly
+        # statistics, the period of the hour is compiled again
+        for table, _, next_period_start in PERIOD_STATISTICS.values():
+            _adjust_sum_statistics(
+                session,
+                table,
+                metadata[statistic_id][0],
+                next_period_start(start_time),
+                sum_adjustment,
+            )
+        _compile_period_statistics_range(
+            session,
+            start_time.replace(minute=0),
+            start_time.replace(minute=0) + timedelta(hours=1),
+            [metadata[statistic_id][0]],
+        )
+
     return True
@@ -54,6 +54,31 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get the progress of the running or the last purge."""
+    purge_info: dict[str, Any] = {}
+    progress = instance.purge_progress
+    if (percent := progress.percent) is not None:
+        purge_info["purge_progress"] = f"{percent:.1f} %"
+    if (rows_per_second := progress.rows_per_second) is not None:
+        purge_info["purge_rows_per_second"] = f"{rows_per_second:.0f}"
+    return purge_info
+
+
+@callback
+def _async_get_id_cache_info(instance: Recorder) -> dict[str, Any]:
+    """Get the hit rates of the shared attributes and event data id caches."""
+    id_cache_info: dict[str, Any] = {}
+    # pylint: disable-next=protected-access
+    if (hit_rate := instance._state_attributes_ids.hit_rate) is not None:
+        id_cache_info["state_attributes_cache_hit_rate"] = f"{hit_rate:.1f} %"
+    # pylint: disable-next=protected-access
+    if (hit_rate := instance._event_data_ids.hit_rate) is not None:
+        id_cache_info["event_data_cache_hit_rate"] = f"{hit_rate:.1f} %"
+    return id_cache_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -61,6 +86,8 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     run_history = instance.run_history
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    purge_info = _async_get_purge_info(instance)
+    id_cache_info = _async_get_id_cache_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -71,4 +98,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": run_history.first.start,
             "current_recorder_run": run_history.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | purge_info | id_cache_info
@@ -123,6 +123,22 @@ class StatisticsTask(RecorderTask):
         instance.queue_task(StatisticsTask(self.start))
 
 
+@dataclass
+class CompilePeriodStatisticsTask(RecorderTask):
+    """An object to insert into the recorder queue to compile daily and monthly statistics."""
+
+    time_zone: str
+    start: datetime | None
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task."""
+        if start := statistics.compile_period_statistics(
+            instance, self.time_zone, self.start
+        ):
+            # Schedule a new statistics task for the next month
+            instance.queue_task(CompilePeriodStatisticsTask(self.time_zone, start))
+
+
 @dataclass
 class ExternalStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an external statistics task."""
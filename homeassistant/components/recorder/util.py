@@ -5,8 +5,10 @@ from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 import functools
+from itertools import islice
 import logging
 import os
+import sqlite3
 import time
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -28,7 +30,15 @@ from typing_extensions import Concatenate, ParamSpec
 from homeassistant.core import HomeAssistant
 import homeassistant.util.dt as dt_util
 
-from .const import DATA_INSTANCE, SQLITE_URL_PREFIX, SupportedDialect
+from .const import (
+    DATA_INSTANCE,
+    MYSQL_MAX_BIND_VARS,
+    POSTGRESQL_MAX_BIND_VARS,
+    SQLITE_MAX_BIND_VARS,
+    SQLITE_MODERN_MAX_BIND_VARS,
+    SQLITE_URL_PREFIX,
+    SupportedDialect,
+)
 from .models import (
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
@@ -55,6 +65,9 @@ MIN_VERSION_MARIA_DB = AwesomeVersion("10.3.0", AwesomeVersionStrategy.SIMPLEVER
 MIN_VERSION_MYSQL = AwesomeVersion("8.0.0", AwesomeVersionStrategy.SIMPLEVER)
 MIN_VERSION_PGSQL = AwesomeVersion("12.0", AwesomeVersionStrategy.SIMPLEVER)
 MIN_VERSION_SQLITE = AwesomeVersion("3.31.0", AwesomeVersionStrategy.SIMPLEVER)
+MIN_VERSION_SQLITE_MODERN_BIND_VARS = AwesomeVersion(
+    "3.32.0", AwesomeVersionStrategy.SIMPLEVER
+)
 
 # This is the maximum time after the recorder ends the session
 # before we no longer consider startup to be a "restart" and we
@@ -72,6 +85,22 @@ SUNDAY_WEEKDAY = 6
 DAYS_IN_WEEK = 7
 
 
+def take(take_num: int, iterable: Iterable) -> list[Any]:
+    """Return first n items of the iterable as a list.
+
+    From itertools recipes
+    """
+    return list(islice(iterable, take_num))
+
+
+def chunked(iterable: Iterable, chunked_num: int) -> Iterable[Any]:
+    """Break *iterable* into lists of length *n*.
+
+    From more-itertools
+    """
+    return iter(functools.partial(take, chunked_num, iter(iterable)), [])
+
+
 @contextmanager
 def session_scope(
     *,
@@ -416,6 +445,7 @@ def setup_connection_for_dialect(
                 _fail_unsupported_version(
                     version or version_string, "SQLite", MIN_VERSION_SQLITE
                 )
+            instance.max_bind_vars = _sqlite_max_bind_vars(dbapi_connection, version)
 
         # The upper bound on the cache size is approximately 16MiB of memory
         execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
@@ -451,6 +481,7 @@ def setup_connection_for_dialect(
                     _fail_unsupported_version(
                         version or version_string, "MySQL", MIN_VERSION_MYSQL
                     )
+            instance.max_bind_vars = MYSQL_MAX_BIND_VARS
 
     elif dialect_name == SupportedDialect.POSTGRESQL:
         if first_connection:
@@ -462,6 +493,7 @@ def setup_connection_for_dialect(
                 _fail_unsupported_version(
                     version or version_string, "PostgreSQL", MIN_VERSION_PGSQL
                 )
+            instance.max_bind_vars = POSTGRESQL_MAX_BIND_VARS
 
     else:
         _fail_unsupported_dialect(dialect_name)
@@ -469,6 +501,21 @@ def setup_connection_for_dialect(
     return version
 
 
+def _sqlite_max_bind_vars(dbapi_connection: Any, version: AwesomeVersion) -> int:
+    """Return the maximum number of bound parameters of a SQLite statement."""
+    # Connection.getlimit was added in Python 3.11
+    if isinstance(dbapi_connection, sqlite3.Connection) and hasattr(
+        dbapi_connection, "getlimit"
+    ):
+        return min(
+            dbapi_connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER) - 1,
+            SQLITE_MODERN_MAX_BIND_VARS,
+        )
+    if version >= MIN_VERSION_SQLITE_MODERN_BIND_VARS:
+        return SQLITE_MODERN_MAX_BIND_VARS
+    return SQLITE_MAX_BIND_VARS
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -6,8 +6,9 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import ActionTrace, async_store_trace
-from homeassistant.components.trace.const import CONF_STORED_TRACES
+from homeassistant.components.trace.const import CONF_LEVEL, CONF_STORED_TRACES
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import TRACE_LEVEL_OFF, trace_level_cv
 
 from .const import DOMAIN
 
@@ -29,7 +30,9 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    if (trace_level := trace_config[CONF_LEVEL]) != TRACE_LEVEL_OFF:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_level_cv.set(trace_level)
 
     try:
         yield trace
@@ -38,5 +41,6 @@ def trace_script(
             trace.set_error(ex)
         raise ex
     finally:
+        trace_level_cv.reset(token)
         if item_id:
             trace.finished()
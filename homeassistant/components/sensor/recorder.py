@@ -7,6 +7,7 @@ import datetime
 import itertools
 import logging
 import math
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -29,6 +30,7 @@ from homeassistant.const import (
     ENERGY_KILO_WATT_HOUR,
     ENERGY_MEGA_WATT_HOUR,
     ENERGY_WATT_HOUR,
+    EVENT_STATE_CHANGED,
     POWER_KILO_WATT,
     POWER_WATT,
     PRESSURE_BAR,
@@ -44,7 +46,7 @@ from homeassistant.const import (
     VOLUME_CUBIC_FEET,
     VOLUME_CUBIC_METERS,
 )
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 import homeassistant.util.dt as dt_util
@@ -127,6 +129,123 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# States accumulated for compiling short term statistics
+DATA_STATES_ACCUMULATOR = "sensor_statistics_states_accumulator"
+# States older than this are dropped if no statistics were compiled meanwhile
+STATES_ACCUMULATOR_MAX_AGE = datetime.timedelta(minutes=15)
+
+
+class _TrackedStates:
+    """States of a sensor, complete for periods starting at or after since."""
+
+    __slots__ = ("since", "states")
+
+    def __init__(self, since: datetime.datetime, state: State) -> None:
+        """Initialize the tracked states."""
+        self.since = since
+        self.states = [state]
+
+    def prune(self, before: datetime.datetime) -> None:
+        """Drop the states before a point in time, except the last one."""
+        states = self.states
+        keep = len(states) - 1
+        for idx, state in enumerate(states):
+            if state.last_updated >= before:
+                keep = max(idx - 1, 0)
+                break
+        del states[:keep]
+        self.since = max(self.since, before)
+
+
+class StatesAccumulator:
+    """Collect the states of statistics sensors as they change.
+
+    Compiling short term statistics reads the states of the period from here
+    instead of querying the database. Sensors which haven't been followed for
+    the whole period, e.g. after a restart, are still read from the database.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        self._lock = threading.Lock()
+        self._tracked: dict[str, _TrackedStates] = {}
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> None:
+        """Start following the sensors."""
+        started = dt_util.utcnow()
+        with self._lock:
+            for state in hass.states.async_all(DOMAIN):
+                if state.attributes.get(ATTR_STATE_CLASS) in STATE_CLASSES:
+                    self._tracked[state.entity_id] = _TrackedStates(started, state)
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_async_sensor_event_filter,
+            run_immediately=True,
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Add a new sensor state."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        with self._lock:
+            if (
+                new_state is None
+                or new_state.attributes.get(ATTR_STATE_CLASS) not in STATE_CLASSES
+            ):
+                self._tracked.pop(entity_id, None)
+                return
+            if (tracked := self._tracked.get(entity_id)) is None:
+                # Earlier states of the sensor may be in the database only
+                self._tracked[entity_id] = _TrackedStates(
+                    new_state.last_updated + datetime.timedelta.resolution,
+                    new_state,
+                )
+                return
+            states = tracked.states
+            states.append(new_state)
+            oldest = new_state.last_updated - STATES_ACCUMULATOR_MAX_AGE
+            if states[1].last_updated < oldest:
+                tracked.prune(oldest)
+
+    def states_during_period(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        entity_ids: list[str],
+    ) -> dict[str, list[State]]:
+        """Return the states during start-end of sensors followed since start.
+
+        Like the database history, the states include the last state before start.
+        States before start are dropped, the periods are compiled in order.
+        """
+        result: dict[str, list[State]] = {}
+        with self._lock:
+            for entity_id in entity_ids:
+                tracked = self._tracked.get(entity_id)
+                if tracked is None or tracked.since > start:
+                    continue
+                tracked.prune(start)
+                result[entity_id] = [
+                    state for state in tracked.states if state.last_updated < end
+                ]
+        return result
+
+
+@callback
+def _async_sensor_event_filter(event: Event) -> bool:
+    """Filter state changed events of sensors."""
+    return bool(event.data["entity_id"].startswith(f"{DOMAIN}."))
+
+
+@callback
+def async_setup_statistics(hass: HomeAssistant) -> None:
+    """Start accumulating the states of statistics sensors."""
+    accumulator = StatesAccumulator()
+    accumulator.async_start(hass)
+    hass.data[DATA_STATES_ACCUMULATOR] = accumulator
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -412,34 +531,55 @@ def _compile_statistics(  # noqa: C901
         hass, session, statistic_ids=[i.entity_id for i in sensor_states]
     )
 
-    # Get history between start and end
+    # Get history between start and end, from the accumulated states if possible
+    history_list: MutableMapping[str, list[State]] = {}
+    if (accumulator := hass.data.get(DATA_STATES_ACCUMULATOR)) is not None:
+        accumulated = accumulator.states_during_period(
+            start, end, [i.entity_id for i in sensor_states]
+        )
+        for entity_id, entity_states in accumulated.items():
+            if "sum" not in wanted_statistics[entity_id]:
+                # Only significant changes, like the database query below
+                entity_states = [
+                    state
+                    for state in entity_states
+                    if state.last_updated < start
+                    or state.last_changed == state.last_updated
+                ]
+            if entity_states:
+                history_list[entity_id] = entity_states
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in history_list
     ]
-    history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
         )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in history_list
     ]
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
         )
-        history_list = {**history_list, **_history_list}
     # If there are no recent state changes, the sensor's state may already be pruned
     # from the recorder. Get the state from the state machine instead.
     for _state in sensor_states:
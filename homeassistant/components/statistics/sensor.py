@@ -1,12 +1,11 @@
 """Support for statistics for sensor values."""
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
 import logging
-import statistics
+import math
 from typing import Any, Literal, cast
 
 import voluptuous as vol
@@ -48,6 +47,7 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateTyp
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .window import SampleWindow
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -296,8 +296,10 @@ class StatisticsSensor(SensorEntity):
         self._value: StateType | datetime = None
         self._unit_of_measurement: str | None = None
         self._available: bool = False
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self.samples = SampleWindow(
+            self._samples_max_buffer_size,
+            track_order=state_characteristic in (STAT_MEDIAN, STAT_QUANTILES),
+        )
         self.attributes: dict[str, StateType] = {
             STAT_AGE_COVERAGE_RATIO: None,
             STAT_BUFFER_USAGE_RATIO: None,
@@ -357,10 +359,10 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value = 1.0 if new_state.state == "on" else 0.0
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+            self.samples.append(value, new_state.last_updated.timestamp())
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -448,23 +450,28 @@ class StatisticsSensor(SensorEntity):
             self._samples_max_age,
         )
 
-        while self.ages and (now - self.ages[0]) > max_age:
+        while self.samples and (
+            (now - (oldest := dt_util.utc_from_timestamp(self.samples.timestamps[0])))
+            > max_age
+        ):
             _LOGGER.debug(
                 "%s: purging record with datetime %s(%s)",
                 self.entity_id,
-                dt_util.as_local(self.ages[0]),
-                (now - self.ages[0]),
+                dt_util.as_local(oldest),
+                (now - oldest),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self.samples.popleft()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
-        if self.ages and self._samples_max_age:
+        if self.samples and self._samples_max_age:
             # Take the oldest entry from the ages list and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
             # in the future when the oldest state will expire.
-            return self.ages[0] + self._samples_max_age
+            return (
+                dt_util.utc_from_timestamp(self.samples.timestamps[0])
+                + self._samples_max_age
+            )
         return None
 
     async def async_update(self) -> None:
@@ -545,13 +552,12 @@ class StatisticsSensor(SensorEntity):
     def _update_attributes(self) -> None:
         """Calculate and update the various attributes."""
         self.attributes[STAT_BUFFER_USAGE_RATIO] = round(
-            len(self.states) / self._samples_max_buffer_size, 2
+            len(self.samples) / self._samples_max_buffer_size, 2
         )
 
-        if len(self.states) >= 1 and self._samples_max_age is not None:
+        if len(self.samples) >= 1 and self._samples_max_age is not None:
             self.attributes[STAT_AGE_COVERAGE_RATIO] = round(
-                (self.ages[-1] - self.ages[0]).total_seconds()
-                / self._samples_max_age.total_seconds(),
+                self.samples.duration / self._samples_max_age.total_seconds(),
                 2,
             )
         else:
@@ -575,168 +581,147 @@ class StatisticsSensor(SensorEntity):
     # Statistics for numeric sensor
 
     def _stat_average_linear(self) -> StateType:
-        if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+        if len(self.samples) >= 2:
+            return self.samples.linear_area / self.samples.duration
         return None
 
     def _stat_average_step(self) -> StateType:
-        if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+        if len(self.samples) >= 2:
+            return self.samples.step_area / self.samples.duration
         return None
 
     def _stat_average_timeless(self) -> StateType:
         return self._stat_mean()
 
     def _stat_change(self) -> StateType:
-        if len(self.states) > 0:
-            return self.states[-1] - self.states[0]
+        if len(self.samples) > 0:
+            return self.samples.values[-1] - self.samples.values[0]
         return None
 
     def _stat_change_sample(self) -> StateType:
-        if len(self.states) > 1:
-            return (self.states[-1] - self.states[0]) / (len(self.states) - 1)
+        if len(self.samples) > 1:
+            return (self.samples.values[-1] - self.samples.values[0]) / (
+                len(self.samples) - 1
+            )
         return None
 
     def _stat_change_second(self) -> StateType:
-        if len(self.states) > 1:
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
+        if len(self.samples) > 1:
+            age_range_seconds = self.samples.duration
             if age_range_seconds > 0:
-                return (self.states[-1] - self.states[0]) / age_range_seconds
+                return (
+                    self.samples.values[-1] - self.samples.values[0]
+                ) / age_range_seconds
         return None
 
     def _stat_count(self) -> StateType:
-        return len(self.states)
+        return len(self.samples)
 
     def _stat_datetime_newest(self) -> datetime | None:
-        if len(self.states) > 0:
-            return self.ages[-1]
+        if len(self.samples) > 0:
+            return dt_util.utc_from_timestamp(self.samples.timestamps[-1])
         return None
 
     def _stat_datetime_oldest(self) -> datetime | None:
-        if len(self.states) > 0:
-            return self.ages[0]
+        if len(self.samples) > 0:
+            return dt_util.utc_from_timestamp(self.samples.timestamps[0])
         return None
 
     def _stat_datetime_value_max(self) -> datetime | None:
-        if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+        if len(self.samples) > 0:
+            return dt_util.utc_from_timestamp(self.samples.max[1])
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
-        if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+        if len(self.samples) > 0:
+            return dt_util.utc_from_timestamp(self.samples.min[1])
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
-        if len(self.states) >= 2:
+        if len(self.samples) >= 2:
             return 2 * 1.96 * cast(float, self._stat_standard_deviation())
         return None
 
     def _stat_distance_99_percent_of_values(self) -> StateType:
-        if len(self.states) >= 2:
+        if len(self.samples) >= 2:
             return 2 * 2.58 * cast(float, self._stat_standard_deviation())
         return None
 
     def _stat_distance_absolute(self) -> StateType:
-        if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+        if len(self.samples) > 0:
+            return self.samples.max[0] - self.samples.min[0]
         return None
 
     def _stat_mean(self) -> StateType:
-        if len(self.states) > 0:
-            return statistics.mean(self.states)
+        if len(self.samples) > 0:
+            return self.samples.mean
         return None
 
     def _stat_median(self) -> StateType:
-        if len(self.states) > 0:
-            return statistics.median(self.states)
+        if len(self.samples) > 0:
+            return self.samples.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
-        if len(self.states) >= 2:
-            diff_sum = sum(
-                abs(j - i) for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum / (len(self.states) - 1)
+        if len(self.samples) >= 2:
+            return self.samples.abs_diff_sum / (len(self.samples) - 1)
         return None
 
     def _stat_quantiles(self) -> StateType:
-        if len(self.states) > self._quantile_intervals:
+        if len(self.samples) > self._quantile_intervals:
             return str(
                 [
                     round(quantile, self._precision)
-                    for quantile in statistics.quantiles(
-                        self.states,
-                        n=self._quantile_intervals,
-                        method=self._quantile_method,
+                    for quantile in self.samples.quantiles(
+                        self._quantile_intervals, self._quantile_method
                     )
                 ]
             )
         return None
 
     def _stat_standard_deviation(self) -> StateType:
-        if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+        if len(self.samples) >= 2:
+            return math.sqrt(self.samples.variance)
         return None
 
     def _stat_total(self) -> StateType:
-        if len(self.states) > 0:
-            return sum(self.states)
+        if len(self.samples) > 0:
+            return self.samples.sum
         return None
 
     def _stat_value_max(self) -> StateType:
-        if len(self.states) > 0:
-            return max(self.states)
+        if len(self.samples) > 0:
+            return self.samples.max[0]
         return None
 
     def _stat_value_min(self) -> StateType:
-        if len(self.states) > 0:
-            return min(self.states)
+        if len(self.samples) > 0:
+            return self.samples.min[0]
         return None
 
     def _stat_variance(self) -> StateType:
-        if len(self.states) >= 2:
-            return statistics.variance(self.states)
+        if len(self.samples) >= 2:
+            return self.samples.variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
-        if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
-            age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return 100 / age_range_seconds * on_seconds
+        if len(self.samples) >= 2:
+            return 100 / self.samples.duration * self.samples.step_area
         return None
 
     def _stat_binary_average_timeless(self) -> StateType:
         return self._stat_binary_mean()
 
     def _stat_binary_count(self) -> StateType:
-        return len(self.states)
+        return len(self.samples)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return round(self.samples.sum)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.samples) - round(self.samples.sum)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -745,6 +730,6 @@ class StatisticsSensor(SensorEntity):
         return self._stat_datetime_oldest()
 
     def _stat_binary_mean(self) -> StateType:
-        if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+        if len(self.samples) > 0:
+            return 100.0 / len(self.samples) * round(self.samples.sum)
         return None
@@ -0,0 +1,211 @@
+"""Sliding sample window with incrementally maintained aggregates."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Literal
+
+
+class SampleWindow:
+    """Samples of a statistics sensor with aggregates kept up to date.
+
+    Values and timestamps are stored as floats. Sums, areas and the Welford
+    mean and variance are updated as samples enter and leave the window, the
+    extremes are tracked by monotonic queues and the sorted values are kept by
+    bisection. The running sums are recomputed from the samples once per
+    window length of removals so floating point drift cannot accumulate.
+    """
+
+    def __init__(self, maxlen: int, track_order: bool = False) -> None:
+        """Initialize the window.
+
+        Sorted values are only maintained when track_order is set, they are
+        needed for the median and quantiles.
+        """
+        self.maxlen = maxlen
+        self.values: deque[float] = deque()
+        self.timestamps: deque[float] = deque()
+        self._track_order = track_order
+        self._sorted: list[float] = []
+        # (value, timestamp, sequence) of the candidates for the extremes
+        self._maxima: deque[tuple[float, float, int]] = deque()
+        self._minima: deque[tuple[float, float, int]] = deque()
+        self._first_seq = 0
+        self._next_seq = 0
+        self._removals = 0
+        self._sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._abs_diff_sum = 0.0
+        self._linear_area = 0.0
+        self._step_area = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self.values)
+
+    def append(self, value: float, timestamp: float) -> None:
+        """Add a sample, dropping the oldest one if the window is full."""
+        if len(self.values) >= self.maxlen:
+            self.popleft()
+
+        if self.values:
+            prev_value = self.values[-1]
+            duration = timestamp - self.timestamps[-1]
+            self._abs_diff_sum += abs(value - prev_value)
+            self._linear_area += 0.5 * (value + prev_value) * duration
+            self._step_area += prev_value * duration
+
+        self.values.append(value)
+        self.timestamps.append(timestamp)
+        self._sum += value
+        delta = value - self._mean
+        self._mean += delta / len(self.values)
+        self._m2 += delta * (value - self._mean)
+
+        seq = self._next_seq
+        self._next_seq += 1
+        # Later samples only replace earlier candidates which are strictly
+        # worse so the first occurrence of an extreme is reported
+        while self._maxima and self._maxima[-1][0] < value:
+            self._maxima.pop()
+        self._maxima.append((value, timestamp, seq))
+        while self._minima and self._minima[-1][0] > value:
+            self._minima.pop()
+        self._minima.append((value, timestamp, seq))
+
+        if self._track_order:
+            insort(self._sorted, value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        value = self.values.popleft()
+        timestamp = self.timestamps.popleft()
+        seq = self._first_seq
+        self._first_seq += 1
+
+        if self.values:
+            next_value = self.values[0]
+            duration = self.timestamps[0] - timestamp
+            self._abs_diff_sum -= abs(next_value - value)
+            self._linear_area -= 0.5 * (value + next_value) * duration
+            self._step_area -= value * duration
+
+        self._sum -= value
+        if count := len(self.values):
+            delta = value - self._mean
+            self._mean -= delta / count
+            self._m2 -= delta * (value - self._mean)
+        else:
+            self._mean = self._m2 = 0.0
+
+        if self._maxima[0][2] == seq:
+            self._maxima.popleft()
+        if self._minima[0][2] == seq:
+            self._minima.popleft()
+
+        if self._track_order:
+            del self._sorted[bisect_left(self._sorted, value)]
+
+        self._removals += 1
+        if self._removals >= self.maxlen:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recompute the running sums from the samples."""
+        self._removals = 0
+        self._sum = self._mean = self._m2 = 0.0
+        self._abs_diff_sum = self._linear_area = self._step_area = 0.0
+        prev_value = prev_timestamp = 0.0
+        for count, (value, timestamp) in enumerate(
+            zip(self.values, self.timestamps), 1
+        ):
+            if count > 1:
+                duration = timestamp - prev_timestamp
+                self._abs_diff_sum += abs(value - prev_value)
+                self._linear_area += 0.5 * (value + prev_value) * duration
+                self._step_area += prev_value * duration
+            self._sum += value
+            delta = value - self._mean
+            self._mean += delta / count
+            self._m2 += delta * (value - self._mean)
+            prev_value, prev_timestamp = value, timestamp
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the values."""
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values, the window must not be empty."""
+        return self._sum / len(self.values)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, the window needs at least two samples."""
+        return max(self._m2, 0.0) / (len(self.values) - 1)
+
+    @property
+    def abs_diff_sum(self) -> float:
+        """Return the sum of the absolute differences of consecutive values."""
+        return self._abs_diff_sum
+
+    @property
+    def linear_area(self) -> float:
+        """Return the area under the linearly interpolated values."""
+        return self._linear_area
+
+    @property
+    def step_area(self) -> float:
+        """Return the area under the values held until the next sample."""
+        return self._step_area
+
+    @property
+    def duration(self) -> float:
+        """Return the seconds between the oldest and the newest sample."""
+        return self.timestamps[-1] - self.timestamps[0]
+
+    @property
+    def max(self) -> tuple[float, float]:
+        """Return the first maximum value and its timestamp."""
+        value, timestamp, _ = self._maxima[0]
+        return value, timestamp
+
+    @property
+    def min(self) -> tuple[float, float]:
+        """Return the first minimum value and its timestamp."""
+        value, timestamp, _ = self._minima[0]
+        return value, timestamp
+
+    def median(self) -> float:
+        """Return the median of the values, requires track_order."""
+        data = self._sorted
+        half, odd = divmod(len(data), 2)
+        if odd:
+            return data[half]
+        return (data[half - 1] + data[half]) / 2
+
+    def quantiles(
+        self, intervals: int, method: Literal["exclusive", "inclusive"]
+    ) -> list[float]:
+        """Return the cut points like statistics.quantiles, requires track_order."""
+        data = self._sorted
+        length = len(data)
+        result = []
+        if method == "inclusive":
+            span = length - 1
+            for i in range(1, intervals):
+                j, delta = divmod(i * span, intervals)
+                result.append(
+                    (data[j] * (intervals - delta) + data[j + 1] * delta) / intervals
+                )
+            return result
+        span = length + 1
+        for i in range(1, intervals):
+            j = min(max(i * span // intervals, 1), length - 1)
+            delta = i * span - j * intervals
+            result.append(
+                (data[j - 1] * (intervals - delta) + data[j] * delta) / intervals
+            )
+        return result
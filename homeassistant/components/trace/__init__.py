@@ -16,6 +16,8 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.trace import (
+    TRACE_LEVEL_FULL,
+    TRACE_LEVELS,
     TraceElement,
     script_execution_get,
     trace_id_get,
@@ -28,6 +30,7 @@ import homeassistant.util.uuid as uuid_util
 
 from . import websocket_api
 from .const import (
+    CONF_LEVEL,
     CONF_STORED_TRACES,
     DATA_TRACE,
     DATA_TRACE_STORE,
@@ -44,7 +47,8 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_LEVEL, default=TRACE_LEVEL_FULL): vol.In(TRACE_LEVELS),
 }
 
 
@@ -68,6 +68,7 @@ def async_register_commands(
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_validate_config)
     async_reg(hass, handle_subscribe_entities)
+    async_reg(hass, handle_supported_features)
 
 
 def pong_message(iden: int) -> dict[str, Any]:
@@ -236,35 +237,31 @@ def handle_get_states(
     """Handle get states command."""
     states = _async_get_allowed_states(hass, connection)
 
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.result_message(msg["id"], states)
-    try:
-        connection.send_message(const.JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
-        connection.logger.error(
-            "Unable to serialize to JSON. Bad data found at %s",
-            format_unserializable_data(
-                find_paths_unserializable_data(response, dump=const.JSON_DUMP)
-            ),
-        )
-    del response
-
-    # If we can't serialize, we'll filter out unserializable states
-    serialized = []
+    # Each state is serialized separately and memoized on the state so
+    # we can recover if it blows up due to the state machine containing
+    # unserializable data. This command is required to succeed for the UI
+    # to show.
+    serialized_states = []
     for state in states:
         try:
-            serialized.append(const.JSON_DUMP(state))
+            serialized_states.append(state.as_dict_json())
         except (ValueError, TypeError):
-            # Error is already logged above
-            pass
+            _log_unserializable_state(connection, state)
+
+    connection.send_message(
+        messages.construct_result_message(msg["id"], f"[{','.join(serialized_states)}]")
+    )
 
-    # We now have partially serialized states. Craft some JSON.
-    response2 = const.JSON_DUMP(messages.result_message(msg["id"], ["TO_REPLACE"]))
-    response2 = response2.replace('"TO_REPLACE"', ", ".join(serialized))
-    connection.send_message(response2)
+
+@callback
+def _log_unserializable_state(connection: ActiveConnection, state: State) -> None:
+    """Log the paths to the data of a state that can't be serialized."""
+    connection.logger.error(
+        "Unable to serialize to JSON. Bad data found at %s",
+        format_unserializable_data(
+            find_paths_unserializable_data(state, dump=const.JSON_DUMP)
+        ),
+    )
 
 
 @callback
@@ -279,20 +276,47 @@ def handle_subscribe_entities(
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
+    # entity_id -> (old_state, new_state) of the changes waiting to be sent
+    pending_changes: dict[str, tuple[State | None, State | None]] = {}
 
     @callback
     def forward_entity_changes(event: Event) -> None:
         """Forward entity state changed events to websocket."""
-        if not connection.user.permissions.check_entity(
-            event.data["entity_id"], POLICY_READ
-        ):
+        entity_id: str = event.data["entity_id"]
+        if not connection.user.permissions.check_entity(entity_id, POLICY_READ):
             return
-        if entity_ids and event.data["entity_id"] not in entity_ids:
+        if entity_ids and entity_id not in entity_ids:
             return
 
-        connection.send_message(
-            lambda: messages.cached_state_diff_message(msg["id"], event)
-        )
+        if not connection.can_coalesce:
+            connection.send_message(
+                lambda: messages.cached_state_diff_message(msg["id"], event)
+            )
+            return
+
+        # Successive changes of an entity are merged into a single diff
+        # until the writer gets to the queued message.
+        if not pending_changes:
+            connection.send_message(send_pending_changes)
+        if entity_id in pending_changes:
+            pending_changes[entity_id] = (
+                pending_changes[entity_id][0],
+                event.data["new_state"],
+            )
+        else:
+            pending_changes[entity_id] = (
+                event.data["old_state"],
+                event.data["new_state"],
+            )
+
+    def send_pending_changes() -> str:
+        """Serialize the merged changes that are waiting to be sent."""
+        changes = dict(pending_changes)
+        pending_changes.clear()
+        if not (merged := messages.merged_state_diff(changes)):
+            # Only entities the client never saw were added and removed
+            return ""
+        return messages.message_to_json(messages.event_message(msg["id"], merged))
 
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
@@ -302,42 +326,43 @@ def handle_subscribe_entities(
         EVENT_STATE_CHANGED, forward_entity_changes, run_immediately=True
     )
     connection.send_result(msg["id"])
-    data: dict[str, dict[str, dict]] = {
-        messages.ENTITY_EVENT_ADD: {
-            state.entity_id: messages.compressed_state_dict_add(state)
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
-        }
-    }
-
-    # JSON serialize here so we can recover if it blows up due to the
-    # state machine containing unserializable data. This command is required
-    # to succeed for the UI to show.
-    response = messages.event_message(msg["id"], data)
-    try:
-        connection.send_message(const.JSON_DUMP(response))
-        return
-    except (ValueError, TypeError):
-        connection.logger.error(
-            "Unable to serialize to JSON. Bad data found at %s",
-            format_unserializable_data(
-                find_paths_unserializable_data(response, dump=const.JSON_DUMP)
-            ),
-        )
-    del response
 
-    add_entities = data[messages.ENTITY_EVENT_ADD]
-    cannot_serialize: list[str] = []
-    for entity_id, state_dict in add_entities.items():
+    # Each state is serialized separately and memoized on the state so
+    # we can recover if it blows up due to the state machine containing
+    # unserializable data. This command is required to succeed for the UI
+    # to show.
+    serialized_states = []
+    for state in states:
+        if entity_ids and state.entity_id not in entity_ids:
+            continue
         try:
-            const.JSON_DUMP(state_dict)
+            serialized_states.append(
+                f'"{state.entity_id}":{state.as_compressed_state_json()}'
+            )
         except (ValueError, TypeError):
-            cannot_serialize.append(entity_id)
+            _log_unserializable_state(connection, state)
 
-    for entity_id in cannot_serialize:
-        del add_entities[entity_id]
+    connection.send_message(
+        messages.construct_event_message(
+            msg["id"],
+            f'{{"{messages.ENTITY_EVENT_ADD}":{{{",".join(serialized_states)}}}}}',
+        )
+    )
 
-    connection.send_message(const.JSON_DUMP(messages.event_message(msg["id"], data)))
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): {str: int},
+    }
+)
+def handle_supported_features(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setting supported features."""
+    connection.async_set_supported_features(msg["features"])
+    connection.send_result(msg["id"])
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -42,12 +42,20 @@ class ActiveConnection:
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
+        self.supported_features: dict[str, int] = {}
+        self.can_coalesce = False
         current_connection.set(self)
 
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
         return Context(user_id=self.user.id)
 
+    @callback
+    def async_set_supported_features(self, features: dict[str, int]) -> None:
+        """Set the optional features supported by the client."""
+        self.supported_features = features
+        self.can_coalesce = features.get(const.FEATURE_COALESCE_MESSAGES) == 1
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -18,9 +18,11 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 
 from .auth import AuthPhase, auth_required_message
+from .connection import ActiveConnection
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    MAX_COALESCED_FRAME_SIZE,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -67,21 +69,56 @@ class WebSocketHandler:
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._connection: ActiveConnection | None = None
 
     async def _writer(self) -> None:
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        Clients that opted in to coalescing get the messages that are
+        queued at once as JSON array frames of up to
+        MAX_COALESCED_FRAME_SIZE characters. Queued callables that return
+        an empty string have nothing to send and are skipped.
+        """
+        to_write = self._to_write
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                if (process := await self._to_write.get()) is None:
+                if (process := await to_write.get()) is None:
                     break
 
-                if not isinstance(process, str):
-                    message: str = process()
-                else:
-                    message = process
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                message = process if isinstance(process, str) else process()
+                if not message:
+                    continue
+                if (
+                    to_write.empty()
+                    or self._connection is None
+                    or not self._connection.can_coalesce
+                    or len(message) >= MAX_COALESCED_FRAME_SIZE
+                ):
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    continue
+
+                coalesced = [message]
+                coalesced_size = len(message)
+                closing = False
+                while (
+                    not to_write.empty() and coalesced_size < MAX_COALESCED_FRAME_SIZE
+                ):
+                    if (process := to_write.get_nowait()) is None:
+                        closing = True
+                        break
+                    message = process if isinstance(process, str) else process()
+                    if not message:
+                        continue
+                    coalesced.append(message)
+                    coalesced_size += len(message) + 1
+
+                coalesced_message = f"[{','.join(coalesced)}]"
+                self._logger.debug("Sending %s", coalesced_message)
+                await self.wsock.send_str(coalesced_message)
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -200,7 +237,7 @@ class WebSocketHandler:
                 raise Disconnect from err
 
             self._logger.debug("Received %s", msg_data)
-            connection = await auth.async_handle(msg_data)
+            connection = self._connection = await auth.async_handle(msg_data)
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
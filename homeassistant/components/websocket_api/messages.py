@@ -1,12 +1,20 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import lru_cache
 import logging
 from typing import Any, Final
 
 import voluptuous as vol
 
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
@@ -16,13 +24,6 @@ from homeassistant.util.json import (
 from homeassistant.util.yaml.loader import JSON_TYPE
 
 from . import const
-from .const import (
-    COMPRESSED_STATE_ATTRIBUTES,
-    COMPRESSED_STATE_CONTEXT,
-    COMPRESSED_STATE_LAST_CHANGED,
-    COMPRESSED_STATE_LAST_UPDATED,
-    COMPRESSED_STATE_STATE,
-)
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -51,6 +52,11 @@ def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+def construct_result_message(iden: int, payload: str) -> str:
+    """Construct a success result message JSON from a serialized result."""
+    return f'{{"id":{iden},"type":"{const.TYPE_RESULT}","success":true,"result":{payload}}}'
+
+
 def error_message(iden: int | None, code: str, message: str) -> dict[str, Any]:
     """Return an error result message."""
     return {
@@ -66,6 +72,11 @@ def event_message(iden: JSON_TYPE | int, event: Any) -> dict[str, Any]:
     return {"id": iden, "type": "event", "event": event}
 
 
+def construct_event_message(iden: int, payload: str) -> str:
+    """Construct an event message JSON from a serialized event."""
+    return f'{{"id":{iden},"type":"event","event":{payload}}}'
+
+
 def cached_event_message(iden: int, event: Event) -> str:
     """Return an event message.
 
@@ -134,6 +145,31 @@ def _state_diff_event(event: Event) -> dict:
     return _state_diff(event_old_state, event_new_state)
 
 
+def merged_state_diff(
+    changes: dict[str, tuple[State | None, State | None]]
+) -> dict[str, Any]:
+    """Convert the merged changes of entities to the minimal version.
+
+    The changes map the entity_id to the first old state and the
+    last new state of the changes that were merged.
+    """
+    merged: dict[str, Any] = {}
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            # The client never saw entities added and removed in the window
+            if old_state is not None:
+                merged.setdefault(ENTITY_EVENT_REMOVE, []).append(entity_id)
+        elif old_state is None:
+            merged.setdefault(ENTITY_EVENT_ADD, {})[
+                entity_id
+            ] = compressed_state_dict_add(new_state)
+        else:
+            merged.setdefault(ENTITY_EVENT_CHANGE, {}).update(
+                _state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE]
+            )
+    return merged
+
+
 def _state_diff(
     old_state: State, new_state: State
 ) -> dict[str, dict[str, dict[str, dict[str, str | list[str]]]]]:
@@ -160,6 +196,9 @@ def _state_diff(
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state.context.id
     old_attributes = old_state.attributes
+    # The state machine shares unchanged attributes between states
+    if old_attributes is new_state.attributes:
+        return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
     for key, value in new_state.attributes.items():
         if old_attributes.get(key) != value:
             additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
@@ -168,26 +207,14 @@ def _state_diff(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
-def compressed_state_dict_add(state: State) -> dict[str, Any]:
+def compressed_state_dict_add(state: State) -> Mapping[str, Any]:
     """Build a compressed dict of a state for adds.
 
     Omits the lu (last_updated) if it matches (lc) last_changed.
 
     Sends c (context) as a string if it only contains an id.
     """
-    if state.context.parent_id is None and state.context.user_id is None:
-        context: dict[str, Any] | str = state.context.id
-    else:
-        context = state.context.as_dict()
-    compressed_state: dict[str, Any] = {
-        COMPRESSED_STATE_STATE: state.state,
-        COMPRESSED_STATE_ATTRIBUTES: state.attributes,
-        COMPRESSED_STATE_CONTEXT: context,
-        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
-    }
-    if state.last_changed != state.last_updated:
-        compressed_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
-    return compressed_state
+    return state.as_compressed_state()
 
 
 def message_to_json(message: dict[str, Any]) -> str:
@@ -62,7 +62,7 @@ from .loader import Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from .util.yaml import SECRET_YAML, Secrets, load_yaml
+from .util.yaml import SECRET_YAML, ParseCache, Secrets, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,6 +73,8 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_PARSE_CACHE = "yaml_parse_cache"
+YAML_PARSE_CACHE_FILE = ".storage/core.yaml_parse_cache"
 
 AUTOMATION_CONFIG_PATH = "automations.yaml"
 SCRIPT_CONFIG_PATH = "scripts.yaml"
@@ -336,12 +338,14 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     """Load YAML from a Home Assistant configuration file.
 
     This function allow a component inside the asyncio loop to reload its
-    configuration by itself. Include package merge.
+    configuration by itself. Include package merge. Files are taken from the
+    parse cache when bootstrap has set one up.
     """
     if hass.config.config_dir is None:
         secrets = None
     else:
         secrets = Secrets(Path(hass.config.config_dir))
+    parse_cache: ParseCache | None = hass.data.get(DATA_YAML_PARSE_CACHE)
 
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
@@ -349,6 +353,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         load_yaml_config_file,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        parse_cache,
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
@@ -356,15 +361,22 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    parse_cache: ParseCache | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
+    Files that have not been modified are taken from the parse cache,
+    which is saved once the configuration has been loaded.
+
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    conf_dict = load_yaml(config_path, secrets, parse_cache)
+    if parse_cache is not None:
+        parse_cache.save()
 
     if not isinstance(conf_dict, dict):
         msg = (
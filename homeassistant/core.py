@@ -45,9 +45,15 @@ from . import block_async_io, loader, util
 from .backports.enum import StrEnum
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     CONF_UNIT_SYSTEM_IMPERIAL,
     EVENT_CALL_SERVICE,
     EVENT_CORE_CONFIG_UPDATE,
@@ -79,6 +85,7 @@ from .util.async_ import (
     run_callback_threadsafe,
     shutdown_run_callback_threadsafe,
 )
+from .util.json import json_dumps
 from .util.read_only_dict import ReadOnlyDict
 from .util.timeout import TimeoutManager
 from .util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
@@ -827,15 +834,37 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJob]] = {}
+        # event_type -> entity_id / domain -> listeners
+        self._entity_listeners: dict[str, dict[str, list[_FilterableJob]]] = {}
+        self._domain_listeners: dict[str, dict[str, list[_FilterableJob]]] = {}
         self._hass = hass
 
     @callback
     def async_listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners.
 
+        All keyed listeners of an event type are counted as a single
+        listener since they are dispatched with a single lookup.
+
+        This method must be run in the event loop.
+        """
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type in {*self._entity_listeners, *self._domain_listeners}:
+            listeners[event_type] = listeners.get(event_type, 0) + 1
+        return listeners
+
+    @callback
+    def async_entity_listeners(self, event_type: str) -> dict[str, int]:
+        """Return dictionary with entity ids and the number of keyed listeners.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        return {
+            entity_id: len(listeners)
+            for entity_id, listeners in self._entity_listeners.get(
+                event_type, {}
+            ).items()
+        }
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -885,9 +914,70 @@ class EventBus:
 
         _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
+        if listeners:
+            self._async_run_filterable_jobs(event, listeners)
+
+        if event_data is None or (
+            event_type not in self._entity_listeners
+            and event_type not in self._domain_listeners
+        ):
+            return
+
+        if not isinstance(entity_id := event_data.get(ATTR_ENTITY_ID), str):
             return
 
+        if (
+            (entity_listeners := self._entity_listeners.get(event_type))
+            and entity_id in entity_listeners
+        ) or (
+            (domain_listeners := self._domain_listeners.get(event_type))
+            and (
+                entity_id.partition(".")[0] in domain_listeners
+                or MATCH_ALL in domain_listeners
+            )
+        ):
+            self._hass.loop.call_soon(self._async_run_keyed_jobs, event, entity_id)
+
+    @callback
+    def _async_run_keyed_jobs(self, event: Event, entity_id: str) -> None:
+        """Run the keyed listeners of an entity.
+
+        The listeners are looked up when the event is dispatched, so all
+        keyed listeners of an event run in a single loop iteration and
+        listeners added while earlier events are dispatched are included.
+        """
+        event_type = event.event_type
+        listeners: list[_FilterableJob] = []
+
+        if (entity_listeners := self._entity_listeners.get(event_type)) and (
+            jobs := entity_listeners.get(entity_id)
+        ):
+            listeners.extend(jobs)
+
+        if domain_listeners := self._domain_listeners.get(event_type):
+            if jobs := domain_listeners.get(entity_id.partition(".")[0]):
+                listeners.extend(jobs)
+            if jobs := domain_listeners.get(MATCH_ALL):
+                listeners.extend(jobs)
+
+        for job, event_filter, _ in listeners:
+            if event_filter is not None:
+                try:
+                    if not event_filter(event):
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in event filter")
+                    continue
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def _async_run_filterable_jobs(
+        self, event: Event, listeners: list[_FilterableJob]
+    ) -> None:
+        """Run the listeners whose filter accepts the event."""
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -967,6 +1057,119 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_entity(
+        self,
+        event_type: str,
+        entity_ids: Iterable[str],
+        listener: Callable[[Event], None | Awaitable[None]],
+        event_filter: Callable[[Event], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for specific entity ids.
+
+        The listener is indexed by the ``entity_id`` in the event data, so
+        firing an event only looks up the listeners of that entity instead
+        of running a filter for every listener of event_type.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if the
+        listener callable should run.
+
+        This method must be run in the event loop.
+        """
+        return self._async_listen_keyed(
+            self._entity_listeners,
+            event_type,
+            entity_ids,
+            listener,
+            event_filter,
+        )
+
+    @callback
+    def async_listen_domain(
+        self,
+        event_type: str,
+        domains: Iterable[str],
+        listener: Callable[[Event], None | Awaitable[None]],
+        event_filter: Callable[[Event], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for entities in specific domains.
+
+        The listener is indexed by the domain of the ``entity_id`` in the
+        event data. To listen to entities of every domain specify the
+        constant ``MATCH_ALL`` as domain.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if the
+        listener callable should run.
+
+        This method must be run in the event loop.
+        """
+        return self._async_listen_keyed(
+            self._domain_listeners,
+            event_type,
+            domains,
+            listener,
+            event_filter,
+        )
+
+    @callback
+    def _async_listen_keyed(
+        self,
+        keyed_listeners: dict[str, dict[str, list[_FilterableJob]]],
+        event_type: str,
+        keys: Iterable[str],
+        listener: Callable[[Event], None | Awaitable[None]],
+        event_filter: Callable[[Event], bool] | None,
+    ) -> CALLBACK_TYPE:
+        """Index a listener by keys of an event type."""
+        if event_filter is not None and not is_callback(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+
+        keys = list(keys)
+        filterable_job = _FilterableJob(HassJob(listener), event_filter, False)
+        listeners_by_key = keyed_listeners.setdefault(event_type, {})
+        for key in keys:
+            listeners_by_key.setdefault(key, []).append(filterable_job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(
+                keyed_listeners, event_type, keys, filterable_job
+            )
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        keyed_listeners: dict[str, dict[str, list[_FilterableJob]]],
+        event_type: str,
+        keys: Iterable[str],
+        filterable_job: _FilterableJob,
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            listeners_by_key = keyed_listeners[event_type]
+            for key in keys:
+                listeners = listeners_by_key[key]
+                listeners.remove(filterable_job)
+                if not listeners:
+                    del listeners_by_key[key]
+        except (KeyError, ValueError):
+            # KeyError is key event_type or key listener did not exist
+            # ValueError if listener did not exist within key
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+        else:
+            if not listeners_by_key:
+                del keyed_listeners[event_type]
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None | Awaitable[None]]
     ) -> CALLBACK_TYPE:
@@ -1074,6 +1277,10 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
+        "_as_compressed_state",
+        "_as_compressed_state_json",
+        "_attributes_json",
     ]
 
     def __init__(
@@ -1103,12 +1310,22 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # ReadOnlyDict can't be modified so an unchanged one can be shared
+        # with the previous state instead of being copied.
+        self.attributes = (
+            attributes
+            if isinstance(attributes, ReadOnlyDict)
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
+        self._as_compressed_state: ReadOnlyDict[str, Any] | None = None
+        self._as_compressed_state_json: str | None = None
+        self._attributes_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -1143,6 +1360,62 @@ class State:
             )
         return self._as_dict
 
+    def as_dict_json(self) -> str:
+        """Return a JSON string of the dict representation of the State.
+
+        Async friendly.
+
+        The JSON is serialized once and shared by every consumer.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
+    def as_compressed_state(self) -> ReadOnlyDict[str, Any]:
+        """Build a compressed dict of the State.
+
+        Async friendly.
+
+        Omits the lu (last_updated) if it matches (lc) last_changed.
+
+        Sends c (context) as a string if it only contains an id.
+        """
+        if self._as_compressed_state is None:
+            if self.context.parent_id is None and self.context.user_id is None:
+                context: dict[str, Any] | str = self.context.id
+            else:
+                context = self.context.as_dict()
+            compressed_state: dict[str, Any] = {
+                COMPRESSED_STATE_STATE: self.state,
+                COMPRESSED_STATE_ATTRIBUTES: self.attributes,
+                COMPRESSED_STATE_CONTEXT: context,
+                COMPRESSED_STATE_LAST_CHANGED: self.last_changed.timestamp(),
+            }
+            if self.last_changed != self.last_updated:
+                compressed_state[
+                    COMPRESSED_STATE_LAST_UPDATED
+                ] = self.last_updated.timestamp()
+            self._as_compressed_state = ReadOnlyDict(compressed_state)
+        return self._as_compressed_state
+
+    def as_compressed_state_json(self) -> str:
+        """Return a JSON string of the compressed dict of the State.
+
+        Async friendly.
+        """
+        if self._as_compressed_state_json is None:
+            self._as_compressed_state_json = json_dumps(self.as_compressed_state())
+        return self._as_compressed_state_json
+
+    def attributes_json(self) -> str:
+        """Return a JSON string of the attributes of the State.
+
+        Async friendly.
+        """
+        if self._attributes_json is None:
+            self._attributes_json = json_dumps(self.attributes)
+        return self._attributes_json
+
     @classmethod
     def from_dict(cls: type[_StateT], json_dict: dict[str, Any]) -> _StateT | None:
         """Initialize a state from a dict.
@@ -1220,6 +1493,8 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # domain -> entity_id -> State
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1243,13 +1518,9 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
-        return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
-        ]
+        return [state.entity_id for state in self._async_domain_states(domain_filter)]
 
     @callback
     def async_entity_ids_count(
@@ -1263,10 +1534,11 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        domain_index = self._domain_index
+        return sum(
+            len(domain_index.get(domain, ())) for domain in dict.fromkeys(domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable[str] | None = None) -> list[State]:
@@ -1287,11 +1559,21 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
-        return [
-            state for state in self._states.values() if state.domain in domain_filter
-        ]
+        return list(self._async_domain_states(domain_filter))
+
+    @callback
+    def _async_domain_states(self, domain_filter: Iterable[str]) -> Iterable[State]:
+        """Return the states of the domains in the order they were added."""
+        domain_index = self._domain_index
+        domains = {domain for domain in domain_filter if domain in domain_index}
+        if not domains:
+            return ()
+        if len(domains) == 1:
+            return domain_index[domains.pop()].values()
+        # The domain index can't interleave several domains in insertion order
+        return (state for state in self._states.values() if state.domain in domains)
 
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
@@ -1334,6 +1616,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         old_state.expire()
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
@@ -1409,21 +1696,27 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
-        entity_id = entity_id.lower()
-        new_state = str(new_state)
-        attributes = attributes or {}
+        # Entity ids in the state machine are already lowercase so
+        # only lowercase the entity_id if it is not found as-is.
         if (old_state := self._states.get(entity_id)) is None:
-            same_state = False
-            same_attr = False
+            entity_id = entity_id.lower()
+            old_state = self._states.get(entity_id)
+        if type(new_state) is not str:  # pylint: disable=unidiomatic-typecheck
+            new_state = str(new_state)
+        if attributes is None:
+            attributes = {}
+        if old_state is None:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            old_attributes = old_state.attributes
+            if attributes is old_attributes or old_attributes == attributes:
+                if same_state:
+                    return
+                # Share the unchanged attributes with the new state
+                attributes = old_attributes
             last_changed = old_state.last_changed if same_state else None
 
-        if same_state and same_attr:
-            return
-
         now = dt_util.utcnow()
 
         if context is None:
@@ -1438,8 +1731,13 @@ class StateMachine:
             old_state is None,
         )
         if old_state is not None:
+            if attributes is old_state.attributes:
+                # The shared attributes serialize to the same JSON
+                # pylint: disable-next=protected-access
+                state._attributes_json = old_state._attributes_json
             old_state.expire()
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -59,8 +59,10 @@ from . import config_validation as cv, entity_registry as er
 from .sun import get_astral_event_date
 from .template import Template
 from .trace import (
+    TRACE_LEVEL_OFF,
     TraceElement,
     trace_append_element,
+    trace_level_get,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -115,8 +117,14 @@ def condition_trace_update_result(**kwargs: Any) -> None:
 
 
 @contextmanager
-def trace_condition(variables: TemplateVarsType) -> Generator[TraceElement, None, None]:
+def trace_condition(
+    variables: TemplateVarsType,
+) -> Generator[TraceElement | None, None, None]:
     """Trace condition evaluation."""
+    if trace_level_get() == TRACE_LEVEL_OFF:
+        yield None
+        return
+
     should_pop = True
     trace_element = trace_stack_top(trace_stack_cv)
     if trace_element and trace_element.reuse_by_child:
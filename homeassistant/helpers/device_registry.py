@@ -49,6 +49,9 @@ RUNTIME_ONLY_ATTRS = {"suggested_area"}
 class _DeviceIndex(NamedTuple):
     identifiers: dict[tuple[str, str], str]
     connections: dict[tuple[str, str], str]
+    # The device ids are kept in dicts to preserve the insertion order
+    area_ids: dict[str, dict[str, None]]
+    config_entry_ids: dict[str, dict[str, None]]
 
 
 class DeviceEntryDisabler(StrEnum):
@@ -233,6 +236,26 @@ class DeviceRegistry:
         """Get device."""
         return self.devices.get(device_id)
 
+    @callback
+    def async_get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        return [
+            self.devices[device_id]
+            for device_id in self._registered_index.area_ids.get(area_id, ())
+        ]
+
+    @callback
+    def async_get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        return [
+            self.devices[device_id]
+            for device_id in self._registered_index.config_entry_ids.get(
+                config_entry_id, ()
+            )
+        ]
+
     @callback
     def async_get_device(
         self,
@@ -286,14 +309,23 @@ class DeviceRegistry:
         """Update a device and the index."""
         self.devices[new_device.id] = new_device
 
-        devices_index = self._registered_index
-        _remove_device_from_index(devices_index, old_device)
-        _add_device_to_index(devices_index, new_device)
+        _update_device_in_index(self._registered_index, old_device, new_device)
+
+    def _update_deleted_device(
+        self, old_device: DeletedDeviceEntry, new_device: DeletedDeviceEntry
+    ) -> None:
+        """Update a deleted device and the index."""
+        self.deleted_devices[new_device.id] = new_device
+        _update_device_in_index(self._deleted_index, old_device, new_device)
 
     def _clear_index(self) -> None:
         """Clear the index."""
-        self._registered_index = _DeviceIndex(identifiers={}, connections={})
-        self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._registered_index = _DeviceIndex(
+            identifiers={}, connections={}, area_ids={}, config_entry_ids={}
+        )
+        self._deleted_index = _DeviceIndex(
+            identifiers={}, connections={}, area_ids={}, config_entry_ids={}
+        )
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
@@ -655,23 +687,30 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in self.async_get_devices_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
-        for deleted_device in list(self.deleted_devices.values()):
+        for device_id in list(
+            self._deleted_index.config_entry_ids.get(config_entry_id, ())
+        ):
+            deleted_device = self.deleted_devices[device_id]
             config_entries = deleted_device.config_entries
-            if config_entry_id not in config_entries:
-                continue
             if config_entries == {config_entry_id}:
                 # Add a time stamp when the deleted device became orphaned
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, orphaned_timestamp=now_time, config_entries=set()
+                self._update_deleted_device(
+                    deleted_device,
+                    attr.evolve(
+                        deleted_device,
+                        orphaned_timestamp=now_time,
+                        config_entries=set(),
+                    ),
                 )
             else:
-                config_entries = config_entries - {config_entry_id}
-                # No need to reindex here since we currently
-                # do not have a lookup by config entry
-                self.deleted_devices[deleted_device.id] = attr.evolve(
-                    deleted_device, config_entries=config_entries
+                self._update_deleted_device(
+                    deleted_device,
+                    attr.evolve(
+                        deleted_device,
+                        config_entries=config_entries - {config_entry_id},
+                    ),
                 )
             self.async_schedule_save()
 
@@ -696,9 +735,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in self.async_get_devices_for_area_id(area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -729,7 +767,7 @@ async def async_get_registry(hass: HomeAssistant) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.async_get_devices_for_area_id(area_id)
 
 
 @callback
@@ -737,11 +775,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.async_get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -889,6 +923,10 @@ def _add_device_to_index(
         devices_index.identifiers[identifier] = device.id
     for connection in device.connections:
         devices_index.connections[connection] = device.id
+    if isinstance(device, DeviceEntry) and device.area_id is not None:
+        devices_index.area_ids.setdefault(device.area_id, {})[device.id] = None
+    for config_entry_id in device.config_entries:
+        devices_index.config_entry_ids.setdefault(config_entry_id, {})[device.id] = None
 
 
 def _remove_device_from_index(
@@ -902,3 +940,60 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index.connections:
             del devices_index.connections[connection]
+    if isinstance(device, DeviceEntry) and device.area_id is not None:
+        _remove_device_id_from_index(devices_index.area_ids, device.area_id, device.id)
+    for config_entry_id in device.config_entries:
+        _remove_device_id_from_index(
+            devices_index.config_entry_ids, config_entry_id, device.id
+        )
+
+
+def _update_device_in_index(
+    devices_index: _DeviceIndex,
+    old_device: DeviceEntry | DeletedDeviceEntry,
+    new_device: DeviceEntry | DeletedDeviceEntry,
+) -> None:
+    """Update a device in the index.
+
+    The area and config entry indexes are only touched when they change
+    to keep the devices in the order they were added.
+    """
+    for identifier in old_device.identifiers:
+        if identifier in devices_index.identifiers:
+            del devices_index.identifiers[identifier]
+    for connection in old_device.connections:
+        if connection in devices_index.connections:
+            del devices_index.connections[connection]
+    for identifier in new_device.identifiers:
+        devices_index.identifiers[identifier] = new_device.id
+    for connection in new_device.connections:
+        devices_index.connections[connection] = new_device.id
+    if isinstance(old_device, DeviceEntry) and isinstance(new_device, DeviceEntry):
+        if old_device.area_id != new_device.area_id:
+            if old_device.area_id is not None:
+                _remove_device_id_from_index(
+                    devices_index.area_ids, old_device.area_id, old_device.id
+                )
+            if new_device.area_id is not None:
+                devices_index.area_ids.setdefault(new_device.area_id, {})[
+                    new_device.id
+                ] = None
+    for config_entry_id in old_device.config_entries - new_device.config_entries:
+        _remove_device_id_from_index(
+            devices_index.config_entry_ids, config_entry_id, old_device.id
+        )
+    for config_entry_id in new_device.config_entries - old_device.config_entries:
+        devices_index.config_entry_ids.setdefault(config_entry_id, {})[
+            new_device.id
+        ] = None
+
+
+def _remove_device_id_from_index(
+    index: dict[str, dict[str, None]], key: str, device_id: str
+) -> None:
+    """Remove a device id from an area or config entry index."""
+    if (device_ids := index.get(key)) is None:
+        return
+    device_ids.pop(device_id, None)
+    if not device_ids:
+        del index[key]
@@ -4,11 +4,14 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Callable, Coroutine, Iterable
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from logging import Logger, getLogger
+from functools import partial
+from logging import DEBUG, Logger, getLogger
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Protocol
 from urllib.parse import urlparse
+import zlib
 
 import voluptuous as vol
 
@@ -58,6 +61,9 @@ SLOW_ADD_MIN_TIMEOUT = 500
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+DATA_POLLING_SCHEDULER = "entity_platform_polling_scheduler"
+MAX_PARALLEL_POLLING_UPDATES = 32
+POLLING_STATS_LOG_INTERVAL = timedelta(minutes=10)
 
 _LOGGER = getLogger(__name__)
 
@@ -102,9 +108,12 @@ class EntityPlatform:
         self._async_unsub_polling: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
+        self.polling_stats = PollingStats()
 
         self.parallel_updates: asyncio.Semaphore | None = None
+        # Limits the polls of the platform to its parallel updates before they
+        # take one of the polling updates shared by all platforms
+        self.parallel_polls: asyncio.Semaphore | None = None
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
@@ -146,6 +155,7 @@ class EntityPlatform:
 
         if parallel_updates is not None:
             self.parallel_updates = asyncio.Semaphore(parallel_updates)
+            self.parallel_polls = asyncio.Semaphore(parallel_updates)
 
         return self.parallel_updates
 
@@ -395,18 +405,14 @@ class EntityPlatform:
             )
             raise
 
-        if (
-            (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_unsub_polling is not None
-            or not any(entity.should_poll for entity in self.entities.values())
+        if (self.config_entry and self.config_entry.pref_disable_polling) or not any(
+            entity.should_poll for entity in self.entities.values()
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-        )
+        self._async_unsub_polling = async_get_polling_scheduler(
+            self.hass
+        ).async_poll_platform(self)
 
     async def _async_add_entity(  # noqa: C901
         self,
@@ -710,34 +716,170 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+@dataclass
+class PollingStats:
+    """Statistics of the polling updates of the entities of a platform."""
 
-        This method must be run in the event loop.
-        """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
+    updates: int = 0
+    overruns: int = 0
+    total_duration: float = 0
+    max_duration: float = 0
+
+    @property
+    def average_duration(self) -> float:
+        """Return the average duration of an update."""
+        return self.total_duration / self.updates if self.updates else 0
+
+    @callback
+    def async_add_update(self, duration: float) -> None:
+        """Add the duration of an update."""
+        self.updates += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+
+def _polling_offset(entity_id: str, interval: float) -> float:
+    """Return the offset of the polls of an entity within the scan interval.
+
+    The offset is derived from the entity id so it is the same every run.
+    """
+    return interval * (1 - zlib.crc32(entity_id.encode()) / 2**32)
+
+
+class PollingScheduler:
+    """Poll the entities of all entity platforms.
+
+    Every entity is polled each scan interval of its platform at a fixed
+    offset within the interval, so the entities of platforms with the same
+    scan interval don't all update at once. Updates are limited to
+    MAX_PARALLEL_POLLING_UPDATES at a time across all platforms, on top of
+    the parallel updates of each platform. The polling statistics of the
+    platforms are logged at debug level every POLLING_STATS_LOG_INTERVAL.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self._semaphore = asyncio.Semaphore(MAX_PARALLEL_POLLING_UPDATES)
+        self._handles: dict[EntityPlatform, dict[str, asyncio.TimerHandle]] = {}
+        self._updating: set[str] = set()
+        self._unsub_log_stats: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_poll_platform(self, platform: EntityPlatform) -> CALLBACK_TYPE:
+        """Start polling the entities of a platform that are not polled yet."""
+        if self._unsub_log_stats is None:
+            self._unsub_log_stats = async_track_time_interval(
+                self.hass, self._async_log_stats, POLLING_STATS_LOG_INTERVAL
             )
+        handles = self._handles.setdefault(platform, {})
+        interval = platform.scan_interval.total_seconds()
+        now = self.hass.loop.time()
+        for entity_id in platform.entities:
+            if entity_id not in handles:
+                self._async_schedule(
+                    platform, entity_id, now + _polling_offset(entity_id, interval)
+                )
+        return partial(self.async_stop_polling, platform)
+
+    @callback
+    def async_stop_polling(self, platform: EntityPlatform) -> None:
+        """Stop polling the entities of a platform."""
+        for handle in self._handles.pop(platform, {}).values():
+            handle.cancel()
+        if not self._handles and self._unsub_log_stats is not None:
+            self._unsub_log_stats()
+            self._unsub_log_stats = None
+
+    @callback
+    def _async_log_stats(self, _now: datetime) -> None:
+        """Log the polling statistics of the polled platforms."""
+        if not _LOGGER.isEnabledFor(DEBUG):
             return
+        for platform in self._handles:
+            stats = platform.polling_stats
+            _LOGGER.debug(
+                "Polling %s %s: %s updates, average %.3f seconds, "
+                "max %.3f seconds, %s overruns",
+                platform.platform_name,
+                platform.domain,
+                stats.updates,
+                stats.average_duration,
+                stats.max_duration,
+                stats.overruns,
+            )
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+    @callback
+    def _async_schedule(
+        self, platform: EntityPlatform, entity_id: str, when: float
+    ) -> None:
+        """Schedule the next poll of an entity."""
+        self._handles[platform][entity_id] = self.hass.loop.call_at(
+            when, self._async_poll, platform, entity_id, when
+        )
 
-            if tasks:
-                await asyncio.gather(*tasks)
+    @callback
+    def _async_poll(
+        self, platform: EntityPlatform, entity_id: str, when: float
+    ) -> None:
+        """Poll an entity and schedule its next poll."""
+        if (entity := platform.entities.get(entity_id)) is None:
+            del self._handles[platform][entity_id]
+            return
+
+        self._async_schedule(
+            platform, entity_id, when + platform.scan_interval.total_seconds()
+        )
+
+        if not entity.should_poll:
+            return
+
+        if entity_id in self._updating:
+            platform.polling_stats.overruns += 1
+            platform.logger.warning(
+                "Updating %s took longer than the scheduled update interval %s",
+                entity_id,
+                platform.scan_interval,
+            )
+            return
+
+        self._updating.add(entity_id)
+        self.hass.async_create_task(self._async_update(platform, entity_id, entity))
+
+    async def _async_update(
+        self, platform: EntityPlatform, entity_id: str, entity: Entity
+    ) -> None:
+        """Update the state of a polling entity.
+
+        The update waits for a parallel update of its platform before it
+        takes a polling update, so the polls of a platform that updates one
+        entity at a time don't hold the polling updates of other platforms.
+        """
+        parallel_polls = platform.parallel_polls
+        try:
+            if parallel_polls is not None:
+                await parallel_polls.acquire()
+            try:
+                async with self._semaphore:
+                    start = self.hass.loop.time()
+                    await entity.async_update_ha_state(True)
+                    platform.polling_stats.async_add_update(
+                        self.hass.loop.time() - start
+                    )
+            finally:
+                if parallel_polls is not None:
+                    parallel_polls.release()
+        finally:
+            self._updating.discard(entity_id)
+
+
+@callback
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Get the polling scheduler."""
+    if (scheduler := hass.data.get(DATA_POLLING_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POLLING_SCHEDULER] = PollingScheduler(hass)
+    return scheduler  # type: ignore[no-any-return]
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
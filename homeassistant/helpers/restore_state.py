@@ -8,7 +8,13 @@ import logging
 from typing import Any, TypeVar, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
+from homeassistant.core import (
+    CoreState,
+    HomeAssistant,
+    State,
+    callback,
+    valid_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
@@ -17,7 +23,7 @@ from .entity import Entity
 from .event import async_track_time_interval
 from .json import JSONEncoder
 from .singleton import singleton
-from .storage import Store
+from .storage import Journal, Store
 
 DATA_RESTORE_STATE_TASK = "restore_state_task"
 
@@ -25,10 +31,15 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+JOURNAL_STORAGE_KEY = "core.restore_state_journal"
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between rewriting all states, which refreshes when the entities of
+# unchanged states were last seen
+STATE_COMPACT_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -111,6 +122,15 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
+        try:
+            journal = await data.journal.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading the journal of last states", exc_info=exc)
+            journal = []
+
+        if journal:
+            stored_states = _apply_journal(stored_states or [], journal)
+
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
             data.last_states = {}
@@ -132,9 +152,9 @@ class RestoreStateData:
 
     @classmethod
     async def async_save_persistent_states(cls, hass: HomeAssistant) -> None:
-        """Dump states now."""
+        """Dump all states now."""
         data = await cls.async_get_instance(hass)
-        await data.async_dump_states()
+        await data.async_dump_states(compact=True)
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
@@ -142,8 +162,15 @@ class RestoreStateData:
         self.store: Store = Store(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.journal = Journal(hass, JOURNAL_STORAGE_KEY)
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state and extra data of every entity as last dumped
+        self._dumped: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        self._dumped_count = 0
+        self._journal_count = 0
+        self._last_compact: datetime | None = None
+        self._dump_lock = asyncio.Lock()
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -189,18 +216,103 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    async def async_dump_states(self, compact: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        Only the states that changed since the last dump are appended to the
+        journal. All states are saved and the journal is cleared on the first
+        dump, when asked to compact, every STATE_COMPACT_INTERVAL and when the
+        journal holds more records than half the states.
+        """
+        async with self._dump_lock:
+            now = dt_util.utcnow()
+            stored_states = self.async_get_stored_states()
+            if (
+                compact
+                or self._last_compact is None
+                or now - self._last_compact >= STATE_COMPACT_INTERVAL
+                or self._journal_count * 2 > self._dumped_count
+            ):
+                await self._async_compact(stored_states, now)
+            else:
+                await self._async_append_changes(stored_states, now)
+
+    async def _async_compact(
+        self, stored_states: list[StoredState], now: datetime
+    ) -> None:
+        """Save all states and clear the journal."""
         _LOGGER.debug("Dumping states")
+        dumped = {
+            stored_state.state.entity_id: _dumped_state(stored_state)
+            for stored_state in stored_states
+        }
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._dumped = dumped
+        self._dumped_count = len(dumped)
+        self._last_compact = now
+        # While stopping the states are saved at the final write, the records
+        # of the journal that are older than the saved states are skipped
+        # when loading.
+        if self.hass.state == CoreState.stopping:
+            return
+        try:
+            await self.journal.async_remove()
+        except OSError as exc:
+            _LOGGER.error("Error removing the journal of states", exc_info=exc)
+            return
+        self._journal_count = 0
+
+    async def _async_append_changes(
+        self, stored_states: list[StoredState], now: datetime
+    ) -> None:
+        """Append the states that changed since the last dump to the journal."""
+        dumped: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        records: list[dict[str, Any]] = []
+        for stored_state in stored_states:
+            entity_id = stored_state.state.entity_id
+            dumped[entity_id] = dumped_state = _dumped_state(stored_state)
+            last_dumped = self._dumped.get(entity_id)
+            if (
+                last_dumped is not None
+                and last_dumped[0] is dumped_state[0]
+                and last_dumped[1] == dumped_state[1]
+            ):
+                continue
+            records.append(
+                {
+                    "entity_id": entity_id,
+                    "stored_state": {
+                        "state": stored_state.state.as_dict(),
+                        "extra_data": dumped_state[1],
+                        "last_seen": stored_state.last_seen,
+                    },
+                    "time": now,
+                }
+            )
+        records.extend(
+            {"entity_id": entity_id, "stored_state": None, "time": now}
+            for entity_id in self._dumped.keys() - dumped.keys()
+        )
+
+        if not records:
+            return
+
+        _LOGGER.debug("Appending %s changed states to the journal", len(records))
+        try:
+            await self.journal.async_append(records)
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._dumped = dumped
+        self._journal_count += len(records)
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -221,7 +333,7 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_states(compact=True)
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -254,6 +366,41 @@ class RestoreStateData:
         self.entities.pop(entity_id)
 
 
+def _dumped_state(
+    stored_state: StoredState,
+) -> tuple[State, dict[str, Any] | None]:
+    """Return what is compared to find the states that changed since a dump.
+
+    The state machine replaces the State object of an entity when it
+    changes, so unchanged states are found by identity.
+    """
+    extra_data = stored_state.extra_data
+    return (stored_state.state, extra_data.as_dict() if extra_data else None)
+
+
+def _apply_journal(
+    stored_states: list[dict[str, Any]], journal: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Apply the records of the journal to the stored states.
+
+    Records that are not newer than the stored state of their entity were
+    appended before all states were last saved and are skipped.
+    """
+    states = {item["state"]["entity_id"]: item for item in stored_states}
+    for record in journal:
+        entity_id = record["entity_id"]
+        if (item := states.get(entity_id)) is not None:
+            last_seen = dt_util.parse_datetime(item["last_seen"])
+            record_time = dt_util.parse_datetime(record["time"])
+            if last_seen and record_time and record_time <= last_seen:
+                continue
+        if record["stored_state"] is None:
+            states.pop(entity_id, None)
+        else:
+            states[entity_id] = record["stored_state"]
+    return list(states.values())
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
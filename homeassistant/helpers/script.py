@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager, suppress
 from contextvars import ContextVar
 from copy import copy
@@ -11,7 +11,7 @@ from functools import partial
 import itertools
 import logging
 from types import MappingProxyType
-from typing import Any, TypedDict, Union, cast
+from typing import Any, NamedTuple, TypedDict, Union, cast
 
 import async_timeout
 import voluptuous as vol
@@ -77,11 +77,14 @@ from .dispatcher import async_dispatcher_connect, async_dispatcher_send
 from .event import async_call_later, async_track_template
 from .script_variables import ScriptVariables
 from .trace import (
+    TRACE_LEVEL_FULL,
+    TRACE_LEVEL_OFF,
     TraceElement,
     async_trace_path,
     script_execution_set,
     trace_append_element,
     trace_id_get,
+    trace_level_get,
     trace_path,
     trace_path_get,
     trace_path_stack_cv,
@@ -152,12 +155,16 @@ def action_trace_append(variables, path):
 @asynccontextmanager
 async def trace_action(hass, script_run, stop, variables):
     """Trace action execution."""
+    if (trace_level := trace_level_get()) == TRACE_LEVEL_OFF:
+        yield None
+        return
+
     path = trace_path_get()
     trace_element = action_trace_append(variables, path)
     trace_stack_push(trace_stack_cv, trace_element)
 
-    trace_id = trace_id_get()
-    if trace_id:
+    # Breakpoints are only checked in full traces
+    if trace_level == TRACE_LEVEL_FULL and (trace_id := trace_id_get()):
         key = trace_id[0]
         run_id = trace_id[1]
         breakpoints = hass.data[DATA_SCRIPT_BREAKPOINTS]
@@ -398,11 +405,13 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            # pylint: disable-next=protected-access
+            for self._step, step in enumerate(self._script._steps):
+                self._action = step.action
                 if self._stop.is_set():
                     script_execution_set("cancelled")
                     break
-                await self._async_step(log_exceptions=False)
+                await self._async_step(step, log_exceptions=False)
             else:
                 script_execution_set("finished")
         except _AbortScript:
@@ -425,29 +434,27 @@ class _ScriptRun:
             script_stack.pop()
             self._finish()
 
-    async def _async_step(self, log_exceptions):
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
-
-        with trace_path(str(self._step)):
+    async def _async_step(self, step: _ScriptStep, log_exceptions: bool) -> None:
+        with trace_path(step.path):
             async with trace_action(self._hass, self, self._stop, self._variables):
                 if self._stop.is_set():
                     return
 
-                action = cv.determine_script_action(self._action)
-
-                if not self._action.get(CONF_ENABLED, True):
+                if not step.enabled:
                     self._log(
-                        "Skipped disabled step %s", self._action.get(CONF_ALIAS, action)
+                        "Skipped disabled step %s",
+                        step.action.get(CONF_ALIAS, step.action_type),
                     )
                     trace_set_result(enabled=False)
                     return
 
                 try:
-                    handler = f"_async_{action}_step"
-                    await getattr(self, handler)()
+                    await step.handler(self)
                 except Exception as ex:  # pylint: disable=broad-except
                     self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
+                        ex,
+                        step.continue_on_error,
+                        self._log_exceptions or log_exceptions,
                     )
 
     def _finish(self) -> None:
@@ -1070,6 +1077,30 @@ class _QueuedScriptRun(_ScriptRun):
         super()._finish()
 
 
+class _ScriptStep(NamedTuple):
+    """A step of a script sequence compiled to the handler of its action."""
+
+    action: dict[str, Any]
+    action_type: str
+    handler: Callable[[_ScriptRun], Awaitable[None]]
+    path: str
+    enabled: bool
+    continue_on_error: bool
+
+
+def _compile_step(index: int, action: dict[str, Any]) -> _ScriptStep:
+    """Compile a step of a script sequence."""
+    action_type = cv.determine_script_action(action)
+    return _ScriptStep(
+        action,
+        action_type,
+        getattr(_ScriptRun, f"_async_{action_type}_step"),
+        str(index),
+        action.get(CONF_ENABLED, True),
+        action.get(CONF_CONTINUE_ON_ERROR, False),
+    )
+
+
 async def _async_stop_scripts_after_shutdown(hass, point_in_time):
     """Stop running Script objects started after shutdown."""
     hass.data[DATA_NEW_SCRIPT_RUNS_NOT_ALLOWED] = None
@@ -1176,6 +1207,9 @@ class Script:
         self._hass = hass
         self.sequence = sequence
         template.attach(hass, self.sequence)
+        self._steps = [
+            _compile_step(index, action) for index, action in enumerate(sequence)
+        ]
         self.name = name
         self.domain = domain
         self.running_description = running_description or f"{domain} script"
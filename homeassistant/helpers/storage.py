@@ -11,11 +11,16 @@ import logging
 import os
 from typing import Any
 
+import orjson
+
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 
+from .json import json_bytes
+
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
 
@@ -303,3 +308,79 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+
+class Journal:
+    """Class to help appending records to a file in storage.
+
+    Records are stored as one JSON document per line, so new records are
+    appended without rewriting the records that are already stored.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize journal class."""
+        self.key = key
+        self.hass = hass
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def path(self):
+        """Return the journal path."""
+        return self.hass.config.path(STORAGE_DIR, self.key)
+
+    async def async_load(self) -> list[Any]:
+        """Load the records."""
+        return await self.hass.async_add_executor_job(self._load_records, self.path)
+
+    async def async_append(self, records: list[Any]) -> None:
+        """Append records."""
+        async with self._write_lock:
+            await self.hass.async_add_executor_job(
+                self._append_records, self.path, records
+            )
+
+    async def async_remove(self) -> None:
+        """Remove all records."""
+        async with self._write_lock:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.path)
+
+    def _load_records(self, path: str) -> list[Any]:
+        """Load the records."""
+        try:
+            with open(path, "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return []
+        except OSError as err:
+            _LOGGER.exception("Journal reading failed: %s", path)
+            raise HomeAssistantError(err) from err
+
+        records = []
+        for line in lines:
+            if not line:
+                continue
+            try:
+                records.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                # A record may be cut short if writing it was interrupted
+                _LOGGER.warning("Skipping invalid record in %s", path)
+        return records
+
+    def _append_records(self, path: str, records: list[Any]) -> None:
+        """Append the records."""
+        try:
+            # Start on a new line in case the last append was cut short
+            data = b"".join(b"\n" + json_bytes(record) for record in records)
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}: {err}"
+            ) from err
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _LOGGER.debug("Appending %s records for %s to %s", len(records), self.key, path)
+        try:
+            with open(path, "ab") as fdesc:
+                fdesc.write(data + b"\n")
+        except OSError as err:
+            raise json_util.WriteError(err) from err
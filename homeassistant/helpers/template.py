@@ -9,7 +9,7 @@ from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 import json
 import logging
 import math
@@ -24,7 +24,7 @@ from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
 import jinja2
-from jinja2 import pass_context, pass_environment
+from jinja2 import nodes, pass_context, pass_environment
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
 import voluptuous as vol
@@ -90,6 +90,25 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "name",
 }
 
+# Compiled patterns of the regex filters and tests
+REGEX_CACHE_SIZE = 256
+_regex_cache = lru_cache(maxsize=REGEX_CACHE_SIZE)(re.compile)
+# Patterns that are literal in a template are compiled when the template is
+# compiled and kept alive by the templates that use them
+_literal_regex: weakref.WeakValueDictionary[
+    tuple[str, int], re.Pattern
+] = weakref.WeakValueDictionary()
+# Position of the ignorecase argument of the regex filters and tests
+_REGEX_IGNORECASE_ARG = {
+    "regex_match": 1,
+    "regex_replace": 2,
+    "regex_search": 1,
+    "regex_findall": 1,
+    "regex_findall_index": 2,
+    "match": 1,
+    "search": 1,
+}
+
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
 DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 
@@ -314,6 +333,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_regex_patterns",
         "_exc_info",
         "_limited",
         "_strict",
@@ -327,6 +347,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code = None
         self._compiled: jinja2.Template | None = None
+        self._regex_patterns: list[re.Pattern] = []
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info = None
@@ -604,6 +625,7 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        self._regex_patterns = _compile_literal_regex_patterns(env, self.template)
 
         return self._compiled
 
@@ -1646,12 +1668,68 @@ def is_number(value):
     return True
 
 
+def _compile_regex(find: str, flags: int) -> re.Pattern:
+    """Return the compiled pattern of a regex filter or test."""
+    if (pattern := _literal_regex.get((find, flags))) is not None:
+        return pattern
+    return _regex_cache(find, flags)
+
+
+def _compile_literal_regex_patterns(
+    env: TemplateEnvironment, source: str
+) -> list[re.Pattern]:
+    """Compile the patterns that are literal in the regex filters and tests."""
+    if "regex_" not in source and "match" not in source and "search" not in source:
+        return []
+
+    patterns = []
+    for node in env.parse(source).find_all((nodes.Filter, nodes.Test)):
+        if (ignorecase_arg := _REGEX_IGNORECASE_ARG.get(node.name)) is None:
+            continue
+        args = dict(enumerate(node.args))
+        args.update(
+            (ignorecase_arg if kwarg.key == "ignorecase" else kwarg.key, kwarg.value)
+            for kwarg in node.kwargs
+            if kwarg.key in ("find", "ignorecase")
+        )
+        find = args.get(0, args.get("find"))
+        ignorecase = args.get(ignorecase_arg, nodes.Const(False))
+        if not (
+            isinstance(find, nodes.Const)
+            and isinstance(find.value, str)
+            and isinstance(ignorecase, nodes.Const)
+        ):
+            continue
+        key = (find.value, re.I if ignorecase.value else 0)
+        if (pattern := _literal_regex.get(key)) is None:
+            try:
+                pattern = re.compile(*key)
+            except re.error:
+                # The error is raised when the template is rendered
+                continue
+            _literal_regex[key] = pattern
+        patterns.append(pattern)
+    return patterns
+
+
+def regex_cache_info() -> dict[str, int]:
+    """Return the metrics of the compiled patterns of the regex filters."""
+    cache_info = _regex_cache.cache_info()
+    return {
+        "hits": cache_info.hits,
+        "misses": cache_info.misses,
+        "maxsize": REGEX_CACHE_SIZE,
+        "currsize": cache_info.currsize,
+        "literal": len(_literal_regex),
+    }
+
+
 def regex_match(value, find="", ignorecase=False):
     """Match value using regex."""
     if not isinstance(value, str):
         value = str(value)
     flags = re.I if ignorecase else 0
-    return bool(re.match(find, value, flags))
+    return bool(_compile_regex(find, flags).match(value))
 
 
 def regex_replace(value="", find="", replace="", ignorecase=False):
@@ -1659,8 +1737,7 @@ def regex_replace(value="", find="", replace="", ignorecase=False):
     if not isinstance(value, str):
         value = str(value)
     flags = re.I if ignorecase else 0
-    regex = re.compile(find, flags)
-    return regex.sub(replace, value)
+    return _compile_regex(find, flags).sub(replace, value)
 
 
 def regex_search(value, find="", ignorecase=False):
@@ -1668,7 +1745,7 @@ def regex_search(value, find="", ignorecase=False):
     if not isinstance(value, str):
         value = str(value)
     flags = re.I if ignorecase else 0
-    return bool(re.search(find, value, flags))
+    return bool(_compile_regex(find, flags).search(value))
 
 
 def regex_findall_index(value, find="", index=0, ignorecase=False):
@@ -1681,7 +1758,7 @@ def regex_findall(value, find="", ignorecase=False):
     if not isinstance(value, str):
         value = str(value)
     flags = re.I if ignorecase else 0
-    return re.findall(find, value, flags)
+    return _compile_regex(find, flags).findall(value)
 
 
 def bitwise_and(first_value, second_value):
@@ -12,6 +12,11 @@ import homeassistant.util.dt as dt_util
 
 from .typing import TemplateVarsType
 
+TRACE_LEVEL_OFF = "off"
+TRACE_LEVEL_SUMMARY = "summary"
+TRACE_LEVEL_FULL = "full"
+TRACE_LEVELS = [TRACE_LEVEL_OFF, TRACE_LEVEL_SUMMARY, TRACE_LEVEL_FULL]
+
 
 class TraceElement:
     """Container for trace data."""
@@ -25,6 +30,11 @@ class TraceElement:
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
+        self._variables: dict[str, Any] = {}
+
+        # Changed variables are only recorded in full traces
+        if trace_level_cv.get() != TRACE_LEVEL_FULL:
+            return
 
         if variables is None:
             variables = {}
@@ -101,6 +111,8 @@ trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
 )
+# Level of detail of the current trace
+trace_level_cv: ContextVar[str] = ContextVar("trace_level_cv", default=TRACE_LEVEL_FULL)
 
 
 def trace_id_set(trace_id: tuple[str, str]) -> None:
@@ -113,6 +125,16 @@ def trace_id_get() -> tuple[str, str] | None:
     return trace_id_cv.get()
 
 
+def trace_level_get() -> str:
+    """Return the level of detail of the current trace.
+
+    Actions and conditions are not traced at level off. At level summary
+    they are traced without their changed variables and breakpoints are
+    not checked.
+    """
+    return trace_level_cv.get()
+
+
 def trace_stack_push(trace_stack_var: ContextVar, node: Any) -> None:
     """Push an element to the top of a trace stack."""
     if (trace_stack := trace_stack_var.get()) is None:
@@ -193,14 +215,14 @@ def trace_set_child_id(child_key: str, child_run_id: str) -> None:
 
 def trace_set_result(**kwargs: Any) -> None:
     """Set the result of TraceElement at the top of the stack."""
-    node = cast(TraceElement, trace_stack_top(trace_stack_cv))
-    node.set_result(**kwargs)
+    if node := cast(TraceElement, trace_stack_top(trace_stack_cv)):
+        node.set_result(**kwargs)
 
 
 def trace_update_result(**kwargs: Any) -> None:
     """Update the result of TraceElement at the top of the stack."""
-    node = cast(TraceElement, trace_stack_top(trace_stack_cv))
-    node.update_result(**kwargs)
+    if node := cast(TraceElement, trace_stack_top(trace_stack_cv)):
+        node.update_result(**kwargs)
 
 
 class StopReason:
@@ -7,12 +7,13 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from contextlib import suppress
 import functools as ft
 import importlib
 import json
 import logging
+import os
 import pathlib
 import sys
 from types import ModuleType
@@ -24,13 +25,14 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from .const import __version__
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.dhcp import DHCP
 from .generated.mqtt import MQTT
 from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
-from .util.async_ import gather_with_concurrency
+from .util.file import WriteError, write_utf8_file
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -43,6 +45,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -52,6 +55,11 @@ CUSTOM_WARNING = (
     "experience issues with Home Assistant"
 )
 
+# Version of the layout of the manifest index and the custom manifest cache
+MANIFEST_INDEX_VERSION = 1
+MANIFEST_INDEX_PATH = pathlib.Path(__file__).parent / "generated" / "manifests.json"
+CUSTOM_MANIFEST_CACHE = ".storage/core.custom_manifests"
+
 _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular dependency
 
 MAX_LOAD_CONCURRENTLY = 4
@@ -132,34 +140,120 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
-        return [
-            entry
-            for path in paths
-            for entry in pathlib.Path(path).iterdir()
-            if entry.is_dir()
-        ]
-
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+    return await hass.async_add_executor_job(
+        _resolve_custom_integrations, hass, custom_components
     )
 
-    integrations = await gather_with_concurrency(
-        MAX_LOAD_CONCURRENTLY,
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        ),
-    )
 
-    return {
-        integration.domain: integration
-        for integration in integrations
-        if integration is not None
-    }
+def _resolve_custom_integrations(
+    hass: HomeAssistant, custom_components: ModuleType
+) -> dict[str, Integration]:
+    """Resolve all custom integrations.
+
+    Manifests that have not been modified since they were last read are
+    taken from the custom manifest cache instead of being parsed again.
+    """
+    cache_path = hass.config.path(CUSTOM_MANIFEST_CACHE)
+    cached = _load_custom_manifest_cache(cache_path)
+    manifests: dict[str, dict[str, Any]] = {}
+    seen: set[str] = set()
+    integrations: dict[str, Integration] = {}
+
+    for base in custom_components.__path__:
+        for entry in pathlib.Path(base).iterdir():
+            if entry.name in seen or not entry.is_dir():
+                continue
+            manifest_path = entry / "manifest.json"
+            try:
+                mtime = manifest_path.stat().st_mtime_ns
+            except OSError:
+                continue
+
+            key = str(manifest_path)
+            if (hit := cached.get(key)) is not None and hit["mtime"] == mtime:
+                manifest = hit["manifest"]
+            else:
+                try:
+                    manifest = json.loads(manifest_path.read_text())
+                except ValueError as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+            seen.add(entry.name)
+            manifests[key] = {"mtime": mtime, "manifest": manifest}
+            if integration := Integration.from_manifest(
+                hass, custom_components, entry, dict(manifest)
+            ):
+                integrations[integration.domain] = integration
+
+    if manifests != cached:
+        _save_custom_manifest_cache(cache_path, manifests)
+
+    return integrations
+
+
+def _load_custom_manifest_cache(cache_path: str) -> dict[str, dict[str, Any]]:
+    """Load the cached manifests of the custom integrations."""
+    try:
+        with open(cache_path, encoding="utf-8") as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != MANIFEST_INDEX_VERSION:
+        return {}
+    return cast(dict[str, dict[str, Any]], cache["manifests"])
+
+
+def _save_custom_manifest_cache(
+    cache_path: str, manifests: dict[str, dict[str, Any]]
+) -> None:
+    """Save the manifests of the custom integrations and their mtimes."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        write_utf8_file(
+            cache_path,
+            json.dumps({"version": MANIFEST_INDEX_VERSION, "manifests": manifests}),
+        )
+    except (OSError, WriteError) as err:
+        _LOGGER.debug("Unable to save the custom manifest cache: %s", err)
+
+
+def _load_manifest_index() -> dict[str, Manifest]:
+    """Load the index of the manifests of the built-in integrations.
+
+    The index is generated by hassfest so all built-in manifests are read
+    with a single file read instead of probing every integration directory.
+    It has to be regenerated with `python3 -m script.hassfest` after a
+    manifest is changed. An index with an unknown version or generated for
+    another version of Home Assistant is ignored.
+    """
+    try:
+        index = json.loads(MANIFEST_INDEX_PATH.read_text())
+    except (OSError, ValueError) as err:
+        _LOGGER.debug("Unable to load the manifest index: %s", err)
+        return {}
+    if not isinstance(index, dict) or index.get("version") != MANIFEST_INDEX_VERSION:
+        _LOGGER.debug("Ignoring manifest index with unknown version")
+        return {}
+    if index.get("homeassistant") != __version__:
+        _LOGGER.warning(
+            "The manifest index was generated for Home Assistant %s, "
+            "run python3 -m script.hassfest to regenerate it",
+            index.get("homeassistant"),
+        )
+        return {}
+    return cast(dict[str, Manifest], index["manifests"])
+
+
+async def _async_get_manifest_index(hass: HomeAssistant) -> dict[str, Manifest]:
+    """Return the cached index of the manifests of the built-in integrations."""
+    if (index := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        index = hass.data[DATA_MANIFEST_INDEX] = hass.async_add_executor_job(
+            _load_manifest_index
+        )
+    return cast(dict[str, Manifest], await index)
 
 
 async def async_get_custom_components(
@@ -373,48 +467,59 @@ class Integration:
                 )
                 continue
 
-            integration = cls(
-                hass,
-                f"{root_module.__name__}.{domain}",
-                manifest_path.parent,
-                manifest,
-            )
+            return cls.from_manifest(hass, root_module, manifest_path.parent, manifest)
 
-            if integration.is_built_in:
-                return integration
+        return None
 
-            _LOGGER.warning(CUSTOM_WARNING, integration.domain)
-            if integration.version is None:
-                _LOGGER.error(
-                    "The custom integration '%s' does not have a "
-                    "version key in the manifest file and was blocked from loading. "
-                    "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
-                    integration.domain,
-                )
-                return None
-            try:
-                AwesomeVersion(
-                    integration.version,
-                    [
-                        AwesomeVersionStrategy.CALVER,
-                        AwesomeVersionStrategy.SEMVER,
-                        AwesomeVersionStrategy.SIMPLEVER,
-                        AwesomeVersionStrategy.BUILDVER,
-                        AwesomeVersionStrategy.PEP440,
-                    ],
-                )
-            except AwesomeVersionException:
-                _LOGGER.error(
-                    "The custom integration '%s' does not have a "
-                    "valid version key (%s) in the manifest file and was blocked from loading. "
-                    "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
-                    integration.domain,
-                    integration.version,
-                )
-                return None
+    @classmethod
+    def from_manifest(
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        file_path: pathlib.Path,
+        manifest: Manifest,
+    ) -> Integration | None:
+        """Create an integration from a manifest found in a root module."""
+        integration = cls(
+            hass,
+            f"{root_module.__name__}.{file_path.name}",
+            file_path,
+            manifest,
+        )
+
+        if integration.is_built_in:
             return integration
 
-        return None
+        _LOGGER.warning(CUSTOM_WARNING, integration.domain)
+        if integration.version is None:
+            _LOGGER.error(
+                "The custom integration '%s' does not have a "
+                "version key in the manifest file and was blocked from loading. "
+                "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
+                integration.domain,
+            )
+            return None
+        try:
+            AwesomeVersion(
+                integration.version,
+                [
+                    AwesomeVersionStrategy.CALVER,
+                    AwesomeVersionStrategy.SEMVER,
+                    AwesomeVersionStrategy.SIMPLEVER,
+                    AwesomeVersionStrategy.BUILDVER,
+                    AwesomeVersionStrategy.PEP440,
+                ],
+            )
+        except AwesomeVersionException:
+            _LOGGER.error(
+                "The custom integration '%s' does not have a "
+                "valid version key (%s) in the manifest file and was blocked from loading. "
+                "See https://developers.home-assistant.io/blog/2021/01/29/custom-integration-changes#versions for more details",
+                integration.domain,
+                integration.version,
+            )
+            return None
+        return integration
 
     def __init__(
         self,
@@ -641,57 +746,137 @@ class Integration:
 
 async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration."""
+    if (cache := hass.data.get(DATA_INTEGRATIONS)) is not None and isinstance(
+        int_or_evt := cache.get(domain), Integration
+    ):
+        return int_or_evt
+
+    int_or_exc = (await async_get_integrations(hass, (domain,)))[domain]
+    if isinstance(int_or_exc, Exception):
+        raise int_or_exc
+    return int_or_exc
+
+
+async def async_get_integrations(
+    hass: HomeAssistant, domains: Iterable[str]
+) -> dict[str, Integration | Exception]:
+    """Get integrations, resolving all missing ones at once.
+
+    Returns the integration or the exception raised resolving it by domain.
+    """
     if (cache := hass.data.get(DATA_INTEGRATIONS)) is None:
         if not _async_mount_config_dir(hass):
-            raise IntegrationNotFound(domain)
+            return {domain: IntegrationNotFound(domain) for domain in domains}
         cache = hass.data[DATA_INTEGRATIONS] = {}
 
-    int_or_evt: Integration | asyncio.Event | None = cache.get(domain, _UNDEF)
+    results: dict[str, Integration | Exception] = {}
+    needed: dict[str, asyncio.Event] = {}
+    in_progress: dict[str, asyncio.Event] = {}
 
-    if isinstance(int_or_evt, asyncio.Event):
-        await int_or_evt.wait()
+    for domain in domains:
+        if domain in results or domain in needed or domain in in_progress:
+            continue
+        int_or_evt: Integration | asyncio.Event | None = cache.get(domain, _UNDEF)
+        if isinstance(int_or_evt, asyncio.Event):
+            in_progress[domain] = int_or_evt
+        elif int_or_evt is not _UNDEF:
+            results[domain] = cast(Integration, int_or_evt)
+        elif "." in domain:
+            results[domain] = ValueError(f"Invalid domain {domain}")
+        else:
+            needed[domain] = cache[domain] = asyncio.Event()
 
+    if needed:
+        try:
+            integrations = await _async_resolve_integrations(hass, needed)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Error resolving integrations: %s", ", ".join(needed))
+            # Don't cache the error so the integrations are resolved again
+            for domain, event in needed.items():
+                cache.pop(domain)
+                results[domain] = err
+                event.set()
+        else:
+            for domain, event in needed.items():
+                if (integration := integrations.get(domain)) is None:
+                    # We don't cache that it doesn't exist, or else people can't
+                    # fix it and then restart, because their config will never
+                    # be valid.
+                    cache.pop(domain)
+                    results[domain] = IntegrationNotFound(domain)
+                else:
+                    results[domain] = cache[domain] = integration
+                event.set()
+
+    for domain, event in in_progress.items():
+        await event.wait()
         # When we have waited and it's _UNDEF, it doesn't exist
-        # We don't cache that it doesn't exist, or else people can't fix it
-        # and then restart, because their config will never be valid.
         if (int_or_evt := cache.get(domain, _UNDEF)) is _UNDEF:
-            raise IntegrationNotFound(domain)
+            results[domain] = IntegrationNotFound(domain)
+        else:
+            results[domain] = cast(Integration, int_or_evt)
 
-    if int_or_evt is not _UNDEF:
-        return cast(Integration, int_or_evt)
+    return results
 
-    event = cache[domain] = asyncio.Event()
 
-    try:
-        integration = await _async_get_integration(hass, domain)
-    except Exception:
-        # Remove event from cache.
-        cache.pop(domain)
-        event.set()
-        raise
+async def _async_resolve_integrations(
+    hass: HomeAssistant, domains: Iterable[str]
+) -> dict[str, Integration]:
+    """Resolve integrations that are not cached yet.
 
-    cache[domain] = integration
-    event.set()
-    return integration
+    Custom integrations are taken from the cache of custom components and
+    built-in integrations from the manifest index, all in a single executor
+    job. Only domains missing from both are probed on disk.
+    """
+    custom = await async_get_custom_components(hass)
+    index = await _async_get_manifest_index(hass)
 
+    from . import components  # pylint: disable=import-outside-toplevel
 
-async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
-    if "." in domain:
-        raise ValueError(f"Invalid domain {domain}")
+    integrations: dict[str, Integration] = {}
+    built_in: list[str] = []
+    for domain in domains:
+        # Instead of using resolve_from_root we use the cache of custom
+        # components to find the integration.
+        if integration := custom.get(domain):
+            integrations[domain] = integration
+        else:
+            built_in.append(domain)
 
-    # Instead of using resolve_from_root we use the cache of custom
-    # components to find the integration.
-    if integration := (await async_get_custom_components(hass)).get(domain):
-        return integration
+    if built_in:
+        integrations.update(
+            await hass.async_add_executor_job(
+                _resolve_built_in_integrations,
+                hass,
+                components,
+                index,
+                built_in,
+            )
+        )
 
-    from . import components  # pylint: disable=import-outside-toplevel
+    return integrations
 
-    if integration := await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    ):
-        return integration
 
-    raise IntegrationNotFound(domain)
+def _resolve_built_in_integrations(
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    index: dict[str, Manifest],
+    domains: list[str],
+) -> dict[str, Integration]:
+    """Resolve built-in integrations from the manifest index or from disk."""
+    integrations: dict[str, Integration] = {}
+    for domain in domains:
+        if manifest := index.get(domain):
+            integrations[domain] = Integration(
+                hass,
+                f"{root_module.__name__}.{domain}",
+                pathlib.Path(root_module.__path__[0]) / domain,
+                cast(Manifest, dict(manifest)),
+            )
+            continue
+        if integration := Integration.resolve_from_root(hass, root_module, domain):
+            integrations[domain] = integration
+    return integrations
 
 
 class LoaderError(Exception):
@@ -853,6 +1038,11 @@ async def _async_component_dependencies(
     domain = integration.domain
     loading.add(domain)
 
+    # Resolve all dependencies that are not known yet at once
+    dep_integrations = await async_get_integrations(
+        hass, [dep for dep in integration.dependencies if dep not in loaded]
+    )
+
     for dependency_domain in integration.dependencies:
         # Check not already loaded
         if dependency_domain in loaded:
@@ -864,7 +1054,9 @@ async def _async_component_dependencies(
 
         loaded.add(dependency_domain)
 
-        dep_integration = await async_get_integration(hass, dependency_domain)
+        dep_integration = dep_integrations[dependency_domain]
+        if isinstance(dep_integration, Exception):
+            raise dep_integration
 
         if start_domain in dep_integration.after_dependencies:
             raise CircularDependency(start_domain, dependency_domain)
@@ -6,20 +6,29 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
 import json
 import logging
+import tempfile
+import threading
 from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
+from homeassistant.components import recorder
+from homeassistant.components.recorder import history as recorder_history
+from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import CONF_PORT, CONF_PROTOCOL, EVENT_STATE_CHANGED
+from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSONEncoder
+import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -28,6 +37,9 @@ _CallableT = TypeVar("_CallableT", bound=Callable)
 
 BENCHMARKS: dict[str, Callable] = {}
 
+# Number of state rows in the database of the history benchmarks
+HISTORY_BENCHMARK_ROWS = 10**6
+
 
 def run(args):
     """Handle benchmark commandline script."""
@@ -225,6 +237,345 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_event_keyed_listeners(hass):
+    """Run 100k state changes through 10k keyed state changed listeners."""
+    count = 0
+    events_to_fire = 10**5
+    listeners_to_add = 10**4
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    entity_ids = [f"light.kitchen{idx}" for idx in range(listeners_to_add)]
+    for entity_id in entity_ids:
+        async_track_state_change_event(hass, entity_id, listener)
+
+    old_state = core.State("light.kitchen", "off")
+    new_state = core.State("light.kitchen", "on")
+    events_data = [
+        {
+            "entity_id": entity_ids[idx % listeners_to_add],
+            "old_state": old_state,
+            "new_state": new_state,
+        }
+        for idx in range(events_to_fire)
+    ]
+
+    start = timer()
+
+    for event_data in events_data:
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+def _state_set_attributes(idx):
+    """Return attributes of a typical sensor state."""
+    return {
+        "unit_of_measurement": "W",
+        "device_class": "power",
+        "state_class": "measurement",
+        "friendly_name": f"Power {idx}",
+        "icon": "mdi:flash",
+    }
+
+
+async def _state_set_benchmark(hass, make_state, make_attributes):
+    """Set 100k states of 1000 entities in the state machine."""
+    entity_ids = [f"sensor.power{idx}" for idx in range(1000)]
+    for idx, entity_id in enumerate(entity_ids):
+        hass.states.async_set(entity_id, "0", _state_set_attributes(idx))
+    await hass.async_block_till_done()
+
+    updates = [
+        (entity_ids[idx % 1000], make_state(idx), make_attributes(idx))
+        for idx in range(10**5)
+    ]
+
+    async_set = hass.states.async_set
+    start = timer()
+
+    for entity_id, state, attributes in updates:
+        async_set(entity_id, state, attributes)
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def state_set_unchanged(hass):
+    """Set 100k states that did not change."""
+    return await _state_set_benchmark(
+        hass, lambda idx: "0", lambda idx: _state_set_attributes(idx % 1000)
+    )
+
+
+@benchmark
+async def state_set_state_only(hass):
+    """Set 100k states where only the state changed."""
+    return await _state_set_benchmark(
+        hass, lambda idx: str(idx), lambda idx: _state_set_attributes(idx % 1000)
+    )
+
+
+@benchmark
+async def state_set_attributes_only(hass):
+    """Set 100k states where only the attributes changed."""
+
+    def _make_attributes(idx):
+        attributes = _state_set_attributes(idx % 1000)
+        attributes["last_reset"] = idx
+        return attributes
+
+    return await _state_set_benchmark(hass, lambda idx: "0", _make_attributes)
+
+
+async def _recorder_benchmark(hass, bulk_write):
+    """Record 20k state changes of 1000 entities in a SQLite database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = recorder.Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=10,
+            purge_time_budget=1.0,
+            commit_interval=1,
+            bulk_write=bulk_write,
+            state_attributes_cache_size=2048,
+            event_data_cache_size=2048,
+            uri=f"sqlite:///{tmpdir}/benchmark.db",
+            db_max_retries=10,
+            db_retry_wait=3,
+            entity_filter=lambda entity_id: True,
+            exclude_t=[],
+            exclude_attributes_by_domain={},
+        )
+        instance.async_initialize()
+        instance.async_register()
+        instance.start()
+        await hass.async_start()
+        await instance.async_recorder_ready.wait()
+
+        entity_ids = [f"sensor.power{idx}" for idx in range(1000)]
+        start = timer()
+
+        # Commit after every 1000 state changes
+        for batch in range(20):
+            for idx, entity_id in enumerate(entity_ids):
+                hass.states.async_set(
+                    entity_id, str(batch * 1000 + idx), _state_set_attributes(idx)
+                )
+            await instance.async_block_till_done()
+
+        runtime = timer() - start
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def recorder_orm_write(hass):
+    """Record 20k state changes with the ORM."""
+    return await _recorder_benchmark(hass, False)
+
+
+@benchmark
+async def recorder_bulk_write(hass):
+    """Record 20k state changes with bulk inserts."""
+    return await _recorder_benchmark(hass, True)
+
+
+async def _history_benchmark(hass, fetch_history):
+    """Fetch 7 days of history of 300 sensors from a synthetic database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        instance = hass.data[recorder.DATA_INSTANCE] = recorder.Recorder(
+            hass,
+            auto_purge=False,
+            auto_repack=False,
+            keep_days=10,
+            purge_time_budget=1.0,
+            commit_interval=1,
+            bulk_write=False,
+            state_attributes_cache_size=2048,
+            event_data_cache_size=2048,
+            uri=f"sqlite:///{tmpdir}/benchmark.db",
+            db_max_retries=10,
+            db_retry_wait=3,
+            entity_filter=lambda entity_id: True,
+            exclude_t=[],
+            exclude_attributes_by_domain={},
+        )
+        instance.async_initialize()
+        instance.async_register()
+        instance.start()
+        await hass.async_start()
+        await instance.async_recorder_ready.wait()
+        # Let the startup statistics compile finish before writing to the database
+        await instance.async_block_till_done()
+
+        entity_ids = [f"sensor.power{idx}" for idx in range(300)]
+        end_time = dt_util.utcnow()
+        start_time = end_time - timedelta(days=7)
+        await instance.async_add_executor_job(
+            _fill_history_benchmark_database, instance, entity_ids, start_time
+        )
+
+        runtime = await instance.async_add_executor_job(
+            fetch_history, hass, entity_ids, start_time, end_time
+        )
+        await hass.async_stop()
+        return runtime
+
+
+def _fill_history_benchmark_database(instance, entity_ids, start_time):
+    """Insert HISTORY_BENCHMARK_ROWS states spread over the entities."""
+    rows_per_entity = HISTORY_BENCHMARK_ROWS // len(entity_ids)
+    interval = timedelta(days=7) / rows_per_entity
+    connection = instance.engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.executemany(
+            "INSERT INTO state_attributes (attributes_id, hash, shared_attrs) "
+            "VALUES (?, ?, ?)",
+            [
+                (idx, idx, json.dumps(_state_set_attributes(idx)))
+                for idx in range(1, len(entity_ids) + 1)
+            ],
+        )
+        for entity_idx, entity_id in enumerate(entity_ids, 1):
+            cursor.executemany(
+                "INSERT INTO states (entity_id, state, last_updated, attributes_id) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        entity_id,
+                        str(idx % 100),
+                        f"{start_time + interval * idx:%Y-%m-%d %H:%M:%S.%f}",
+                        entity_idx,
+                    )
+                    for idx in range(rows_per_entity)
+                ),
+            )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _fetch_history_dict(hass, entity_ids, start_time, end_time):
+    """Fetch and serialize the history in a single response."""
+    start = timer()
+    JSON_DUMP(
+        messages.result_message(
+            1,
+            recorder_history.get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                significant_changes_only=False,
+                minimal_response=True,
+                compressed_state_format=True,
+            ),
+        )
+    )
+    return timer() - start
+
+
+class _HistoryStreamConnection:
+    """Stand-in for a websocket connection that writes chunks right away."""
+
+    def __init__(self):
+        """Initialize the connection."""
+        self.sent = []
+
+    def send_message(self, message):
+        """Take a chunk off the queue and record when it was written."""
+        message()
+        self.sent.append(timer())
+
+
+def _fetch_history_stream(hass, entity_ids, start_time, end_time, first_chunk=False):
+    """Fetch and serialize the history in chunks like the websocket command."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import history
+
+    connection = _HistoryStreamConnection()
+    start = timer()
+    history._ws_stream_significant_states(  # pylint: disable=protected-access
+        hass,
+        connection,
+        1,
+        threading.Event(),
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        True,
+        False,
+        True,
+        False,
+    )
+    if first_chunk:
+        return connection.sent[0] - start
+    return timer() - start
+
+
+@benchmark
+async def history_during_period(hass):
+    """Fetch 7 days of history of 300 sensors in one response."""
+    return await _history_benchmark(hass, _fetch_history_dict)
+
+
+@benchmark
+async def history_during_period_stream(hass):
+    """Fetch 7 days of history of 300 sensors in chunks."""
+    return await _history_benchmark(hass, _fetch_history_stream)
+
+
+@benchmark
+async def history_during_period_stream_first_chunk(hass):
+    """Measure when the first chunk of 7 days of history of 300 sensors is sent."""
+    return await _history_benchmark(
+        hass, partial(_fetch_history_stream, first_chunk=True)
+    )
+
+
+@benchmark
+async def statistics_reduce_per_month(hass):
+    """Reduce a year of hourly statistics of 200 statistic ids to months."""
+    start_time = dt_util.parse_datetime("2021-01-01T00:00:00+00:00")
+    stats = {
+        f"sensor.energy{idx}": [
+            {
+                "statistic_id": f"sensor.energy{idx}",
+                "start": start_time + timedelta(hours=hour),
+                "mean": float(hour % 24),
+                "min": float(hour % 12),
+                "max": float(hour % 36),
+                "last_reset": None,
+                "state": float(hour),
+                "sum": float(hour),
+            }
+            for hour in range(365 * 24)
+        ]
+        for idx in range(200)
+    }
+
+    start = timer()
+    recorder.statistics._reduce_statistics_per_month(  # pylint: disable=protected-access
+        stats
+    )
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -290,6 +641,222 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def registry_lookups(hass):
+    """Look up 10k entities and 2k devices by device, area and config entry."""
+    dev_reg = device_registry.DeviceRegistry(hass)
+    dev_reg.devices = {}
+    dev_reg.deleted_devices = {}
+    ent_reg = entity_registry.EntityRegistry(hass)
+    ent_reg.entities = entity_registry.EntityRegistryItems()
+    area_ids = [f"area_{idx}" for idx in range(100)]
+    config_entry_ids = [f"entry_{idx}" for idx in range(20)]
+
+    for idx in range(2000):
+        device = device_registry.DeviceEntry(
+            area_id=area_ids[idx % 100],
+            config_entries={config_entry_ids[idx % 20]},
+            identifiers={("bench", str(idx))},
+        )
+        dev_reg.devices[device.id] = device
+        for entity_idx in range(5):
+            entity_id = f"sensor.device_{idx}_{entity_idx}"
+            ent_reg.entities[entity_id] = entity_registry.RegistryEntry(
+                entity_id=entity_id,
+                unique_id=entity_id,
+                platform="bench",
+                area_id=area_ids[idx % 100] if entity_idx == 0 else None,
+                config_entry_id=config_entry_ids[idx % 20],
+                device_id=device.id,
+            )
+    dev_reg._rebuild_index()  # pylint: disable=protected-access
+    device_ids = list(dev_reg.devices)
+
+    start = timer()
+    for _ in range(10):
+        for device_id in device_ids:
+            entity_registry.async_entries_for_device(ent_reg, device_id)
+        for area_id in area_ids:
+            entity_registry.async_entries_for_area(ent_reg, area_id)
+            device_registry.async_entries_for_area(dev_reg, area_id)
+        for config_entry_id in config_entry_ids:
+            entity_registry.async_entries_for_config_entry(ent_reg, config_entry_id)
+            device_registry.async_entries_for_config_entry(dev_reg, config_entry_id)
+    return timer() - start
+
+
+def _mqtt_subscriptions(count):
+    """Return subscriptions of a Zigbee2MQTT like setup with count devices."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription
+
+    job = core.HassJob(lambda msg: None)
+    subscriptions = [
+        Subscription("homeassistant/+/+/config", job),
+        Subscription("homeassistant/+/+/+/config", job),
+        Subscription("zigbee2mqtt/bridge/#", job),
+    ]
+    for idx in range(count):
+        subscriptions.append(Subscription(f"zigbee2mqtt/device_{idx}", job))
+        subscriptions.append(
+            Subscription(f"zigbee2mqtt/device_{idx}/availability", job)
+        )
+    return subscriptions
+
+
+@benchmark
+async def mqtt_match_topics(hass):
+    """Match 100k messages against the subscriptions of 3000 devices."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import SubscriptionTrie
+
+    trie = SubscriptionTrie()
+    for subscription in _mqtt_subscriptions(3000):
+        trie.add(subscription)
+    topics = [f"zigbee2mqtt/device_{idx}" for idx in range(3000)]
+    topics.append("homeassistant/sensor/device_1/config")
+
+    start = timer()
+    for idx in range(10**5):
+        trie.matches(topics[idx % 3001])
+    return timer() - start
+
+
+@benchmark
+async def mqtt_subscribe_unsubscribe(hass):
+    """Add and remove the subscriptions of 3000 devices 10 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import SubscriptionTrie
+
+    trie = SubscriptionTrie()
+    subscriptions = _mqtt_subscriptions(3000)
+
+    start = timer()
+    for _ in range(10):
+        for subscription in subscriptions:
+            trie.add(subscription)
+        for subscription in subscriptions:
+            trie.remove(subscription)
+    return timer() - start
+
+
+class _MqttBrokerStandIn:
+    """Stand-in for the paho client acknowledging like a local broker."""
+
+    def __init__(self, hass, client, latency):
+        """Initialize the stand-in."""
+        self.hass = hass
+        self.client = client
+        self.latency = latency
+        self.round_trips = 0
+        self.topics = 0
+        self._mid = 0
+
+    def _send(self, count):
+        """Send a packet and acknowledge it after the broker latency."""
+        self._mid += 1
+        self.round_trips += 1
+        self.topics += count
+        self.hass.loop.call_soon_threadsafe(
+            self.hass.loop.call_later,
+            self.latency,
+            self.client._mqtt_handle_mid,  # pylint: disable=protected-access
+            self._mid,
+        )
+        return (0, self._mid)
+
+    def subscribe(self, topic, qos=0):
+        """Subscribe to a topic or a list of (topic, qos) tuples."""
+        return self._send(len(topic) if isinstance(topic, list) else 1)
+
+    def unsubscribe(self, topic):
+        """Unsubscribe from a topic or a list of topics."""
+        return self._send(len(topic) if isinstance(topic, list) else 1)
+
+
+def _mqtt_client(hass):
+    """Return a connected MQTT client talking to a broker stand-in."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT
+    from homeassistant.components.mqtt.const import CONF_BROKER, PROTOCOL_311
+
+    client = MQTT(
+        hass,
+        None,
+        {CONF_BROKER: "localhost", CONF_PORT: 1883, CONF_PROTOCOL: PROTOCOL_311},
+    )
+    broker = _MqttBrokerStandIn(hass, client, 0.001)
+    client._mqttc = broker  # pylint: disable=protected-access
+    client.connected = True
+    return client, broker
+
+
+@benchmark
+async def mqtt_subscribe_startup(hass):
+    """Subscribe 3000 devices at startup with a broker answering in 1ms."""
+    client, broker = _mqtt_client(hass)
+    subscriptions = _mqtt_subscriptions(3000)
+
+    start = timer()
+    await asyncio.gather(
+        *(
+            client.async_subscribe(
+                subscription.topic, lambda msg: None, subscription.qos
+            )
+            for subscription in subscriptions
+        )
+    )
+    assert broker.topics == len(subscriptions)
+    return timer() - start
+
+
+@benchmark
+async def mqtt_message_burst(hass):
+    """Receive a burst of 100k messages from the paho network thread."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    client, _ = _mqtt_client(hass)
+    received = 0
+    count = 10**5
+    done = asyncio.Event()
+
+    @core.callback
+    def message_received(msg):
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    await asyncio.gather(
+        *(
+            client.async_subscribe(f"zigbee2mqtt/device_{idx}", message_received, 0)
+            for idx in range(3000)
+        ),
+        *(
+            client.async_subscribe(
+                f"zigbee2mqtt/device_{idx}", message_received, 0, "utf-8"
+            )
+            for idx in range(3000)
+        ),
+    )
+
+    messages = []
+    for idx in range(count // 2):
+        msg = MQTTMessage(topic=f"zigbee2mqtt/device_{idx % 3000}".encode())
+        msg.payload = b'{"state": "ON", "brightness": 254}'
+        messages.append(msg)
+
+    def receive_messages():
+        for msg in messages:
+            client._mqtt_on_message(None, None, msg)  # pylint: disable=protected-access
+
+    start = timer()
+    await hass.async_add_executor_job(receive_messages)
+    await done.wait()
+    return timer() - start
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -312,6 +879,51 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _get_states_payload():
+    """Return a get_states result for 2000 entities."""
+    states = [
+        core.State(
+            f"sensor.power{idx}",
+            str(idx),
+            {**_state_set_attributes(idx), "last_reset": dt_util.utcnow()},
+        )
+        for idx in range(2000)
+    ]
+    return messages.result_message(1, states)
+
+
+@benchmark
+async def json_serialize_get_states(hass):
+    """Serialize 100 get_states results of 2000 entities."""
+    payload = _get_states_payload()
+    start = timer()
+    for _ in range(100):
+        JSON_DUMP(payload)
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_get_states_memoized(hass):
+    """Serialize 100 get_states results of 2000 entities from the state JSON."""
+    states = _get_states_payload()["result"]
+    start = timer()
+    for _ in range(100):
+        messages.construct_result_message(
+            1, f"[{','.join(state.as_dict_json() for state in states)}]"
+        )
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_get_states_python(hass):
+    """Serialize 100 get_states results of 2000 entities with the JSONEncoder."""
+    payload = _get_states_payload()
+    start = timer()
+    for _ in range(100):
+        json.dumps(payload, cls=JSONEncoder, allow_nan=False, separators=(",", ":"))
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -355,3 +967,49 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+@benchmark
+async def statistics_sensor_window(hass):
+    """Feed 20000 samples to statistics sensors with a 5000 sample buffer."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.statistics.sensor import StatisticsSensor
+
+    sensors = [
+        StatisticsSensor(
+            "sensor.source",
+            characteristic,
+            None,
+            characteristic,
+            5000,
+            None,
+            2,
+            4,
+            "exclusive",
+        )
+        for characteristic in (
+            "average_linear",
+            "datetime_value_max",
+            "median",
+            "noisiness",
+            "standard_deviation",
+        )
+    ]
+    start_time = dt_util.utcnow()
+    states = [
+        core.State(
+            "sensor.source",
+            str(20 + (idx * 7919) % 1000 / 100),
+            last_updated=start_time + timedelta(seconds=idx),
+        )
+        for idx in range(20000)
+    ]
+
+    start = timer()
+
+    for state in states:
+        for sensor in sensors:
+            sensor._add_state_to_queue(state)  # pylint: disable=protected-access
+            sensor._update_value()  # pylint: disable=protected-access
+
+    return timer() - start
@@ -3,17 +3,24 @@ from __future__ import annotations
 
 from collections import deque
 from collections.abc import Callable
+import datetime
 import json
 import logging
-from typing import Any
+import math
+from typing import Any, Final
+
+import orjson
 
-from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
 from .file import write_utf8_file, write_utf8_file_atomic
 
 _LOGGER = logging.getLogger(__name__)
 
+ORJSON_PASSTHROUGH_OPTIONS: Final = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -23,14 +30,98 @@ class WriteError(HomeAssistantError):
     """Error writing the data."""
 
 
+class JSONEncoder(json.JSONEncoder):
+    """JSONEncoder that supports Home Assistant objects."""
+
+    def default(self, o: Any) -> Any:
+        """Convert Home Assistant objects.
+
+        Hand other objects to the original method.
+        """
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        if isinstance(o, set):
+            return list(o)
+        if hasattr(o, "as_dict"):
+            return o.as_dict()
+
+        return json.JSONEncoder.default(self, o)
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects for orjson.
+
+    orjson handles datetimes natively. Raise TypeError for other objects.
+    """
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    raise TypeError
+
+
+def json_bytes(data: Any, *, indent: bool = False) -> bytes:
+    """Dump json with support for Home Assistant objects and return bytes.
+
+    Falls back to the pure Python JSONEncoder for data orjson can not
+    serialize, like integers that do not fit in 64 bits.
+    """
+    option = ORJSON_PASSTHROUGH_OPTIONS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, option=option, default=json_encoder_default)
+    except TypeError:
+        pass
+    try:
+        return _json_bytes_python(data, indent)
+    except ValueError:
+        # Write NaN and infinity as null like orjson does
+        return _json_bytes_python(_non_finite_to_none(data), indent)
+
+
+def json_dumps(data: Any) -> str:
+    """Dump json with support for Home Assistant objects and return str."""
+    return json_bytes(data).decode("utf-8")
+
+
+def _json_bytes_python(data: Any, indent: bool) -> bytes:
+    """Dump json with the pure Python JSONEncoder and return bytes."""
+    return json.dumps(
+        data,
+        cls=JSONEncoder,
+        allow_nan=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def _non_finite_to_none(obj: Any) -> Any:
+    """Return a copy of the data with NaN and infinite floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _non_finite_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_non_finite_to_none(value) for value in obj]
+    if hasattr(obj, "as_dict"):
+        return _non_finite_to_none(obj.as_dict())
+    return obj
+
+
 def load_json(filename: str, default: list | dict | None = None) -> list | dict:
     """Load JSON data from a file and return as dict or list.
 
     Defaults to returning empty dict if file is not found.
     """
     try:
-        with open(filename, encoding="utf-8") as fdesc:
-            return json.loads(fdesc.read())  # type: ignore[no-any-return]
+        with open(filename, "rb") as fdesc:
+            content = fdesc.read()
+        try:
+            return orjson.loads(content)  # type: ignore[no-any-return]
+        except orjson.JSONDecodeError:
+            # Files written by the standard library may contain NaN
+            return json.loads(content)  # type: ignore[no-any-return]
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
@@ -56,7 +147,7 @@ def save_json(
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        json_data = _dumps_indented(data, encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
@@ -68,6 +159,21 @@ def save_json(
         write_utf8_file(filename, json_data, private)
 
 
+def _dumps_indented(data: Any, encoder: type[json.JSONEncoder] | None) -> str:
+    """Dump indented json with orjson unless a custom encoder is used."""
+    if encoder is JSONEncoder:
+        return json_bytes(data, indent=True).decode("utf-8")
+    if encoder is None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # Fall back to the pure Python encoder
+            pass
+    return json.dumps(data, indent=2, cls=encoder)
+
+
 def format_unserializable_data(data: dict[str, Any]) -> str:
     """Format output of find_paths in a friendly way.
 
@@ -97,6 +203,10 @@ def find_paths_unserializable_data(
 
         # We convert objects with as_dict to their dict values so we can find bad data inside it
         if hasattr(obj, "as_dict"):
+            # homeassistant.core serializes its objects with this module
+            # pylint: disable-next=import-outside-toplevel
+            from homeassistant.core import Event, State
+
             desc = obj.__class__.__name__
             if isinstance(obj, State):
                 desc += f": {obj.entity_id}"
@@ -1,4 +1,5 @@
 """YAML utility functions."""
+from .cache import ParseCache
 from .const import SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
@@ -8,6 +9,7 @@ from .objects import Input
 __all__ = [
     "SECRET_YAML",
     "Input",
+    "ParseCache",
     "dump",
     "save_yaml",
     "Secrets",
@@ -0,0 +1,173 @@
+"""Persistent cache of parsed YAML files."""
+from __future__ import annotations
+
+import logging
+import marshal
+import os
+import sys
+import threading
+from typing import Any
+
+import yaml
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Kinds of the serialized nodes
+_SCALAR = 0
+_SEQUENCE = 1
+_MAPPING = 2
+_ALIAS = 3
+
+
+class ParseCache:
+    """Cache of the composed YAML nodes of files, persisted to disk.
+
+    Entries are keyed by the path of a file and are only used while the
+    mtime and size of the file are unchanged. Tags like !include, !secret
+    and !env_var are resolved when the cached nodes are constructed, so
+    changes to included files, secrets and environment variables are
+    always picked up.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the parse cache."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[int, int, tuple]] | None = None
+        self._used: set[str] = set()
+        self._dirty = False
+
+    def get(self, fname: str, mtime: int, size: int) -> yaml.Node | None:
+        """Return the cached nodes of a file if it has not been modified."""
+        entries = self._get_entries()
+        if (entry := entries.get(fname)) is None:
+            return None
+        if entry[0] != mtime or entry[1] != size:
+            del entries[fname]
+            self._dirty = True
+            return None
+        self._used.add(fname)
+        return _node_from_data(fname, entry[2])
+
+    def set(self, fname: str, mtime: int, size: int, node: yaml.Node) -> None:
+        """Cache the nodes of a file.
+
+        The nodes are serialized right away as constructing them may
+        modify them.
+        """
+        self._get_entries()[fname] = (mtime, size, _node_to_data(node))
+        self._used.add(fname)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Save the cache if entries were added or invalidated.
+
+        Only the entries that were used since the last save are kept.
+        """
+        with self._lock:
+            if self._entries is None or not self._dirty:
+                self._used = set()
+                return
+            self._entries = {fname: self._entries[fname] for fname in self._used}
+            self._used = set()
+            self._dirty = False
+            data = marshal.dumps(
+                (CACHE_VERSION, tuple(sys.version_info[:2]), self._entries)
+            )
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as err:
+            _LOGGER.debug("Unable to save the YAML parse cache %s: %s", self.path, err)
+
+    def _get_entries(self) -> dict[str, tuple[int, int, tuple]]:
+        """Return the entries, loading them from disk on first use."""
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = _load_entries(self.path)
+        return self._entries
+
+
+def _load_entries(path: str) -> dict[str, tuple[int, int, tuple]]:
+    """Load the entries of a parse cache file."""
+    try:
+        with open(path, "rb") as fp:
+            version, python_version, entries = marshal.loads(fp.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, EOFError, ValueError, TypeError) as err:
+        _LOGGER.debug("Ignoring invalid YAML parse cache %s: %s", path, err)
+        return {}
+    # The marshal format may change between Python versions
+    if version != CACHE_VERSION or python_version != tuple(sys.version_info[:2]):
+        return {}
+    return entries  # type: ignore[no-any-return]
+
+
+def _node_to_data(root: yaml.Node) -> tuple:
+    """Serialize composed nodes to plain tuples.
+
+    Nodes are numbered in the order they are first seen so anchored
+    nodes that are referenced more than once are stored once.
+    """
+    seen: dict[int, int] = {}
+
+    def dump(node: yaml.Node) -> tuple:
+        if (index := seen.get(id(node))) is not None:
+            return (_ALIAS, index)
+        seen[id(node)] = len(seen)
+        mark = node.start_mark
+        if isinstance(node, yaml.ScalarNode):
+            return (_SCALAR, node.tag, mark.line, mark.column, node.value)
+        if isinstance(node, yaml.SequenceNode):
+            return (
+                _SEQUENCE,
+                node.tag,
+                mark.line,
+                mark.column,
+                [dump(child) for child in node.value],
+            )
+        return (
+            _MAPPING,
+            node.tag,
+            mark.line,
+            mark.column,
+            [(dump(key), dump(value)) for key, value in node.value],
+        )
+
+    return dump(root)
+
+
+def _node_from_data(fname: str, root: tuple) -> yaml.Node:
+    """Rebuild composed nodes from plain tuples."""
+    nodes: list[yaml.Node] = []
+
+    def load(data: tuple) -> Any:
+        kind = data[0]
+        if kind == _ALIAS:
+            return nodes[data[1]]
+        mark = yaml.Mark(fname, 0, data[2], data[3], None, None)
+        if kind == _SCALAR:
+            node = yaml.ScalarNode(data[1], data[4], mark, mark)
+            nodes.append(node)
+            return node
+        if kind == _SEQUENCE:
+            node = yaml.SequenceNode(data[1], [], mark, mark)
+            nodes.append(node)
+            for child in data[4]:
+                node.value.append(load(child))
+            return node
+        node = yaml.MappingNode(data[1], [], mark, mark)
+        nodes.append(node)
+        for key, value in data[4]:
+            node.value.append((load(key), load(value)))
+        return node
+
+    return load(root)  # type: ignore[no-any-return]
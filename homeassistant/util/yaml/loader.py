@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections import OrderedDict
 from collections.abc import Iterator
 import fnmatch
+from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
@@ -11,8 +12,17 @@ from typing import Any, TextIO, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore[misc]
+
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import ParseCache
 from .const import SECRET_YAML
 from .objects import Input, NodeListClass, NodeStrClass
 
@@ -88,13 +98,44 @@ class Secrets:
         return secrets
 
 
+class FastSafeLoader(FastestAvailableSafeLoader):
+    """The fastest available safe loader, backed by libyaml if available.
+
+    Line numbers are taken from the start marks of the nodes.
+    """
+
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        parse_cache: ParseCache | None = None,
+    ) -> None:
+        """Initialize a fast safe loader."""
+        super().__init__(stream)
+        if isinstance(stream, str):
+            self.name = "<unicode string>"
+        elif isinstance(stream, bytes):
+            self.name = "<byte string>"
+        else:
+            self.name = getattr(stream, "name", "<file>")
+        self.stream = stream
+        self.secrets = secrets
+        self.parse_cache = parse_cache
+
+
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        parse_cache: ParseCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.parse_cache = parse_cache
 
     def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:  # type: ignore[override]
         """Annotate a node with the first line it was seen."""
@@ -104,52 +145,105 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
-def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
+LoaderType = Union[FastSafeLoader, SafeLineLoader]
+
+
+def load_yaml(
+    fname: str, secrets: Secrets | None = None, parse_cache: ParseCache | None = None
+) -> JSON_TYPE:
     """Load a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return parse_yaml(conf_file, secrets, parse_cache)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
 
-def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+def parse_yaml(
+    content: str | TextIO,
+    secrets: Secrets | None = None,
+    parse_cache: ParseCache | None = None,
+) -> JSON_TYPE:
+    """Parse YAML with the fastest available loader."""
+    if not HAS_C_LOADER:
+        return _parse_yaml_python(content, secrets, parse_cache)
     try:
-        # If configuration file is empty YAML returns None
-        # We convert that to an empty dict
-        return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
-            or OrderedDict()
-        )
+        return _parse_yaml(FastSafeLoader, content, secrets, parse_cache)
+    except yaml.YAMLError:
+        # Loading failed, so we now load with the Python loader which has more
+        # readable exceptions
+        if isinstance(content, (StringIO, TextIOWrapper)):
+            # Rewind the stream so we can try again
+            content.seek(0, 0)
+        return _parse_yaml_python(content, secrets, parse_cache)
+
+
+def _parse_yaml_python(
+    content: str | TextIO,
+    secrets: Secrets | None = None,
+    parse_cache: ParseCache | None = None,
+) -> JSON_TYPE:
+    """Parse YAML with the pure Python loader."""
+    try:
+        return _parse_yaml(SafeLineLoader, content, secrets, parse_cache)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
 
 
+def _parse_yaml(
+    loader_class: type[FastSafeLoader] | type[SafeLineLoader],
+    content: str | TextIO,
+    secrets: Secrets | None = None,
+    parse_cache: ParseCache | None = None,
+) -> JSON_TYPE:
+    """Parse YAML, taking the nodes of unmodified files from the parse cache."""
+    loader = loader_class(content, secrets, parse_cache)
+    try:
+        if parse_cache is None or (stat := _fstat(content)) is None:
+            node = loader.get_single_node()
+        elif (node := parse_cache.get(loader.name, *stat)) is None:
+            if (node := loader.get_single_node()) is not None:
+                parse_cache.set(loader.name, *stat, node)
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        if node is None:
+            return OrderedDict()
+        return loader.construct_document(node) or OrderedDict()
+    finally:
+        loader.dispose()
+
+
+def _fstat(content: str | TextIO) -> tuple[int, int] | None:
+    """Return the mtime and size of an open file."""
+    try:
+        stat = os.fstat(content.fileno())  # type: ignore[union-attr]
+    except (AttributeError, OSError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: str | NodeStrClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
-def _add_reference(
-    obj: _DictT, loader: SafeLineLoader, node: yaml.nodes.Node
-) -> _DictT:
+def _add_reference(obj: _DictT, loader: LoaderType, node: yaml.nodes.Node) -> _DictT:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore[no-untyped-def]
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore[no-untyped-def]
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -160,7 +254,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -169,7 +263,9 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
-        return _add_reference(load_yaml(fname, loader.secrets), loader, node)
+        return _add_reference(
+            load_yaml(fname, loader.secrets, loader.parse_cache), loader, node
+        )
     except FileNotFoundError as exc:
         raise HomeAssistantError(
             f"{node.start_mark}: Unable to read file {fname}."
@@ -191,9 +287,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -201,12 +295,12 @@ def _include_dir_named_yaml(
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        mapping[filename] = load_yaml(fname, loader.secrets)
+        mapping[filename] = load_yaml(fname, loader.secrets, loader.parse_cache)
     return _add_reference(mapping, loader, node)
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -214,26 +308,26 @@ def _include_dir_merge_named_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.parse_cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
-        load_yaml(f, loader.secrets)
+        load_yaml(f, loader.secrets, loader.parse_cache)
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
     ]
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -241,13 +335,13 @@ def _include_dir_merge_list_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.parse_cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -279,13 +373,13 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
@@ -298,7 +392,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
@@ -306,19 +400,22 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+for _loader_class in (FastSafeLoader, SafeLineLoader):
+    _loader_class.add_constructor("!include", _include_yaml)
+    _loader_class.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
+    )
+    _loader_class.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
+    )
+    _loader_class.add_constructor("!env_var", _env_var_yaml)
+    _loader_class.add_constructor("!secret", secret_yaml)
+    _loader_class.add_constructor("!include_dir_list", _include_dir_list_yaml)
+    _loader_class.add_constructor(
+        "!include_dir_merge_list", _include_dir_merge_list_yaml
+    )
+    _loader_class.add_constructor("!include_dir_named", _include_dir_named_yaml)
+    _loader_class.add_constructor(
+        "!include_dir_merge_named", _include_dir_merge_named_yaml
+    )
+    _loader_class.add_constructor("!input", Input.from_node)
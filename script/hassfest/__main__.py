@@ -13,6 +13,7 @@ from . import (
     dhcp,
     json,
     manifest,
+    manifest_index,
     metadata,
     mqtt,
     mypy_config,
@@ -33,6 +34,7 @@ INTEGRATION_PLUGINS = [
     dhcp,
     json,
     manifest,
+    manifest_index,
     mqtt,
     requirements,
     services,
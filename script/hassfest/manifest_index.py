@@ -0,0 +1,56 @@
+"""Generate the manifest index file."""
+from __future__ import annotations
+
+import json
+
+from homeassistant.const import __version__
+from homeassistant.loader import MANIFEST_INDEX_VERSION
+
+from .model import Config, Integration
+
+
+def generate_and_validate(integrations: dict[str, Integration]) -> str:
+    """Validate and generate the manifest index."""
+    manifests = [
+        f"    {json.dumps(domain)}: "
+        f"{json.dumps(integrations[domain].manifest, sort_keys=True)}"
+        for domain in sorted(integrations)
+        if integrations[domain].manifest
+    ]
+    return "\n".join(
+        (
+            "{",
+            f'  "version": {MANIFEST_INDEX_VERSION},',
+            f'  "homeassistant": {json.dumps(__version__)},',
+            '  "manifests": {',
+            ",\n".join(manifests),
+            "  }",
+            "}",
+        )
+    )
+
+
+def validate(integrations: dict[str, Integration], config: Config) -> None:
+    """Validate the manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(index_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.json is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: dict[str, Integration], config: Config) -> None:
+    """Generate the manifest index file."""
+    index_path = config.root / "homeassistant/generated/manifests.json"
+    with open(str(index_path), "w") as fp:
+        fp.write(f"{config.cache['manifest_index']}\n")
@@ -131,6 +131,22 @@ def write_version_metadata(version: Version) -> None:
         fp.write(content)
 
 
+def write_manifest_index(version: Version) -> None:
+    """Update the manifest index with new version."""
+    with open("homeassistant/generated/manifests.json", encoding="utf8") as fp:
+        content = fp.read()
+
+    content = re.sub(
+        r'(\n  "homeassistant": )".+",\n',
+        f'\\g<1>"{version}",\n',
+        content,
+        count=1,
+    )
+
+    with open("homeassistant/generated/manifests.json", "w", encoding="utf8") as fp:
+        fp.write(content)
+
+
 def write_ci_workflow(version: Version) -> None:
     """Update ci workflow with new version."""
     with open(".github/workflows/ci.yaml") as fp:
@@ -171,6 +187,7 @@ def main():
 
     write_version(bumped)
     write_version_metadata(bumped)
+    write_manifest_index(bumped)
     write_ci_workflow(bumped)
     print(bumped)
 
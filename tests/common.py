@@ -1097,6 +1097,19 @@ def mock_storage(data=None):
         """Remove data."""
         data.pop(store.key, None)
 
+    def mock_load_records(journal, path):
+        """Mock version of loading journal records."""
+        return list(data.get(journal.key, []))
+
+    def mock_append_records(journal, path, records):
+        """Mock version of appending journal records."""
+        # To ensure that the records can be serialized
+        _LOGGER.info("Appending records to %s: %s", journal.key, records)
+        raise_contains_mocks(records)
+        data.setdefault(journal.key, []).extend(
+            json.loads(json.dumps(records, cls=JSONEncoder))
+        )
+
     with patch(
         "homeassistant.helpers.storage.Store._async_load",
         side_effect=mock_async_load,
@@ -1109,6 +1122,18 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Journal._load_records",
+        side_effect=mock_load_records,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Journal._append_records",
+        side_effect=mock_append_records,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Journal.async_remove",
+        side_effect=mock_remove,
+        autospec=True,
     ):
         yield data
 
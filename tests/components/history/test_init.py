@@ -3,7 +3,8 @@
 from datetime import timedelta
 from http import HTTPStatus
 import json
-from unittest.mock import patch, sentinel
+import threading
+from unittest.mock import MagicMock, patch, sentinel
 
 from freezegun import freeze_time
 import pytest
@@ -1574,6 +1575,99 @@ async def test_history_during_period_significant_domain(
     assert "lc" not in sensor_test_history[0]  # skipped if the same a last_updated (lu)
 
 
+async def test_history_during_period_stream(hass, hass_ws_client, recorder_mock):
+    """Test history_during_period streamed in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        hass.states.async_set(entity_id, "on", attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+        hass.states.async_set(entity_id, "off", attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(history, "HISTORY_STREAM_CHUNK_SIZE", 3):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two", "sensor.three"],
+                "minimal_response": True,
+                "stream": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["result"] is None
+
+        chunks = []
+        while True:
+            response = await client.receive_json()
+            assert response["id"] == 1
+            assert response["type"] == "event"
+            chunks.append(response["event"])
+            if response["event"]["done"]:
+                break
+
+    # The states of an entity are never split over chunks
+    assert [list(chunk["states"]) for chunk in chunks] == [
+        ["sensor.one", "sensor.three"],
+        ["sensor.two"],
+    ]
+    for chunk in chunks:
+        for states in chunk["states"].values():
+            assert [state["s"] for state in states] == ["on", "off"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "stream": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 2
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["event"] == {"states": {}, "done": True}
+
+
+async def test_history_stream_limits_chunks_in_flight(hass):
+    """Test a streamed history waits for the writer to take chunks."""
+    connection = MagicMock()
+    cancel = threading.Event()
+    in_flight = threading.Semaphore(1)
+
+    def send_chunk(done):
+        return history._send_history_chunk(
+            hass, connection, 1, cancel, in_flight, {}, done
+        )
+
+    assert await hass.async_add_executor_job(send_chunk, False)
+    await hass.async_block_till_done()
+    assert connection.send_message.call_count == 1
+    chunk_message = connection.send_message.call_args[0][0]
+
+    # The writer did not take the first chunk yet
+    cancel.set()
+    assert not await hass.async_add_executor_job(send_chunk, True)
+    await hass.async_block_till_done()
+    assert connection.send_message.call_count == 1
+
+    cancel.clear()
+    assert json.loads(chunk_message())["event"] == {"states": {}, "done": False}
+    assert await hass.async_add_executor_job(send_chunk, True)
+    await hass.async_block_till_done()
+    assert connection.send_message.call_count == 2
+
+
 async def test_history_during_period_bad_start_time(
     hass, hass_ws_client, recorder_mock
 ):
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access,invalid-name
 import asyncio
 import collections
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from http import HTTPStatus
 import json
@@ -14,8 +15,15 @@ import voluptuous as vol
 from homeassistant.components import logbook, recorder
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.logbook.models import LazyEventPartialState
-from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.logbook.models import (
+    LazyEventPartialState,
+    async_event_to_row,
+)
+from homeassistant.components.logbook.processor import (
+    ContextLookup,
+    EventProcessor,
+    _query_windows,
+)
 from homeassistant.components.logbook.queries.common import PSUEDO_EVENT_STATE_CHANGED
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
@@ -151,6 +159,127 @@ async def test_service_call_create_logbook_entry_invalid_entity_id(hass, recorde
     assert events[0][logbook.ATTR_MESSAGE] == "is triggered"
 
 
+async def test_get_events_in_parallel_windows(hass, recorder_mock):
+    """Test a long time range is fetched in windows and merged in order."""
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_block_till_done()
+    end = dt_util.utcnow().replace(microsecond=0)
+    start = end - timedelta(days=4)
+    boundaries = [start + timedelta(days=days) for days in range(1, 4)]
+    times = [start + timedelta(minutes=1)]
+    for boundary in boundaries:
+        times.extend(
+            (
+                boundary - timedelta(microseconds=1),
+                boundary,
+                boundary + timedelta(microseconds=1),
+            )
+        )
+    times.append(end - timedelta(minutes=1))
+    for idx, time_fired in enumerate(reversed(times)):
+        hass.bus.async_fire(
+            logbook.EVENT_LOGBOOK_ENTRY,
+            {logbook.ATTR_NAME: f"entry {idx}", logbook.ATTR_MESSAGE: "happened"},
+            time_fired=time_fired,
+        )
+    await async_wait_recording_done(hass)
+
+    instance = recorder.get_instance(hass)
+    event_processor = EventProcessor(hass, (EVENT_LOGBOOK_ENTRY,))
+    with patch.object(
+        instance, "add_executor_job", wraps=instance.add_executor_job
+    ) as add_executor_job:
+        events = await instance.async_add_executor_job(
+            event_processor.get_events, start, end
+        )
+    assert add_executor_job.call_count == 3
+    assert [event["when"] for event in events] == [
+        time_fired.isoformat() for time_fired in times
+    ]
+
+    with patch(
+        "homeassistant.components.logbook.processor.MAX_QUERY_WINDOWS", 1
+    ), patch.object(instance, "add_executor_job") as add_executor_job:
+        single_query_events = await instance.async_add_executor_job(
+            EventProcessor(hass, (EVENT_LOGBOOK_ENTRY,)).get_events, start, end
+        )
+    assert add_executor_job.call_count == 0
+    assert single_query_events == events
+
+
+async def test_get_events_bounds_windows_in_flight(hass, recorder_mock):
+    """Test only a bounded number of windows is fetched ahead of the caller."""
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_block_till_done()
+    end = dt_util.utcnow()
+    windows = _query_windows(end - timedelta(days=4), end)
+    assert len(windows) == 4
+
+    event_processor = EventProcessor(hass, (EVENT_LOGBOOK_ENTRY,))
+    submitted: list[Future] = []
+
+    def add_executor_job(target, start_day, end_day):
+        future = Future()
+        # The executor has not started the third window yet
+        if start_day != windows[2][0]:
+            future.set_result([("fetched", start_day)])
+        submitted.append(future)
+        return future
+
+    def stream_window_rows(start_day, end_day):
+        yield ("streamed", start_day)
+
+    instance = recorder.get_instance(hass)
+    with patch.object(
+        instance, "add_executor_job", side_effect=add_executor_job
+    ), patch.object(
+        event_processor, "_stream_window_rows", side_effect=stream_window_rows
+    ):
+        rows_and_submitted = [
+            (row, len(submitted)) for row in event_processor._yield_window_rows(windows)
+        ]
+
+    assert rows_and_submitted == [
+        (("streamed", windows[0][0]), 1),
+        (("fetched", windows[1][0]), 2),
+        (("streamed", windows[2][0]), 3),
+        (("fetched", windows[3][0]), 3),
+    ]
+    assert submitted[1].cancelled()
+
+
+async def test_context_lookup_bounded_when_live(hass):
+    """Test the context lookup keeps the recent origins when switching to live."""
+    context_lookup = ContextLookup(hass)
+    now = dt_util.utcnow()
+    rows = [
+        async_event_to_row(
+            Event(
+                "test_event",
+                time_fired=now - timedelta(hours=2, minutes=-idx),
+                context=ha.Context(),
+            )
+        )
+        for idx in range(120)
+    ]
+    for row in rows:
+        assert context_lookup.memorize(row) == row.context_id
+    assert context_lookup.get(rows[0].context_id) is rows[0]
+
+    context_lookup.bound(50, timedelta(hours=1))
+    assert context_lookup.get(rows[69].context_id) is None
+    assert context_lookup.get(rows[70].context_id) is rows[70]
+
+    # A live event is memorized with the event that created its context
+    context = ha.Context()
+    context.origin_event = Event(EVENT_CALL_SERVICE, time_fired=now, context=context)
+    live_row = async_event_to_row(Event("test_event", time_fired=now, context=context))
+    assert context_lookup.memorize(live_row) == context.id
+    assert context_lookup.get(context.id).event_type == EVENT_CALL_SERVICE
+    assert context_lookup.get(rows[70].context_id) is None
+    assert context_lookup.get(rows[71].context_id) is rows[71]
+
+
 async def test_service_call_create_log_book_entry_no_message(hass_):
     """Test if service call create log book entry without message."""
     calls = async_capture_events(hass_, logbook.EVENT_LOGBOOK_ENTRY)
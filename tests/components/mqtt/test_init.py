@@ -1091,6 +1091,107 @@ async def test_subscribe_special_characters(
     assert calls[0][0].payload == payload
 
 
+async def test_unsubscribe_overlapping_wildcards(
+    hass, mqtt_mock_entry_no_yaml_config, calls, record_calls
+):
+    """Test removing subscriptions sharing topic levels keeps the others."""
+    await mqtt_mock_entry_no_yaml_config()
+
+    unsub_exact = await mqtt.async_subscribe(hass, "test/state/a", record_calls)
+    unsub_level = await mqtt.async_subscribe(hass, "test/+/a", record_calls)
+    await mqtt.async_subscribe(hass, "test/#", record_calls)
+
+    async_fire_mqtt_message(hass, "test/state/a", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert {call[0].subscribed_topic for call in calls} == {
+        "test/state/a",
+        "test/+/a",
+        "test/#",
+    }
+
+    calls.clear()
+    unsub_exact()
+    unsub_level()
+    async_fire_mqtt_message(hass, "test/state/a", "test-payload")
+    async_fire_mqtt_message(hass, "test", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert {call[0].subscribed_topic for call in calls} == {"test/#"}
+    assert [call[0].topic for call in calls] == ["test/state/a", "test"]
+
+
+async def test_subscriptions_are_batched(
+    hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
+):
+    """Test subscribing and unsubscribing sends one packet per cooldown."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+    mqtt_client_mock.reset_mock()
+
+    tasks = [
+        hass.async_create_task(
+            mqtt.async_subscribe(hass, f"test/state{idx}", None, idx % 3)
+        )
+        for idx in range(10)
+    ]
+    await asyncio.sleep(0)
+    assert not mqtt_client_mock.subscribe.called
+    assert not any(task.done() for task in tasks)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
+    await hass.async_block_till_done()
+    mqtt_client_mock.subscribe.assert_called_once_with(
+        [(f"test/state{idx}", idx % 3) for idx in range(10)]
+    )
+    # Subscribing returns once the broker acknowledged the batch
+    unsubs = [task.result() for task in tasks]
+
+    for unsub in unsubs:
+        unsub()
+    await hass.async_block_till_done()
+    assert not mqtt_client_mock.unsubscribe.called
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))  # cooldown
+    await hass.async_block_till_done()
+    assert mqtt_client_mock.unsubscribe.call_count == 1
+    assert sorted(mqtt_client_mock.unsubscribe.call_args[0][0]) == sorted(
+        f"test/state{idx}" for idx in range(10)
+    )
+
+
+async def test_subscription_errors_are_logged_per_packet(
+    hass, caplog, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
+):
+    """Test a failing packet is logged and the other packets are still sent."""
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
+    # Fake that the client is connected
+    mqtt_mock().connected = True
+    mqtt_client_mock.reset_mock()
+    subscribe = mqtt_client_mock.subscribe.side_effect
+
+    def _subscribe(topics):
+        if topics[0][0] == "test/state0":
+            return (4, None)  # MQTT_ERR_NO_CONN
+        return subscribe(topics)
+
+    mqtt_client_mock.subscribe.side_effect = _subscribe
+    with patch("homeassistant.components.mqtt.client.MAX_TOPICS_PER_PACKET", 2):
+        tasks = [
+            hass.async_create_task(mqtt.async_subscribe(hass, f"test/state{idx}", None))
+            for idx in range(5)
+        ]
+        await asyncio.sleep(0)
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
+        await hass.async_block_till_done()
+
+    assert mqtt_client_mock.subscribe.call_count == 3
+    assert mqtt_client_mock.subscribe.call_args[0][0] == [("test/state4", 0)]
+    assert "Unable to subscribe to ['test/state0', 'test/state1']" in caplog.text
+    assert all(task.done() and not task.exception() for task in tasks)
+
+
 async def test_subscribe_same_topic(
     hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_config
 ):
@@ -1111,6 +1212,8 @@ async def test_subscribe_same_topic(
         hass, "test/state", "online"
     )  # Simulate a (retained) message
     await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
+    await hass.async_block_till_done()
     assert calls_a.called
     mqtt_client_mock.subscribe.assert_called()
     calls_a.reset_mock()
@@ -1122,6 +1225,8 @@ async def test_subscribe_same_topic(
         hass, "test/state", "online"
     )  # Simulate a (retained) message
     await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
+    await hass.async_block_till_done()
     assert calls_a.called
     assert calls_b.called
     mqtt_client_mock.subscribe.assert_called()
@@ -1137,10 +1242,12 @@ async def test_not_calling_unsubscribe_with_active_subscribers(
 
     unsub = await mqtt.async_subscribe(hass, "test/state", None)
     await mqtt.async_subscribe(hass, "test/state", None)
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
     await hass.async_block_till_done()
     assert mqtt_client_mock.subscribe.called
 
     unsub()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
     await hass.async_block_till_done()
     assert not mqtt_client_mock.unsubscribe.called
 
@@ -1158,6 +1265,7 @@ async def test_unsubscribe_race(hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_
     unsub = await mqtt.async_subscribe(hass, "test/state", calls_a)
     unsub()
     await mqtt.async_subscribe(hass, "test/state", calls_b)
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
     await hass.async_block_till_done()
 
     async_fire_mqtt_message(hass, "test/state", "online")
@@ -1165,17 +1273,11 @@ async def test_unsubscribe_race(hass, mqtt_client_mock, mqtt_mock_entry_no_yaml_
     assert not calls_a.called
     assert calls_b.called
 
-    # We allow either calls [subscribe, unsubscribe, subscribe] or [subscribe, subscribe]
-    expected_calls_1 = [
-        call.subscribe("test/state", 0),
-        call.unsubscribe("test/state"),
-        call.subscribe("test/state", 0),
-    ]
-    expected_calls_2 = [
-        call.subscribe("test/state", 0),
-        call.subscribe("test/state", 0),
+    # The unsubscribe is dropped as the topic is subscribed again in the cooldown
+    assert mqtt_client_mock.mock_calls == [
+        call.subscribe([("test/state", 0)]),
+        call.subscribe([("test/state", 0)]),
     ]
-    assert mqtt_client_mock.mock_calls in (expected_calls_1, expected_calls_2)
 
 
 @pytest.mark.parametrize(
@@ -1191,6 +1293,7 @@ async def test_restore_subscriptions_on_reconnect(
     mqtt_mock().connected = True
 
     await mqtt.async_subscribe(hass, "test/state", None)
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
     await hass.async_block_till_done()
     assert mqtt_client_mock.subscribe.call_count == 1
 
@@ -1198,6 +1301,8 @@ async def test_restore_subscriptions_on_reconnect(
     with patch("homeassistant.components.mqtt.client.DISCOVERY_COOLDOWN", 0):
         mqtt_client_mock.on_connect(None, None, None, 0)
         await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
+    await hass.async_block_till_done()
     assert mqtt_client_mock.subscribe.call_count == 2
 
 
@@ -1213,19 +1318,21 @@ async def test_restore_all_active_subscriptions_on_reconnect(
     # Fake that the client is connected
     mqtt_mock().connected = True
 
-    unsub = await mqtt.async_subscribe(hass, "test/state", None, qos=2)
-    await mqtt.async_subscribe(hass, "test/state", None)
-    await mqtt.async_subscribe(hass, "test/state", None, qos=1)
+    tasks = [
+        hass.async_create_task(mqtt.async_subscribe(hass, "test/state", None, qos))
+        for qos in (2, 0, 1)
+    ]
+    await asyncio.sleep(0)
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
     await hass.async_block_till_done()
+    unsub = tasks[0].result()
 
-    expected = [
-        call("test/state", 2),
-        call("test/state", 0),
-        call("test/state", 1),
-    ]
+    # Subscriptions in the same cooldown are merged by the highest qos
+    expected = [call([("test/state", 2)])]
     assert mqtt_client_mock.subscribe.mock_calls == expected
 
     unsub()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
     await hass.async_block_till_done()
     assert mqtt_client_mock.unsubscribe.call_count == 0
 
@@ -1233,8 +1340,10 @@ async def test_restore_all_active_subscriptions_on_reconnect(
     with patch("homeassistant.components.mqtt.client.DISCOVERY_COOLDOWN", 0):
         mqtt_client_mock.on_connect(None, None, None, 0)
         await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
+    await hass.async_block_till_done()
 
-    expected.append(call("test/state", 1))
+    expected.append(call([("test/state", 1)]))
     assert mqtt_client_mock.subscribe.mock_calls == expected
 
 
@@ -1316,6 +1425,27 @@ async def test_handle_message_callback(
     assert "Received message on some-topic: b'test-payload'" in caplog.text
 
 
+async def test_handle_message_batch(
+    hass, mqtt_mock_entry_no_yaml_config, mqtt_client_mock, calls, record_calls
+):
+    """Test messages received by the paho thread are handled in batches."""
+    await mqtt_mock_entry_no_yaml_config()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon_threadsafe:
+        for idx in range(3):
+            msg = ReceiveMessage("test-topic", f"{idx}".encode(), 0, False)
+            mqtt_client_mock.on_message(None, None, msg)
+        assert mock_call_soon_threadsafe.call_count == 1
+
+    await hass.async_block_till_done()
+    assert [call[0].payload for call in calls] == ["0", b"0", "1", b"1", "2", b"2"]
+    assert len({call[0].timestamp for call in calls}) == 1
+
+
 async def test_setup_override_configuration(hass, caplog, tmp_path):
     """Test override setup from configuration entry."""
     calls_username_password_set = []
@@ -1755,16 +1885,17 @@ async def test_mqtt_subscribes_topics_on_connect(
     await mqtt.async_subscribe(hass, "still/pending", None)
     await mqtt.async_subscribe(hass, "still/pending", None, 1)
 
-    hass.add_job = MagicMock()
     mqtt_client_mock.on_connect(None, None, 0, 0)
 
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))  # cooldown
     await hass.async_block_till_done()
 
     assert mqtt_client_mock.disconnect.call_count == 0
 
-    expected = {"topic/test": 0, "home/sensor": 2, "still/pending": 1}
-    calls = {call[1][1]: call[1][2] for call in hass.add_job.mock_calls}
-    assert calls == expected
+    mqtt_client_mock.subscribe.assert_called_once_with(
+        [("topic/test", 0), ("home/sensor", 2), ("still/pending", 1)]
+    )
 
 
 async def test_setup_entry_with_config_override(
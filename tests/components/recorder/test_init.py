@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 import sqlite3
 import threading
 from typing import cast
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
@@ -50,7 +50,7 @@ from homeassistant.const import (
     STATE_LOCKED,
     STATE_UNLOCKED,
 )
-from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.core import Context, CoreState, Event, HomeAssistant, callback
 from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util import dt as dt_util
 
@@ -77,7 +77,11 @@ def _default_recorder(hass):
         auto_purge=True,
         auto_repack=True,
         keep_days=7,
+        purge_time_budget=1.0,
         commit_interval=1,
+        bulk_write=False,
+        state_attributes_cache_size=2048,
+        event_data_cache_size=2048,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
@@ -1522,12 +1526,11 @@ def test_deduplication_event_data_inside_commit_interval(hass_recorder, caplog):
         assert all(event.data_id == first_data_id for event in events)
 
 
-# Patch STATE_ATTRIBUTES_ID_CACHE_SIZE since otherwise
+# Use a small state attributes cache since otherwise
 # the CI can fail because the test takes too long to run
-@patch("homeassistant.components.recorder.core.STATE_ATTRIBUTES_ID_CACHE_SIZE", 5)
 def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, caplog):
     """Test deduplication of state attributes inside the commit interval."""
-    hass = hass_recorder()
+    hass = hass_recorder({"state_attributes_cache_size": 5})
 
     entity_id = "test.recorder"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
@@ -1560,6 +1563,190 @@ def test_deduplication_state_attributes_inside_commit_interval(hass_recorder, ca
         assert first_attributes_id == last_attributes_id
 
 
+def _fetch_states_and_events(hass):
+    """Return the recorded states and events as comparable tuples."""
+    with session_scope(hass=hass) as session:
+        states = [
+            (
+                state.entity_id,
+                state.state,
+                state.last_changed,
+                process_timestamp(state.last_updated),
+                state.context_id,
+                state.attributes,
+                state.old_state_id,
+                state_attributes.shared_attrs,
+            )
+            for state, state_attributes in session.query(States, StateAttributes)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+        ]
+        state_ids = [
+            state_id
+            for (state_id,) in session.query(States.state_id).order_by(States.state_id)
+        ]
+        events = [
+            (
+                event.event_type,
+                event.origin_idx,
+                process_timestamp(event.time_fired),
+                event.context_id,
+                event_data.shared_data if event_data else None,
+            )
+            for event, event_data in session.query(Events, EventData)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .filter(Events.event_type.in_(["this_event", "other_event"]))
+            .order_by(Events.event_id)
+        ]
+        return state_ids, states, events
+
+
+@pytest.mark.parametrize("bulk_write", [False, True])
+def test_bulk_write_matches_orm(hass_recorder, bulk_write):
+    """Test bulk writes record the same rows as the ORM."""
+    hass = hass_recorder({"bulk_write": bulk_write})
+    assert (hass.data[DATA_INSTANCE]._bulk_writer is not None) is bulk_write
+    context = Context(id="01G6A3Z0T4ZY4N1BWAT9GDCS9Y")
+    time_fired = dt_util.utcnow()
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    attrs_json = '{"test_attr":5,"test_attr_10":"nice"}'
+
+    with patch("homeassistant.core.dt_util.utcnow", return_value=time_fired):
+        hass.states.set("test.one", "on", attributes, context=context)
+        hass.states.set("test.two", "on", attributes, context=context)
+        hass.bus.fire("this_event", {"de": "dupe"}, context=context)
+        hass.bus.fire("other_event", context=context)
+        wait_recording_done(hass)
+
+        # Chains of old states inside a single commit
+        hass.states.set("test.one", "off", attributes, context=context)
+        hass.states.set("test.one", "on", {"test_attr": 6}, context=context)
+        hass.states.set("test.one", "off", {"test_attr": 6}, context=context)
+        hass.states.remove("test.two")
+        hass.states.set("test.two", "on", {}, context=context)
+        hass.bus.fire("this_event", {"de": "dupe"}, context=context)
+        hass.bus.fire("this_event", {"new": "data"}, context=context)
+        wait_recording_done(hass)
+
+    state_ids, states, events = _fetch_states_and_events(hass)
+    old_state_ids = [state[6] for state in states]
+    assert old_state_ids == [
+        None,
+        None,
+        state_ids[0],
+        state_ids[2],
+        state_ids[3],
+        state_ids[1],
+        None,
+    ]
+    assert [state[:6] + state[7:] for state in states] == [
+        ("test.one", "on", None, time_fired, context.id, None, attrs_json),
+        ("test.two", "on", None, time_fired, context.id, None, attrs_json),
+        ("test.one", "off", None, time_fired, context.id, None, attrs_json),
+        ("test.one", "on", None, time_fired, context.id, None, '{"test_attr":6}'),
+        ("test.one", "off", None, time_fired, context.id, None, '{"test_attr":6}'),
+        ("test.two", None, None, time_fired, ANY, None, "{}"),
+        ("test.two", "on", None, time_fired, context.id, None, "{}"),
+    ]
+    assert events == [
+        ("this_event", 0, time_fired, context.id, '{"de":"dupe"}'),
+        ("other_event", 0, time_fired, context.id, None),
+        ("this_event", 0, time_fired, context.id, '{"de":"dupe"}'),
+        ("this_event", 0, time_fired, context.id, '{"new":"data"}'),
+    ]
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 3
+
+
+def test_bulk_write_purged_old_state(hass_recorder):
+    """Test bulk writes do not link to a purged old state."""
+    hass = hass_recorder({"bulk_write": True})
+    instance = hass.data[DATA_INSTANCE]
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+    state_id = instance._bulk_writer.old_state_ids["test.one"]
+
+    instance._bulk_writer.evict_purged_states({state_id})
+    assert "test.one" not in instance._bulk_writer.old_state_ids
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).order_by(States.state_id))
+        assert len(states) == 2
+        assert states[1].old_state_id is None
+
+
+def test_state_attributes_cache_hits_and_misses(hass_recorder):
+    """Test the state attributes cache counts hits and misses."""
+    hass = hass_recorder({"state_attributes_cache_size": 2})
+    state_attributes_ids = hass.data[DATA_INSTANCE]._state_attributes_ids
+    assert state_attributes_ids.size == 2
+
+    hass.states.set("test.one", "on", {"attr": 1})
+    wait_recording_done(hass)
+    misses = state_attributes_ids.misses
+    hits = state_attributes_ids.hits
+
+    hass.states.set("test.one", "off", {"attr": 1})
+    wait_recording_done(hass)
+    assert state_attributes_ids.hits == hits + 1
+    assert state_attributes_ids.misses == misses
+
+    for attr in range(2, 5):
+        hass.states.set("test.one", "on", {"attr": attr})
+    wait_recording_done(hass)
+    assert state_attributes_ids.misses == misses + 3
+    assert len(state_attributes_ids) == 2
+    assert '{"attr":1}' not in state_attributes_ids
+
+
+def test_state_attributes_cache_pre_warmed(tmpdir):
+    """Test the state attributes cache is pre-warmed on startup."""
+    test_db_file = tmpdir.mkdir("sqlite").join("test_run_info.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    setup_component(hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl}})
+    hass.start()
+    for idx in range(3):
+        hass.states.set(f"test.entity{idx}", "on", {"attr": idx})
+    # The most recent states share their attributes
+    hass.states.set("test.entity2", "off", {"attr": 2})
+    wait_recording_done(hass)
+    hass.stop()
+
+    hass = get_test_home_assistant()
+    setup_component(
+        hass,
+        DOMAIN,
+        {DOMAIN: {CONF_DB_URL: dburl, "state_attributes_cache_size": 2}},
+    )
+    hass.start()
+    wait_recording_done(hass)
+    state_attributes_ids = hass.data[DATA_INSTANCE]._state_attributes_ids
+    # Only the attributes of the most recent states fit in the cache
+    assert '{"attr":0}' not in state_attributes_ids
+    assert '{"attr":1}' in state_attributes_ids
+    assert '{"attr":2}' in state_attributes_ids
+
+    with patch.object(
+        hass.data[DATA_INSTANCE], "_find_shared_attr_in_db"
+    ) as find_shared_attr_in_db:
+        hass.states.set("test.entity2", "on", {"attr": 2})
+        hass.states.set("test.entity1", "off", {"attr": 1})
+        wait_recording_done(hass)
+    assert not find_shared_attr_in_db.called
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 3
+    hass.stop()
+
+
 async def test_async_block_till_done(hass, async_setup_recorder_instance):
     """Test we can block until recordering is done."""
     instance = await async_setup_recorder_instance(hass)
@@ -9,7 +9,11 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE, SupportedDialect
+from homeassistant.components.recorder.const import (
+    MAX_ROWS_TO_PURGE,
+    PURGE_BIND_VARS_HEADROOM,
+    SupportedDialect,
+)
 from homeassistant.components.recorder.models import (
     EventData,
     Events,
@@ -318,6 +322,114 @@ async def test_purge_old_statistics_runs(
         assert statistics_runs.count() == 1
 
 
+async def test_purge_yields_when_time_budget_is_used(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a purge returns after one slice when the time budget is used up."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_events(hass, MAX_ROWS_TO_PURGE)
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        assert events.count() == MAX_ROWS_TO_PURGE * 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        instance.purge_time_budget = 0
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert events.count() == MAX_ROWS_TO_PURGE * 5
+
+        progress = instance.purge_progress
+        assert progress.purge_before == purge_before
+        assert progress.rows == MAX_ROWS_TO_PURGE
+        assert progress.rows_per_second > 0
+        assert not progress.finished
+
+        instance.purge_time_budget = 60
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert events.count() == MAX_ROWS_TO_PURGE * 2
+        assert progress.rows == MAX_ROWS_TO_PURGE * 4
+        assert progress.finished
+        assert progress.percent == 100
+
+
+async def test_purge_slice_stays_below_bind_vars_limit(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a purge slice leaves headroom below the bound parameter limit."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_events(hass, MAX_ROWS_TO_PURGE)
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        instance.purge_time_budget = 0
+        instance.max_bind_vars = 100
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        slice_size = 100 - PURGE_BIND_VARS_HEADROOM
+        assert instance.purge_progress.rows == slice_size
+        assert events.count() == MAX_ROWS_TO_PURGE * 6 - slice_size
+
+
+async def test_purge_progress(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test the progress of a purge follows the purged states."""
+    instance = await async_setup_recorder_instance(hass)
+    utcnow = dt_util.utcnow()
+
+    with session_scope(hass=hass) as session:
+        for days in range(10, 0, -1):
+            for _ in range(MAX_ROWS_TO_PURGE):
+                _add_state_without_event_linkage(
+                    session, "sensor.progress", "on", utcnow - timedelta(days=days)
+                )
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States).filter(States.entity_id == "sensor.progress")
+        purge_before = utcnow - timedelta(days=5)
+
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            repack=False,
+            states_batch_size=1,
+            events_batch_size=1,
+        )
+        assert not finished
+        assert states.count() == MAX_ROWS_TO_PURGE * 9
+
+        # The oldest of the 5 days to purge is gone
+        progress = instance.purge_progress
+        assert progress.oldest == utcnow - timedelta(days=10)
+        assert progress.purged_until == utcnow - timedelta(days=10)
+        assert progress.percent == 0
+
+        finished = purge_old_data(
+            instance,
+            purge_before,
+            repack=False,
+            states_batch_size=2,
+            events_batch_size=2,
+        )
+        assert not finished
+        assert states.count() == MAX_ROWS_TO_PURGE * 7
+        assert progress.purged_until == utcnow - timedelta(days=8)
+        assert progress.percent == 40
+
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+        assert states.count() == MAX_ROWS_TO_PURGE * 5
+        assert progress.rows == MAX_ROWS_TO_PURGE * 5
+        assert progress.percent == 100
+
+
 @pytest.mark.parametrize("use_sqlite", (True, False), indirect=True)
 async def test_purge_method(
     hass: HomeAssistant,
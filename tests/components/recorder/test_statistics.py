@@ -14,6 +14,9 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import history, statistics
 from homeassistant.components.recorder.const import DATA_INSTANCE, SQLITE_URL_PREFIX
 from homeassistant.components.recorder.models import (
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
     StatisticsShortTerm,
     process_timestamp_to_utc_isoformat,
 )
@@ -879,6 +882,208 @@ def test_monthly_statistics(hass_recorder, caplog, timezone):
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+def test_daily_statistics_dst(hass_recorder):
+    """Test reducing statistics to days over a daylight saving time change."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    zero = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    external_statistics = [
+        {
+            "start": dt_util.as_utc(dt_util.parse_datetime(start)),
+            "mean": value,
+            "min": value,
+            "max": value,
+            "last_reset": None,
+            "state": value,
+            "sum": value,
+        }
+        for start, value in (
+            ("2021-10-30 23:00:00", 1.0),
+            ("2021-10-31 00:00:00", 2.0),
+            ("2021-10-31 02:00:00", 3.0),
+            # The day is 25 hours long, the last hour starts 24 hours after midnight
+            ("2021-10-31 23:00:00", 7.0),
+            ("2021-11-01 00:00:00", 5.0),
+        )
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Temperature",
+        "source": "test",
+        "statistic_id": "test:temperature",
+        "unit_of_measurement": "°C",
+    }
+
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="day")
+
+    def day(date, mean, min_, max_, sum_):
+        start = dt_util.as_utc(dt_util.parse_datetime(f"{date} 00:00:00"))
+        return {
+            "statistic_id": "test:temperature",
+            "start": start.isoformat(),
+            "end": (start + timedelta(days=1)).isoformat(),
+            "mean": approx(mean),
+            "min": approx(min_),
+            "max": approx(max_),
+            "last_reset": None,
+            "state": approx(sum_),
+            "sum": approx(sum_),
+        }
+
+    assert stats == {
+        "test:temperature": [
+            day("2021-10-30", 1.0, 1.0, 1.0, 1.0),
+            day("2021-10-31", 4.0, 2.0, 7.0, 7.0),
+            day("2021-11-01", 5.0, 5.0, 5.0, 5.0),
+        ]
+    }
+
+
+def test_period_statistics(hass_recorder):
+    """Test the daily and monthly statistics match the reduced hourly statistics."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = hass.data[DATA_INSTANCE]
+    assert instance.period_statistics_time_zone == "Europe/Amsterdam"
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-10-29 20:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": float(hour % 7),
+            "min": float(hour % 5) if hour % 3 else None,
+            "max": float(hour % 11),
+            "last_reset": None,
+            "state": float(hour),
+            "sum": float(hour),
+        }
+        for hour in range(0, 24 * 40, 3)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Temperature",
+        "source": "test",
+        "statistic_id": "test:temperature",
+        "unit_of_measurement": "°C",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsDaily).count() == 41
+        assert session.query(StatisticsMonthly).count() == 3
+
+    def assert_matches_hourly_statistics():
+        """Assert the daily and monthly statistics match the hourly statistics."""
+        for period in ("day", "month"):
+            for start_time, end_time in (
+                (start, None),
+                (start + timedelta(hours=5), start + timedelta(days=20, hours=7)),
+                (start + timedelta(days=3), start + timedelta(days=3, hours=5)),
+            ):
+                stats = statistics_during_period(
+                    hass, start_time, end_time, None, period
+                )
+                instance.period_statistics_time_zone = None
+                expected = statistics_during_period(
+                    hass, start_time, end_time, None, period
+                )
+                instance.period_statistics_time_zone = str(dt_util.DEFAULT_TIME_ZONE)
+                assert stats == approx(expected)
+
+    assert_matches_hourly_statistics()
+
+    instance.async_adjust_statistics(
+        "test:temperature", start + timedelta(days=2, hours=6), 100
+    )
+    wait_recording_done(hass)
+    assert_matches_hourly_statistics()
+
+    # The statistics are compiled again when the time zone changes
+    dt_util.set_default_time_zone(dt_util.get_time_zone("America/Los_Angeles"))
+    instance.schedule_compile_period_statistics()
+    # One month is compiled per recorder task
+    wait_recording_done(hass)
+    assert instance.period_statistics_time_zone is None
+    for _ in range(2):
+        wait_recording_done(hass)
+    assert instance.period_statistics_time_zone == "America/Los_Angeles"
+    assert_matches_hourly_statistics()
+
+
+def test_period_statistics_fold_compiled_hours(hass_recorder):
+    """Test compiled hours are added to the daily and monthly statistics."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Amsterdam"))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    instance = hass.data[DATA_INSTANCE]
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-10-31 22:00:00"))
+    with session_scope(hass=hass) as session:
+        metadata = StatisticsMeta.from_meta(
+            {
+                "has_mean": True,
+                "has_sum": True,
+                "name": "Temperature",
+                "source": "recorder",
+                "statistic_id": "sensor.test",
+                "unit_of_measurement": "°C",
+            }
+        )
+        session.add(metadata)
+        session.flush()
+        for minute in range(0, 5 * 60, 5):
+            value = float(minute % 17)
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    metadata.id,
+                    {
+                        "start": start + timedelta(minutes=minute),
+                        "mean": value,
+                        "min": value - 1,
+                        "max": value + minute % 3,
+                        "last_reset": None,
+                        "state": float(minute),
+                        "sum": float(minute),
+                    },
+                )
+            )
+
+    with session_scope(hass=hass) as session, patch.object(
+        statistics,
+        "_compile_period_statistics",
+        wraps=statistics._compile_period_statistics,
+    ) as compile_period_mock:
+        for hour in range(5):
+            statistics.compile_hourly_statistics(
+                instance, session, start + timedelta(hours=hour)
+            )
+        # Only the new hours are read
+        assert compile_period_mock.call_count == 0
+
+    with session_scope(hass=hass) as session:
+        assert [row.mean_count for row in session.query(StatisticsDaily)] == [2, 3]
+        assert [row.mean_count for row in session.query(StatisticsMonthly)] == [2, 3]
+
+    for period in ("day", "month"):
+        stats = statistics_during_period(hass, start, None, None, period)
+        instance.period_statistics_time_zone = None
+        expected = statistics_during_period(hass, start, None, None, period)
+        instance.period_statistics_time_zone = str(dt_util.DEFAULT_TIME_ZONE)
+        assert stats["sensor.test"] == approx(expected["sensor.test"])
+        assert len(stats["sensor.test"]) == 2
+
+
 def test_delete_duplicates_no_duplicates(hass_recorder, caplog):
     """Test removal of duplicated statistics."""
     hass = hass_recorder()
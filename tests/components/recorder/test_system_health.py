@@ -1,5 +1,6 @@
 """Test recorder system health."""
 
+from datetime import timedelta
 from unittest.mock import ANY, Mock, patch
 
 import pytest
@@ -8,6 +9,7 @@ from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -26,6 +28,7 @@ async def test_recorder_system_health(hass, recorder_mock):
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "event_data_cache_hit_rate": ANY,
     }
 
 
@@ -50,6 +53,7 @@ async def test_recorder_system_health_alternate_dbms(hass, recorder_mock, dialec
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "event_data_cache_hit_rate": ANY,
     }
 
 
@@ -81,6 +85,7 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": dialect_name.value,
         "database_version": ANY,
+        "event_data_cache_hit_rate": ANY,
     }
 
 
@@ -99,4 +104,34 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "event_data_cache_hit_rate": ANY,
     }
+
+
+async def test_recorder_system_health_purge_progress(hass, recorder_mock):
+    """Test recorder system health with the progress of a purge."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    progress = instance.purge_progress
+    progress.start(dt_util.utcnow(), dt_util.utcnow() - timedelta(days=10))
+    progress.purged_until = dt_util.utcnow() - timedelta(days=5)
+    progress.rows = 2000
+    progress.seconds = 4.0
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_progress"] == "50.0 %"
+    assert info["purge_rows_per_second"] == "500"
+
+
+async def test_recorder_system_health_id_cache_hit_rate(hass, recorder_mock):
+    """Test recorder system health with the hit rates of the id caches."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    instance._state_attributes_ids.hits = 3
+    instance._state_attributes_ids.misses = 1
+    instance._event_data_ids.hits = 0
+    instance._event_data_ids.misses = 0
+    info = await get_system_health_info(hass, "recorder")
+    assert info["state_attributes_cache_hit_rate"] == "75.0 %"
+    assert "event_data_cache_hit_rate" not in info
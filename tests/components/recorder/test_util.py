@@ -4,6 +4,7 @@ import os
 import sqlite3
 from unittest.mock import MagicMock, Mock, patch
 
+from awesomeversion import AwesomeVersion
 import pytest
 from sqlalchemy import text
 from sqlalchemy.engine.result import ChunkedIteratorResult
@@ -195,6 +196,7 @@ def test_setup_connection_for_dialect_mysql(mysql_version):
     assert len(execute_args) == 2
     assert execute_args[0] == "SET session wait_timeout=28800"
     assert execute_args[1] == "SELECT VERSION()"
+    assert instance_mock.max_bind_vars == 65535
 
 
 @pytest.mark.parametrize(
@@ -230,6 +232,7 @@ def test_setup_connection_for_dialect_sqlite(sqlite_version):
     assert execute_args[2] == "PRAGMA cache_size = -16384"
     assert execute_args[3] == "PRAGMA synchronous=NORMAL"
     assert execute_args[4] == "PRAGMA foreign_keys=ON"
+    assert instance_mock.max_bind_vars == 998
 
     execute_args = []
     util.setup_connection_for_dialect(instance_mock, "sqlite", dbapi_connection, False)
@@ -240,6 +243,26 @@ def test_setup_connection_for_dialect_sqlite(sqlite_version):
     assert execute_args[2] == "PRAGMA foreign_keys=ON"
 
 
+@pytest.mark.parametrize(
+    "sqlite_version, max_bind_vars",
+    [("3.31.0", 998), ("3.32.0", 32766), ("3.40.1", 32766)],
+)
+def test_sqlite_max_bind_vars_from_version(sqlite_version, max_bind_vars):
+    """Test the maximum bound parameters of a SQLite connection without getlimit."""
+    version = AwesomeVersion(sqlite_version)
+    assert util._sqlite_max_bind_vars(MagicMock(), version) == max_bind_vars
+
+
+def test_sqlite_max_bind_vars_from_connection():
+    """Test the maximum bound parameters are read from a SQLite connection."""
+    connection = sqlite3.connect(":memory:")
+    if not hasattr(connection, "getlimit"):
+        pytest.skip("Connection.getlimit requires Python 3.11")
+    connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 500)
+    assert util._sqlite_max_bind_vars(connection, AwesomeVersion("3.40.1")) == 499
+    connection.close()
+
+
 @pytest.mark.parametrize(
     "sqlite_version",
     ["3.31.0"],
@@ -144,6 +144,62 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_hourly_statistics_accumulated_states(hass_recorder, caplog):
+    """Test compiling statistics from the states accumulated since startup."""
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    zero = dt_util.utcnow() + timedelta(minutes=1)
+    attributes = {
+        "device_class": None,
+        "state_class": "measurement",
+        "unit_of_measurement": "%",
+    }
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow",
+        return_value=zero - timedelta(seconds=1),
+    ):
+        hass.states.set("sensor.test1", "0", attributes=attributes)
+        # The first state of this sensor is seen during the period
+        hass.states.set("sensor.test2", "0", attributes=attributes)
+        wait_recording_done(hass)
+    record_states(hass, zero, "sensor.test1", attributes)
+    with patch(
+        "homeassistant.components.recorder.core.dt_util.utcnow",
+        return_value=zero + timedelta(seconds=1),
+    ):
+        hass.states.set("sensor.test3", "20", attributes=attributes)
+        wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_states:
+        do_adhoc_statistics(hass, start=zero)
+        wait_recording_done(hass)
+    # Only the sensor first seen during the period is read from the database
+    assert get_states.call_count == 1
+    assert get_states.call_args[1]["entity_ids"] == ["sensor.test3"]
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats["sensor.test1"] == [
+        {
+            "statistic_id": "sensor.test1",
+            "start": process_timestamp_to_utc_isoformat(zero),
+            "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=5)),
+            "mean": approx((-10 * 50 + 15 * 200 + 30 * 45) / 300),
+            "min": approx(-10.0),
+            "max": approx(30.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        }
+    ]
+    assert stats["sensor.test2"][0]["mean"] == approx(0.0)
+    assert stats["sensor.test3"][0]["mean"] == approx(20.0)
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit",
     [
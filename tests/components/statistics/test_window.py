@@ -0,0 +1,73 @@
+"""Test the sample window of the statistics sensor."""
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import SampleWindow
+
+
+@pytest.mark.parametrize("maxlen", [1, 2, 7, 50])
+def test_window_matches_recomputation(maxlen):
+    """Test the incremental aggregates match a recomputation of the window."""
+    rnd = random.Random(maxlen)
+    window = SampleWindow(maxlen, track_order=True)
+    values = []
+    timestamps = []
+
+    for idx in range(300):
+        value = float(rnd.randint(-20, 20)) if idx % 3 else rnd.uniform(-1e3, 1e3)
+        timestamp = 1650000000.0 + idx * 10 + rnd.random()
+        window.append(value, timestamp)
+        values = (values + [value])[-maxlen:]
+        timestamps = (timestamps + [timestamp])[-maxlen:]
+        if idx % 11 == 10 and len(values) > 1:
+            window.popleft()
+            values.pop(0)
+            timestamps.pop(0)
+
+        assert list(window.values) == values
+        assert list(window.timestamps) == timestamps
+        assert window.sum == pytest.approx(sum(values))
+        assert window.mean == pytest.approx(statistics.mean(values))
+        assert window.median() == statistics.median(values)
+        max_value = max(values)
+        assert window.max == (max_value, timestamps[values.index(max_value)])
+        min_value = min(values)
+        assert window.min == (min_value, timestamps[values.index(min_value)])
+        if len(values) < 2:
+            continue
+        assert window.variance == pytest.approx(statistics.variance(values))
+        assert window.abs_diff_sum == pytest.approx(
+            sum(abs(j - i) for i, j in zip(values, values[1:]))
+        )
+        durations = [j - i for i, j in zip(timestamps, timestamps[1:])]
+        assert window.linear_area == pytest.approx(
+            sum(0.5 * (i + j) * d for i, j, d in zip(values, values[1:], durations))
+        )
+        assert window.step_area == pytest.approx(
+            sum(i * d for i, d in zip(values, durations))
+        )
+        for method in ("exclusive", "inclusive"):
+            assert window.quantiles(4, method) == pytest.approx(
+                statistics.quantiles(values, n=4, method=method)
+            )
+
+
+def test_window_empty_after_eviction():
+    """Test the aggregates are reset once the last sample leaves the window."""
+    window = SampleWindow(3)
+    window.append(5.0, 1.0)
+    window.append(7.0, 2.0)
+    window.popleft()
+    window.popleft()
+
+    assert len(window) == 0
+    assert window.sum == 0
+    assert window.abs_diff_sum == 0
+    assert window.linear_area == 0
+
+    window.append(-3.0, 10.0)
+    assert window.mean == -3.0
+    assert window.max == (-3.0, 10.0)
+    assert window.min == (-3.0, 10.0)
@@ -13,7 +13,7 @@ from homeassistant.core import Context, CoreState, callback
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
 
-from tests.common import assert_lists_same, load_fixture
+from tests.common import assert_lists_same, async_capture_events, load_fixture
 
 
 def _find_run_id(traces, trace_type, item_id):
@@ -35,7 +35,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_level=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -49,15 +49,14 @@ async def _setup_automation_or_script(
         else:
             configs = {**configs, **script_config}
 
+    trace_config = {}
     if stored_traces is not None:
-        if domain == "script":
-            for config in configs.values():
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
-        else:
-            for config in configs:
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+        trace_config["stored_traces"] = stored_traces
+    if trace_level is not None:
+        trace_config["level"] = trace_level
+    if trace_config:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = dict(trace_config)
 
     assert await async_setup_component(hass, domain, {domain: configs})
 
@@ -752,6 +751,38 @@ async def test_trace_no_traces(hass, hass_ws_client, domain):
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_level_off(hass, hass_ws_client, domain):
+    """Test tracing a script or automation can be turned off."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    events = async_capture_events(hass, "some_event")
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config], trace_level="off")
+
+    client = await hass_ws_client()
+
+    # Trigger "sun" automation / script once
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+    # List traces
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == 0
+
+
 @pytest.mark.parametrize(
     "domain, prefix, trigger, last_step, script_execution",
     [
@@ -619,19 +619,24 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
 
 
 async def test_get_states_not_allows_nan(hass, websocket_client):
-    """Test get_states command not allows NaN floats."""
+    """Test get_states command converts NaN floats to None."""
     hass.states.async_set("greeting.hello", "world")
     hass.states.async_set("greeting.bad", "data", {"hello": float("NaN")})
     hass.states.async_set("greeting.bye", "universe")
 
     await websocket_client.send_json({"id": 5, "type": "get_states"})
 
+    bad = dict(hass.states.get("greeting.bad").as_dict())
+    bad["attributes"] = dict(bad["attributes"])
+    bad["attributes"]["hello"] = None
+
     msg = await websocket_client.receive_json()
     assert msg["id"] == 5
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
         hass.states.get("greeting.hello").as_dict(),
+        bad,
         hass.states.get("greeting.bye").as_dict(),
     ]
 
@@ -1745,3 +1750,151 @@ async def test_validate_config_invalid(websocket_client, key, config, error):
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == {key: {"valid": False, "error": error}}
+
+
+async def test_supported_features(websocket_client):
+    """Test setting the supported features of the client."""
+    await websocket_client.send_json(
+        {"id": 7, "type": "supported_features", "features": {"some_feature": 1}}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+
+async def test_coalesced_messages(hass, websocket_client):
+    """Test messages that are queued together are sent as one frame."""
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    msgs = await websocket_client.receive_json()
+    assert [(msg["id"], msg["event"]["data"]) for msg in msgs] == [
+        (6, {"idx": 0}),
+        (6, {"idx": 1}),
+        (6, {"idx": 2}),
+    ]
+
+
+async def test_coalesced_frame_size_is_bounded(hass, websocket_client):
+    """Test queued messages are split over frames of a bounded size."""
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    with patch(
+        "homeassistant.components.websocket_api.http.MAX_COALESCED_FRAME_SIZE", 1
+    ):
+        for idx in range(3):
+            hass.bus.async_fire("test_event", {"idx": idx})
+
+        for idx in range(3):
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == 6
+            assert msg["event"]["data"] == {"idx": idx}
+
+
+async def test_subscribe_entities_merges_coalesced_changes(hass, websocket_client):
+    """Test subscribe entities merges successive changes when coalescing."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msgs = await websocket_client.receive_json()
+    assert msgs == [
+        {"id": 7, "type": const.TYPE_RESULT, "success": True, "result": None},
+        {
+            "id": 7,
+            "type": "event",
+            "event": {
+                "a": {
+                    "light.permitted": {
+                        "a": {"color": "red"},
+                        "c": ANY,
+                        "lc": ANY,
+                        "s": "off",
+                    },
+                    "light.removed": {"a": {}, "c": ANY, "lc": ANY, "s": "off"},
+                }
+            },
+        },
+    ]
+
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_set("light.permitted", "on", {"effect": "help"})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.added", "off")
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.flash", "on")
+    hass.states.async_remove("light.flash")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {"a": {"effect": "help"}, "c": ANY, "lc": ANY, "s": "on"},
+                "-": {"a": ["color"]},
+            }
+        },
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}},
+        "r": ["light.removed"],
+    }
+
+    # Nothing is sent for entities the client never saw
+    hass.states.async_set("light.flash", "on")
+    hass.states.async_remove("light.flash")
+    await websocket_client.send_json({"id": 8, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg == {"id": 8, "type": "pong"}
+
+    hass.states.async_set("light.permitted", "off", {"effect": "help"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
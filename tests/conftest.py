@@ -644,6 +644,16 @@ async def mqtt_mock_entry_with_yaml_config(hass, mqtt_client_mock, mqtt_config):
         yield _setup_mqtt_entry
 
 
+@pytest.fixture(autouse=True)
+def custom_manifest_cache(tmp_path):
+    """Write the custom manifest cache to a temporary directory."""
+    with patch(
+        "homeassistant.loader.CUSTOM_MANIFEST_CACHE",
+        str(tmp_path / "core.custom_manifests"),
+    ):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def mock_get_source_ip():
     """Mock network util's async_get_source_ip."""
@@ -816,6 +816,27 @@ async def test_float_conversion(hass):
     assert state.state == "3.6"
 
 
+async def test_write_state_shares_unchanged_attributes(hass):
+    """Test a state only change shares the attributes with the old state."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state = "on"
+    ent._attr_extra_state_attributes = {"brightness": 100}
+    ent.async_write_ha_state()
+    old_state = hass.states.get("hello.world")
+
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    new_state = hass.states.get("hello.world")
+    assert new_state.state == "off"
+    assert new_state.attributes is old_state.attributes
+
+    ent._attr_extra_state_attributes = {"brightness": 50}
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes is not old_state.attributes
+
+
 async def test_temperature_conversion(hass, caplog):
     """Test conversion of temperatures."""
     # Non sensor entity reporting a temperature
@@ -105,25 +105,32 @@ async def test_setup_does_discovery(mock_setup_component, mock_setup, hass):
     assert ("platform_test", {}, {"msg": "discovery_info"}) == mock_setup.call_args[0]
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_config(mock_track, hass):
+async def test_set_scan_interval_via_config(hass):
     """Test the setting of the scan interval via configuration."""
+    entity = MockEntity(should_poll=True)
+    entity.async_update = Mock()
 
     def platform_setup(hass, config, add_entities, discovery_info=None):
         """Test the platform setup."""
-        add_entities([MockEntity(should_poll=True)])
+        add_entities([entity])
 
     mock_entity_platform(hass, "test_domain.platform", MockPlatform(platform_setup))
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
+    now = dt_util.utcnow()
     component.setup(
         {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
     )
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    entity.async_update.reset_mock()
+
+    for seconds in range(1, 61):
+        async_fire_time_changed(hass, now + timedelta(seconds=seconds))
+        await hass.async_block_till_done()
+
+    assert len(entity.async_update.mock_calls) == 2
 
 
 async def test_set_entity_namespace_via_config(hass):
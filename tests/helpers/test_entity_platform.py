@@ -109,6 +109,170 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_spreads_entity_updates(hass):
+    """Test the polls of entities are spread over the scan interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    early_ent = MockEntity(should_poll=True, entity_id="test_domain.early")
+    early_ent.async_update = Mock()
+    late_ent = MockEntity(should_poll=True, entity_id="test_domain.late")
+    late_ent.async_update = Mock()
+
+    assert entity_platform._polling_offset("test_domain.early", 20) < 9
+    assert entity_platform._polling_offset("test_domain.late", 20) > 12
+
+    now = dt_util.utcnow()
+    await component.async_add_entities([early_ent, late_ent])
+
+    async_fire_time_changed(hass, now + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert len(early_ent.async_update.mock_calls) == 1
+    assert len(late_ent.async_update.mock_calls) == 0
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert len(early_ent.async_update.mock_calls) == 1
+    assert len(late_ent.async_update.mock_calls) == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert len(early_ent.async_update.mock_calls) == 2
+    assert len(late_ent.async_update.mock_calls) == 1
+
+    platform = component._platforms[DOMAIN]
+    assert platform.polling_stats.updates == 3
+    assert platform.polling_stats.overruns == 0
+
+
+async def test_polling_overrun(hass, caplog):
+    """Test a poll is skipped while the previous update is still running."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    update_started = asyncio.Event()
+    update_done = asyncio.Event()
+
+    async def slow_update():
+        update_started.set()
+        await update_done.wait()
+
+    ent = MockEntity(should_poll=True, entity_id="test_domain.slow")
+    ent.async_update = Mock(side_effect=slow_update)
+
+    now = dt_util.utcnow()
+    await component.async_add_entities([ent])
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await update_started.wait()
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    update_done.set()
+    await hass.async_block_till_done()
+
+    assert len(ent.async_update.mock_calls) == 1
+    stats = component._platforms[DOMAIN].polling_stats
+    assert stats.updates == 1
+    assert stats.overruns == 1
+    assert "Updating test_domain.slow took longer than" in caplog.text
+
+
+async def test_polling_parallel_updates_limited(hass):
+    """Test the number of polling updates at a time is limited across platforms."""
+    running = 0
+    max_running = 0
+
+    async def update():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    entities = []
+    for index in range(4):
+        ent = MockEntity(should_poll=True, entity_id=f"test_domain.ent_{index}")
+        ent.async_update = update
+        entities.append(ent)
+
+    with patch.object(entity_platform, "MAX_PARALLEL_POLLING_UPDATES", 2):
+        component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+        other = EntityComponent(_LOGGER, "other_domain", hass, timedelta(seconds=20))
+        await component.async_add_entities(entities[:2])
+        await other.async_add_entities(entities[2:])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert component._platforms[DOMAIN].polling_stats.updates == 2
+    assert other._platforms["other_domain"].polling_stats.updates == 2
+    assert max_running == 2
+
+
+async def test_polling_platform_parallel_updates_before_global_limit(hass):
+    """Test the polls of a platform wait for its parallel updates first."""
+    blocked = asyncio.Event()
+    release = asyncio.Event()
+    fast_updated = asyncio.Event()
+
+    async def slow_update():
+        blocked.set()
+        await release.wait()
+
+    async def fast_update():
+        fast_updated.set()
+
+    slow_platform = MockPlatform()
+    slow_platform.PARALLEL_UPDATES = 1
+    with patch.object(entity_platform, "MAX_PARALLEL_POLLING_UPDATES", 2):
+        slow = MockEntityPlatform(
+            hass,
+            platform_name="slow",
+            platform=slow_platform,
+            scan_interval=timedelta(seconds=20),
+        )
+        fast = MockEntityPlatform(
+            hass, platform_name="fast", scan_interval=timedelta(seconds=20)
+        )
+        slow_entities = []
+        for index in range(3):
+            ent = MockEntity(should_poll=True, entity_id=f"test_domain.slow_{index}")
+            ent.async_update = slow_update
+            slow_entities.append(ent)
+        fast_ent = MockEntity(should_poll=True, entity_id="test_domain.fast")
+        fast_ent.async_update = fast_update
+
+        await slow.async_add_entities(slow_entities)
+        await fast.async_add_entities([fast_ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await blocked.wait()
+    await asyncio.wait_for(fast_updated.wait(), 1)
+
+    release.set()
+    await hass.async_block_till_done()
+    assert slow.polling_stats.updates == 3
+    assert fast.polling_stats.updates == 1
+
+
+async def test_polling_stats_logged(hass, caplog):
+    """Test the polling statistics are logged at debug level."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    ent = MockEntity(should_poll=True, entity_id="test_domain.polled")
+    ent.async_update = Mock()
+
+    now = dt_util.utcnow()
+    await component.async_add_entities([ent])
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    caplog.set_level(logging.DEBUG, logger=entity_platform.__name__)
+    async_fire_time_changed(
+        hass, now + entity_platform.POLLING_STATS_LOG_INTERVAL + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+
+    assert "Polling test_domain test_domain: " in caplog.text
+    assert " 0 overruns" in caplog.text
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -154,13 +318,14 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
-async def test_set_scan_interval_via_platform(mock_track, hass):
+async def test_set_scan_interval_via_platform(hass):
     """Test the setting of the scan interval via platform."""
+    entity = MockEntity(should_poll=True)
+    entity.async_update = Mock()
 
     def platform_setup(hass, config, add_entities, discovery_info=None):
         """Test the platform setup."""
-        add_entities([MockEntity(should_poll=True)])
+        add_entities([entity])
 
     platform = MockPlatform(platform_setup)
     platform.SCAN_INTERVAL = timedelta(seconds=30)
@@ -169,11 +334,17 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
+    now = dt_util.utcnow()
     component.setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    entity.async_update.reset_mock()
+
+    for seconds in range(1, 61):
+        async_fire_time_changed(hass, now + timedelta(seconds=seconds))
+        await hass.async_block_till_done()
+
+    assert len(entity.async_update.mock_calls) == 2
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
@@ -1,6 +1,7 @@
 """Tests for the Entity Registry."""
 from unittest.mock import patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -1220,6 +1221,54 @@ def test_entity_registry_items():
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_secondary_indexes():
+    """Test the device, area and config entry indexes of EntityRegistryItems."""
+    entities = er.EntityRegistryItems()
+    assert entities.get_entries_for_device_id("device1") == []
+    assert entities.get_entries_for_area_id("area1") == []
+    assert entities.get_entries_for_config_entry_id("entry1") == []
+
+    entry1 = er.RegistryEntry(
+        "test.entity1",
+        "1234",
+        "hue",
+        area_id="area1",
+        config_entry_id="entry1",
+        device_id="device1",
+    )
+    entry2 = er.RegistryEntry(
+        "test.entity2", "2345", "hue", config_entry_id="entry1", device_id="device1"
+    )
+    entities["test.entity1"] = entry1
+    entities["test.entity2"] = entry2
+
+    assert entities.get_entries_for_device_id("device1") == [entry1, entry2]
+    assert entities.get_entries_for_area_id("area1") == [entry1]
+    assert entities.get_entries_for_config_entry_id("entry1") == [entry1, entry2]
+
+    entry1_moved = attr.evolve(entry1, area_id="area2", device_id="device2")
+    entities["test.entity1"] = entry1_moved
+    entry2_updated = attr.evolve(entry2, name="Updated")
+    entities["test.entity2"] = entry2_updated
+
+    assert entities.get_entries_for_device_id("device1") == [entry2_updated]
+    assert entities.get_entries_for_device_id("device2") == [entry1_moved]
+    assert entities.get_entries_for_area_id("area1") == []
+    assert entities.get_entries_for_area_id("area2") == [entry1_moved]
+    assert entities.get_entries_for_config_entry_id("entry1") == [
+        entry1_moved,
+        entry2_updated,
+    ]
+
+    del entities["test.entity1"]
+    entities.pop("test.entity2")
+
+    assert entities.get_entries_for_device_id("device1") == []
+    assert entities.get_entries_for_device_id("device2") == []
+    assert entities.get_entries_for_area_id("area2") == []
+    assert entities.get_entries_for_config_entry_id("entry1") == []
+
+
 async def test_disabled_by_str_not_allowed(hass):
     """Test we need to pass entity category type."""
     reg = er.async_get(hass)
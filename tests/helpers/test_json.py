@@ -1,10 +1,16 @@
 """Test Home Assistant remote methods and classes."""
 import datetime
+import json
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers.json import (
+    ExtendedJSONEncoder,
+    JSONEncoder,
+    json_bytes,
+    json_dumps,
+)
 from homeassistant.util import dt as dt_util
 
 
@@ -64,3 +70,43 @@ def test_extended_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+def test_json_dumps(hass):
+    """Test dumping Home Assistant objects matches the JSONEncoder."""
+    now = dt_util.utcnow()
+    state = core.State("test.test", "hello", {"when": now, "ids": {1}})
+    data = {"state": state, "now": now, 1: ["ünïcode", 1.5, None, True]}
+
+    expected = json.loads(json.dumps(data, cls=JSONEncoder))
+    assert json.loads(json_dumps(data)) == expected
+    assert json.loads(json_bytes(data)) == expected
+    assert json_dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+    assert json_bytes({"a": [1, 2]}, indent=True) == json.dumps(
+        {"a": [1, 2]}, indent=2
+    ).encode("utf-8")
+
+
+def test_json_dumps_falls_back_to_json_encoder(hass):
+    """Test data orjson can not serialize falls back to the JSONEncoder."""
+    assert (
+        json_dumps({"big": 2**70, "ids": {1}})
+        == '{"big":1180591620717411303424,"ids":[1]}'
+    )
+    assert json_bytes([2**70], indent=True) == b"[\n  1180591620717411303424\n]"
+
+    with pytest.raises(TypeError):
+        json_dumps({"bad": object()})
+
+
+def test_json_dumps_non_finite_floats(hass):
+    """Test NaN and infinity are written as null on both serialization paths."""
+    state = core.State("test.test", "hello", {"value": float("nan")})
+    assert json_dumps({"a": float("nan"), "b": float("inf")}) == '{"a":null,"b":null}'
+    assert (
+        json_dumps({"big": 2**70, "values": (float("-inf"), 1.5)})
+        == '{"big":1180591620717411303424,"values":[null,1.5]}'
+    )
+    assert json.loads(json_dumps({"big": 2**70, "state": state}))["state"][
+        "attributes"
+    ] == {"value": None}
@@ -1,13 +1,16 @@
 """The tests for the Restore component."""
 from datetime import datetime, timedelta
+import json
 from unittest.mock import patch
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
+    JOURNAL_STORAGE_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -73,13 +76,22 @@ async def test_periodic_write(hass):
 
     assert mock_write_data.called
 
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    ) as mock_write_data, patch(
+        "homeassistant.helpers.restore_state.Journal.async_append"
+    ) as mock_append:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
 
-    assert mock_write_data.called
+    # Only the changed state is appended to the journal
+    assert not mock_write_data.called
+    assert mock_append.called
+    records = mock_append.mock_calls[0][1][0]
+    assert [record["entity_id"] for record in records] == ["input_boolean.b1"]
 
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
@@ -91,11 +103,14 @@ async def test_periodic_write(hass):
 
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    ) as mock_write_data, patch(
+        "homeassistant.helpers.restore_state.Journal.async_append"
+    ) as mock_append:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
         await hass.async_block_till_done()
 
     assert not mock_write_data.called
+    assert not mock_append.called
 
 
 async def test_save_persistent_states(hass):
@@ -137,13 +152,16 @@ async def test_save_persistent_states(hass):
 
     assert mock_write_data.called
 
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+        "homeassistant.helpers.restore_state.Journal.async_append"
+    ) as mock_append:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
     # Verify still saving
-    assert mock_write_data.called
+    assert mock_append.called
 
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
@@ -240,7 +258,7 @@ async def test_dump_data(hass):
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
-        await data.async_dump_states()
+        await data.async_dump_states(compact=True)
 
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
@@ -265,9 +283,27 @@ async def test_dump_data(hass):
 
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
+    ) as mock_write_data, patch(
+        "homeassistant.helpers.restore_state.Journal.async_append"
+    ) as mock_append, patch.object(
+        hass.states, "async_all", return_value=states
+    ):
         await data.async_dump_states()
 
+    # Only the removal is appended to the journal
+    assert not mock_write_data.called
+    assert mock_append.called
+    records = mock_append.mock_calls[0][1][0]
+    assert len(records) == 1
+    assert records[0]["entity_id"] == "input_boolean.b1"
+    assert records[0]["stored_state"] is None
+
+    # All states are saved when compacting
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
+        await data.async_dump_states(compact=True)
+
     assert mock_write_data.called
     args = mock_write_data.mock_calls[0][1]
     written_states = args[0]
@@ -302,7 +338,7 @@ async def test_dump_error(hass):
         "homeassistant.helpers.restore_state.Store.async_save",
         side_effect=HomeAssistantError,
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
-        await data.async_dump_states()
+        await data.async_dump_states(compact=True)
 
     assert mock_write_data.called
 
@@ -377,3 +413,123 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+def _as_json(data):
+    """Return data as it is loaded from JSON."""
+    return json.loads(json.dumps(data, cls=JSONEncoder))
+
+
+async def test_journal(hass, hass_storage):
+    """Test changed states are journaled and loaded on top of the saved states."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+    other = RestoreEntity()
+    other.hass = hass
+    other.entity_id = "input_boolean.b2"
+    await other.async_internal_added_to_hass()
+    unchanged = RestoreEntity()
+    unchanged.hass = hass
+    unchanged.entity_id = "input_boolean.b3"
+    await unchanged.async_internal_added_to_hass()
+
+    hass.states.async_set("input_boolean.b1", "off")
+    hass.states.async_set("input_boolean.b2", "off")
+    hass.states.async_set("input_boolean.b3", "off")
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states(compact=True)
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    assert JOURNAL_STORAGE_KEY not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_states()
+    assert [record["entity_id"] for record in hass_storage[JOURNAL_STORAGE_KEY]] == [
+        "input_boolean.b1"
+    ]
+
+    # Nothing changed
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_STORAGE_KEY]) == 1
+
+    await other.async_remove()
+    hass.states.async_remove("input_boolean.b2")
+    data.last_states.pop("input_boolean.b2")
+    await data.async_dump_states()
+    assert hass_storage[JOURNAL_STORAGE_KEY][1]["entity_id"] == "input_boolean.b2"
+    assert hass_storage[JOURNAL_STORAGE_KEY][1]["stored_state"] is None
+
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE_TASK)
+    data = await RestoreStateData.async_get_instance(hass)
+    assert data.last_states["input_boolean.b1"].state.state == "on"
+    assert data.last_states["input_boolean.b3"].state.state == "off"
+    assert "input_boolean.b2" not in data.last_states
+
+
+async def test_journal_compacted(hass, hass_storage):
+    """Test the journal is cleared when all states are saved."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+
+    hass.states.async_set("input_boolean.b1", "off")
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states(compact=True)
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_STORAGE_KEY]) == 1
+
+    # The journal holds more records than half the states
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_states()
+    assert JOURNAL_STORAGE_KEY not in hass_storage
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "off"
+
+
+async def test_journal_older_than_saved_states(hass, hass_storage):
+    """Test journal records older than the saved states are skipped."""
+    now = dt_util.utcnow()
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": _as_json(
+            [
+                StoredState(State("input_boolean.b1", "on"), None, now),
+                StoredState(State("input_boolean.b2", "on"), None, now),
+            ]
+        ),
+    }
+    hass_storage[JOURNAL_STORAGE_KEY] = _as_json(
+        [
+            {
+                "entity_id": "input_boolean.b1",
+                "stored_state": StoredState(
+                    State("input_boolean.b1", "off"), None, now - timedelta(minutes=15)
+                ),
+                "time": (now - timedelta(minutes=15)).isoformat(),
+            },
+            {
+                "entity_id": "input_boolean.b2",
+                "stored_state": None,
+                "time": (now - timedelta(minutes=15)).isoformat(),
+            },
+            {
+                "entity_id": "input_boolean.b3",
+                "stored_state": StoredState(
+                    State("input_boolean.b3", "off"), None, now - timedelta(minutes=15)
+                ),
+                "time": (now - timedelta(minutes=15)).isoformat(),
+            },
+        ]
+    )
+
+    data = await RestoreStateData.async_get_instance(hass)
+    assert data.last_states["input_boolean.b1"].state.state == "on"
+    assert data.last_states["input_boolean.b2"].state.state == "on"
+    assert data.last_states["input_boolean.b3"].state.state == "off"
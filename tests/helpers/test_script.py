@@ -5110,3 +5110,65 @@ async def test_condition_not_shorthand(hass, caplog):
             "2": [{"result": {"event": "test_event", "event_data": {}}}],
         }
     )
+
+
+async def test_trace_level_summary(hass):
+    """Test actions are traced without variables or breakpoints at level summary."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"value": 1}},
+            {"event": event, "event_data": {"value": "{{ value }}"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+    trace.trace_id_set(("script_1", "1"))
+    script.breakpoint_set(hass, "script_1", script.RUN_ID_ANY, "1")
+
+    token = trace.trace_level_cv.set(trace.TRACE_LEVEL_SUMMARY)
+    try:
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+    finally:
+        trace.trace_level_cv.reset(token)
+
+    assert not script_obj.is_running
+    assert len(events) == 1
+    assert events[0].data["value"] == 1
+
+    assert_action_trace(
+        {
+            "0": [{}],
+            "1": [{"result": {"event": event, "event_data": {"value": 1}}}],
+        }
+    )
+
+
+async def test_trace_level_off(hass):
+    """Test actions are not traced at level off."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"value": 1}},
+            {
+                "condition": "template",
+                "value_template": "{{ value == 1 }}",
+            },
+            {"event": event, "event_data": {"value": "{{ value }}"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    token = trace.trace_level_cv.set(trace.TRACE_LEVEL_OFF)
+    try:
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+    finally:
+        trace.trace_level_cv.reset(token)
+
+    assert len(events) == 1
+    assert events[0].data["value"] == 1
+
+    assert_action_trace({})
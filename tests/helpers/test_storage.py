@@ -460,3 +460,36 @@ async def test_changing_delayed_written_data(hass, store, hass_storage):
         "key": MOCK_KEY,
         "data": {"hello": "world"},
     }
+
+
+def test_journal_records(tmp_path):
+    """Test appending records to a journal and loading them."""
+    hass = Mock()
+    hass.config.path.return_value = str(tmp_path / ".storage" / MOCK_KEY)
+    journal = storage.Journal(hass, MOCK_KEY)
+
+    assert journal._load_records(journal.path) == []
+
+    journal._append_records(journal.path, [MOCK_DATA, {"hello": 1}])
+    # Emulate an append that was cut short
+    with open(journal.path, "ab") as fdesc:
+        fdesc.write(b'\n{"hello": "wor')
+    journal._append_records(journal.path, [MOCK_DATA2])
+
+    assert journal._load_records(journal.path) == [
+        MOCK_DATA,
+        {"hello": 1},
+        MOCK_DATA2,
+    ]
+
+
+def test_journal_serialization_error(tmp_path):
+    """Test records that can not be serialized are not appended."""
+    hass = Mock()
+    hass.config.path.return_value = str(tmp_path / ".storage" / MOCK_KEY)
+    journal = storage.Journal(hass, MOCK_KEY)
+
+    with pytest.raises(storage.json_util.SerializationError):
+        journal._append_records(journal.path, [{"hello": object()}])
+
+    assert journal._load_records(journal.path) == []
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 import logging
 import math
 import random
+import re
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -1685,6 +1686,45 @@ def test_regex_findall_index(hass):
     assert tpl.async_render() == "LHR"
 
 
+def test_regex_literal_patterns_precompiled(hass):
+    """Test patterns that are literal in a template are compiled with it."""
+    tpl = template.Template(
+        """
+{{ 'Home Assistant' | regex_replace(find='Ho(me)', replace='Smart') }}
+{{ 'Home Assistant' is match('ho(me)', True) }}
+{{ 'Home Assistant' | regex_search(pattern) }}
+            """,
+        hass,
+    )
+    tpl.ensure_valid()
+    tpl._ensure_compiled()
+    assert [
+        (pattern.pattern, pattern.flags & re.I) for pattern in tpl._regex_patterns
+    ] == [("Ho(me)", 0), ("ho(me)", re.I)]
+
+    info = template.regex_cache_info()
+    assert tpl.async_render({"pattern": "H(om)e"}) == "Smart Assistant\nTrue\nTrue"
+    # Only the pattern from the variable was looked up in the cache
+    new_info = template.regex_cache_info()
+    assert new_info["hits"] + new_info["misses"] == info["hits"] + info["misses"] + 1
+
+
+def test_regex_cache(hass):
+    """Test the patterns of the regex filters are cached."""
+    tpl = template.Template(
+        "{{ 'Home Assistant' | regex_findall(pattern) }}",
+        hass,
+    )
+    info = template.regex_cache_info()
+    assert tpl.async_render({"pattern": "[Hh]ome [Aa]"}) == ["Home A"]
+    assert tpl.async_render({"pattern": "[Hh]ome [Aa]"}) == ["Home A"]
+
+    new_info = template.regex_cache_info()
+    assert new_info["misses"] == info["misses"] + 1
+    assert new_info["hits"] == info["hits"] + 1
+    assert new_info["maxsize"] == template.REGEX_CACHE_SIZE
+
+
 def test_bitwise_and(hass):
     """Test bitwise_and method."""
     tpl = template.Template(
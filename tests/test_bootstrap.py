@@ -334,6 +334,31 @@ async def test_setup_after_deps_not_present(hass):
     assert order == ["root", "second_dep"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_when_resolving_custom_integration_fails(hass, caplog):
+    """Test integrations are set up when a custom integration can't be resolved."""
+    order = []
+
+    async def async_setup(hass, config):
+        order.append("root")
+        return True
+
+    mock_integration(hass, MockModule(domain="root", async_setup=async_setup))
+
+    with patch(
+        "homeassistant.loader.async_get_custom_components",
+        side_effect=OSError("Broken custom component"),
+    ):
+        await bootstrap._async_set_up_integrations(
+            hass, {"root": {}, "broken_custom": {}}
+        )
+
+    assert "root" in hass.config.components
+    assert "broken_custom" not in hass.config.components
+    assert order == ["root"]
+    assert "Error resolving integrations: broken_custom" in caplog.text
+
+
 @pytest.fixture
 def mock_is_virtual_env():
     """Mock enable logging."""
@@ -400,6 +400,81 @@ def test_state_as_dict():
     assert state.as_dict() is as_dict_1
 
 
+def test_state_as_dict_json():
+    """Test a State as JSON."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+        context=ha.Context(id="01G97SJKQPE0QM8NF7NXK6GQMT"),
+    )
+    expected = (
+        '{"entity_id":"happy.happy","state":"on","attributes":{"pig":"dog"},'
+        '"last_changed":"1984-12-08T12:00:00","last_updated":"1984-12-08T12:00:00",'
+        '"context":{"id":"01G97SJKQPE0QM8NF7NXK6GQMT","parent_id":null,"user_id":null}}'
+    )
+    as_dict_json_1 = state.as_dict_json()
+    assert as_dict_json_1 == expected
+    # 2nd time to verify cache
+    assert state.as_dict_json() is as_dict_json_1
+
+
+def test_state_as_compressed_state():
+    """Test a State as compressed state."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0, tzinfo=dt_util.UTC)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+        context=ha.Context(id="01G97SJKQPE0QM8NF7NXK6GQMT"),
+    )
+    expected = {
+        "a": {"pig": "dog"},
+        "c": "01G97SJKQPE0QM8NF7NXK6GQMT",
+        "lc": last_time.timestamp(),
+        "s": "on",
+    }
+    as_compressed_state = state.as_compressed_state()
+    assert isinstance(as_compressed_state, ReadOnlyDict)
+    assert as_compressed_state == expected
+    # 2nd time to verify cache
+    assert state.as_compressed_state() is as_compressed_state
+    assert state.as_compressed_state_json() == (
+        '{"s":"on","a":{"pig":"dog"},"c":"01G97SJKQPE0QM8NF7NXK6GQMT","lc":471355200.0}'
+    )
+    assert state.as_compressed_state_json() is state.as_compressed_state_json()
+
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time + timedelta(seconds=1),
+        last_changed=last_time,
+        context=ha.Context(id="01G97SJKQPE0QM8NF7NXK6GQMT", user_id="abc"),
+    )
+    assert state.as_compressed_state() == {
+        "a": {"pig": "dog"},
+        "c": {"id": "01G97SJKQPE0QM8NF7NXK6GQMT", "parent_id": None, "user_id": "abc"},
+        "lc": last_time.timestamp(),
+        "lu": last_time.timestamp() + 1,
+        "s": "on",
+    }
+
+
+def test_state_attributes_json():
+    """Test the attributes of a State as JSON."""
+    state = ha.State("happy.happy", "on", {"pig": "dog", "count": 2})
+    attributes_json = state.attributes_json()
+    assert attributes_json == '{"pig":"dog","count":2}'
+    # 2nd time to verify cache
+    assert state.attributes_json() is attributes_json
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -466,6 +541,100 @@ async def test_eventbus_run_immediately(hass):
     unsub()
 
 
+async def test_eventbus_entity_listener(hass):
+    """Test listening for events of specific entity ids."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_entity(
+        "test", ["light.kitchen", "light.bowl"], listener
+    )
+    assert hass.bus.async_listeners()["test"] == 1
+    assert hass.bus.async_entity_listeners("test") == {
+        "light.kitchen": 1,
+        "light.bowl": 1,
+    }
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data["entity_id"] == "light.kitchen"
+
+    unsub()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert "test" not in hass.bus.async_listeners()
+    assert hass.bus.async_entity_listeners("test") == {}
+
+
+async def test_eventbus_domain_listener(hass):
+    """Test listening for events of entities in specific domains."""
+    calls = []
+    all_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def all_listener(event):
+        """Mock listener for all domains."""
+        all_calls.append(event)
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        return not event.data.get("filtered")
+
+    unsub = hass.bus.async_listen_domain(
+        "test", ["light"], listener, event_filter=filter
+    )
+    unsub_all = hass.bus.async_listen_domain("test", [MATCH_ALL], all_listener)
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": "switch.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert len(all_calls) == 3
+    assert calls[0].data["entity_id"] == "light.kitchen"
+
+    unsub()
+    unsub_all()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert len(all_calls) == 3
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listener_unsubscribe_twice(hass, caplog):
+    """Test removing a keyed listener twice logs an error."""
+    unsub = hass.bus.async_listen_entity(
+        "test", ["light.kitchen"], ha.callback(lambda event: None)
+    )
+    unsub()
+    unsub()
+    assert "Unable to remove unknown keyed job listener" in caplog.text
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -700,6 +869,28 @@ async def test_statemachine_entity_ids(hass):
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_domain_filter_keeps_insertion_order(hass):
+    """Test filtering several domains returns the states in insertion order."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.ac", "off")
+    hass.states.async_set("sensor.temperature", "20")
+    hass.states.async_set("light.ceiling", "on")
+    hass.states.async_remove("light.bowl")
+    hass.states.async_set("light.bowl", "off")
+
+    expected = ["switch.ac", "light.ceiling", "light.bowl"]
+    assert hass.states.async_entity_ids(["light", "switch"]) == expected
+    assert hass.states.async_entity_ids(("switch", "light", "cover")) == expected
+    assert [
+        state.entity_id for state in hass.states.async_all(["switch", "light"])
+    ] == expected
+    assert hass.states.async_entity_ids(["cover", "light"]) == [
+        "light.ceiling",
+        "light.bowl",
+    ]
+    assert hass.states.async_entity_ids(["cover"]) == []
+
+
 async def test_statemachine_remove(hass):
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -763,6 +954,43 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_shares_unchanged_attributes(hass):
+    """Test unchanged attributes are shared with the new state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    old_state = hass.states.get("light.bowl")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.bowl", "on", old_state.attributes)
+    await hass.async_block_till_done()
+    assert len(events) == 0
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    new_state = hass.states.get("light.bowl")
+    assert new_state.state == "off"
+    assert new_state.attributes is old_state.attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert hass.states.get("light.bowl").attributes == {"brightness": 50}
+    assert old_state.attributes == {"brightness": 100}
+
+
+async def test_statemachine_shares_unchanged_attributes_json(hass):
+    """Test the JSON of unchanged attributes is shared with the new state."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    attributes_json = hass.states.get("light.bowl").attributes_json()
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    assert hass.states.get("light.bowl").attributes_json() is attributes_json
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    assert hass.states.get("light.bowl").attributes_json() == '{"brightness":50}'
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1443,6 +1671,32 @@ async def test_async_entity_ids_count(hass):
 
     assert hass.states.async_entity_ids_count() == 5
     assert hass.states.async_entity_ids_count("light") == 3
+    assert hass.states.async_entity_ids_count(["light", "switch", "light"]) == 4
+
+    hass.states.async_remove("light.cow")
+    hass.states.async_remove("switch.link")
+
+    assert hass.states.async_entity_ids_count() == 3
+    assert hass.states.async_entity_ids_count("light") == 2
+    assert hass.states.async_entity_ids_count("switch") == 0
+    assert hass.states.async_entity_ids_count(["light", "switch"]) == 2
+
+
+async def test_domain_filter_tracks_state_updates(hass):
+    """Test domain filtered queries return the current states."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("LIGHT.Frog", "on")
+    hass.states.async_set("light.bowl", "off")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.frog"]
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "on"]
+    assert hass.states.async_all(("light",)) == hass.states.async_all("light")
+
+    hass.states.async_remove("light.bowl")
+    hass.states.async_remove("light.frog")
+
+    assert hass.states.async_entity_ids("light") == []
+    assert hass.states.async_all("light") == []
 
 
 async def test_hassjob_forbid_coroutine():
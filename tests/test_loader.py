@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import json
+import pathlib
 from unittest.mock import patch
 
 import pytest
@@ -465,6 +467,124 @@ async def test_get_custom_components(hass, enable_custom_integrations):
         mock_get.assert_called_once_with(hass)
 
 
+async def test_get_integrations_from_manifest_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch(
+        "homeassistant.loader.Integration.resolve_from_root", return_value=None
+    ) as mock_resolve:
+        integrations = await loader.async_get_integrations(
+            hass, ["light", "switch", "not_existing", "some.thing"]
+        )
+
+    # Only the domain missing from the index is probed on disk
+    assert mock_resolve.call_count == 1
+    assert mock_resolve.call_args[0][2] == "not_existing"
+    assert integrations["light"].domain == "light"
+    assert integrations["light"].is_built_in
+    assert (
+        integrations["light"].file_path
+        == pathlib.Path(http.__file__).parent.parent / "light"
+    )
+    assert integrations["switch"].domain == "switch"
+    assert isinstance(integrations["not_existing"], loader.IntegrationNotFound)
+    assert isinstance(integrations["some.thing"], ValueError)
+    assert await loader.async_get_integration(hass, "light") is integrations["light"]
+
+
+async def test_get_integrations_without_manifest_index(hass, tmp_path):
+    """Test integrations are probed on disk when the index has another version."""
+    index_path = tmp_path / "manifests.json"
+    index_path.write_text('{"version": 0, "manifests": {"light": {}}}')
+
+    with patch("homeassistant.loader.MANIFEST_INDEX_PATH", index_path), patch(
+        "homeassistant.loader.Integration.resolve_from_root",
+        wraps=loader.Integration.resolve_from_root,
+    ) as mock_resolve:
+        integrations = await loader.async_get_integrations(hass, ["light", "switch"])
+
+    assert mock_resolve.call_count == 2
+    assert integrations["light"].name == "Light"
+    assert integrations["switch"].name == "Switch"
+
+
+async def test_get_integrations_from_outdated_manifest_index(hass, tmp_path, caplog):
+    """Test the index generated for another Home Assistant version is ignored."""
+    index_path = tmp_path / "manifests.json"
+    index_path.write_text(
+        '{"version": 1, "homeassistant": "0.1.0", '
+        '"manifests": {"light": {"domain": "light", "name": "Indexed Light"}}}'
+    )
+
+    with patch("homeassistant.loader.MANIFEST_INDEX_PATH", index_path):
+        integrations = await loader.async_get_integrations(hass, ["light"])
+
+    assert integrations["light"].name == "Light"
+    assert "generated for Home Assistant 0.1.0" in caplog.text
+
+
+async def test_get_integrations_resolve_error(hass, caplog):
+    """Test an error resolving integrations is returned for each domain."""
+    error = OSError("Boom")
+    with patch("homeassistant.loader.async_get_custom_components", side_effect=error):
+        integrations = await loader.async_get_integrations(hass, ["light", "switch"])
+
+    assert integrations == {"light": error, "switch": error}
+    assert "Error resolving integrations: light, switch" in caplog.text
+
+    # The error is not cached
+    integration = await loader.async_get_integration(hass, "light")
+    assert integration.domain == "light"
+
+
+async def test_manifest_index_matches_manifests(hass):
+    """Test the manifest index contains the manifests of the integrations."""
+    index = await hass.async_add_executor_job(loader._load_manifest_index)
+    from homeassistant import components
+
+    for domain in ("http", "light", "recorder"):
+        integration = await hass.async_add_executor_job(
+            loader.Integration.resolve_from_root, hass, components, domain
+        )
+        manifest = dict(integration.manifest)
+        manifest.pop("is_built_in")
+        assert index[domain] == manifest
+
+
+async def test_custom_manifest_cache(hass, tmp_path, enable_custom_integrations):
+    """Test custom manifests are cached until they are modified."""
+    cache_path = tmp_path / "core.custom_manifests"
+    import custom_components
+
+    with patch("homeassistant.loader.CUSTOM_MANIFEST_CACHE", str(cache_path)):
+        integrations = await hass.async_add_executor_job(
+            loader._resolve_custom_integrations, hass, custom_components
+        )
+        assert integrations["test_package"].name == "Test Package"
+
+        cache = json.loads(cache_path.read_text())
+        assert cache["version"] == loader.MANIFEST_INDEX_VERSION
+        key = next(key for key in cache["manifests"] if "test_package" in key)
+        assert cache["manifests"][key]["manifest"]["name"] == "Test Package"
+
+        # An unmodified manifest is taken from the cache
+        cache["manifests"][key]["manifest"]["name"] = "Cached Package"
+        cache_path.write_text(json.dumps(cache))
+        integrations = await hass.async_add_executor_job(
+            loader._resolve_custom_integrations, hass, custom_components
+        )
+        assert integrations["test_package"].name == "Cached Package"
+
+        # A modified manifest is read again
+        cache["manifests"][key]["mtime"] -= 1
+        cache_path.write_text(json.dumps(cache))
+        integrations = await hass.async_add_executor_job(
+            loader._resolve_custom_integrations, hass, custom_components
+        )
+        assert integrations["test_package"].name == "Test Package"
+        cache = json.loads(cache_path.read_text())
+        assert cache["manifests"][key]["manifest"]["name"] == "Test Package"
+
+
 async def test_get_config_flows(hass):
     """Verify that custom components with config_flow are available."""
     test_1_integration = _get_test_integration(hass, "test_1", False)
@@ -11,6 +11,7 @@ import pytest
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import JSONEncoder as HAJSONEncoder
 from homeassistant.util.json import (
     SerializationError,
     find_paths_unserializable_data,
@@ -107,6 +108,20 @@ def test_custom_encoder():
     assert data == "9"
 
 
+def test_save_with_home_assistant_encoder():
+    """Test saving Home Assistant objects with the Home Assistant encoder."""
+    fname = _path_for("test7")
+    state = State("test.test", "hello", {"ids": {1}})
+    save_json(fname, {"state": state, 1: 2**70}, encoder=HAJSONEncoder)
+    data = load_json(fname)
+    assert data == {
+        "state": dict(state.as_dict(), attributes={"ids": [1]}),
+        "1": 2**70,
+    }
+    with open(fname, encoding="utf-8") as fh:
+        assert fh.read().startswith('{\n  "state": {\n')
+
+
 def test_find_unserializable_data():
     """Find unserializeable data."""
     assert find_paths_unserializable_data(1) == {}
@@ -164,3 +179,11 @@ def test_find_unserializable_data():
         BadData(),
         dump=partial(dumps, cls=MockJSONEncoder),
     ) == {"$(BadData).bla": bad_data}
+
+
+def test_load_json_nan(tmp_path):
+    """Test loading JSON with NaN written by the standard library."""
+    fname = tmp_path / "test.json"
+    fname.write_text('{"hello": NaN}')
+    data = load_json(str(fname))
+    assert math.isnan(data["hello"])
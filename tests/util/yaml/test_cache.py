@@ -0,0 +1,145 @@
+"""Test the YAML parse cache."""
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.config import load_yaml_config_file
+from homeassistant.util.yaml import ParseCache, Secrets
+from homeassistant.util.yaml import loader as yaml_loader
+
+
+def _load(config_dir: Path, cache_path: Path):
+    """Load the configuration with a fresh parse cache read from disk."""
+    parse_cache = ParseCache(str(cache_path))
+    get_single_node = yaml_loader.FastSafeLoader.get_single_node
+    parsed = []
+
+    def mock_get_single_node(loader):
+        parsed.append(loader.name)
+        return get_single_node(loader)
+
+    with patch.object(
+        yaml_loader.FastSafeLoader, "get_single_node", mock_get_single_node
+    ):
+        config = load_yaml_config_file(
+            str(config_dir / "configuration.yaml"),
+            Secrets(config_dir),
+            parse_cache,
+        )
+    return config, len(parsed)
+
+
+def test_parse_cache(tmp_path, monkeypatch):
+    """Test unmodified files are taken from the parse cache."""
+    monkeypatch.setenv("TEST_PARSE_CACHE", "from_env")
+    cache_path = tmp_path / ".storage" / "core.yaml_parse_cache"
+    (tmp_path / "configuration.yaml").write_text(
+        "base: &base\n"
+        "  a: 1\n"
+        "merged:\n"
+        "  <<: *base\n"
+        "  b: 2\n"
+        "password: !secret password\n"
+        "env: !env_var TEST_PARSE_CACHE\n"
+        "included: !include included.yaml\n"
+    )
+    (tmp_path / "included.yaml").write_text("- one\n- two\n")
+    (tmp_path / "secrets.yaml").write_text("password: secret1\n")
+
+    config, parsed = _load(tmp_path, cache_path)
+    assert parsed == 3
+    assert config == {
+        "base": {"a": 1},
+        "merged": {"a": 1, "b": 2},
+        "password": "secret1",
+        "env": "from_env",
+        "included": ["one", "two"],
+    }
+    assert cache_path.is_file()
+
+    cached_config, parsed = _load(tmp_path, cache_path)
+    # secrets.yaml is loaded without the parse cache
+    assert parsed == 1
+    assert cached_config == config
+    assert cached_config["included"].__config_file__ == str(
+        tmp_path / "configuration.yaml"
+    )
+    assert cached_config["included"].__line__ == config["included"].__line__ == 7
+    assert cached_config["merged"].__line__ == config["merged"].__line__
+
+    # Secrets and environment variables are resolved on every load
+    (tmp_path / "secrets.yaml").write_text("password: secret2\n")
+    monkeypatch.setenv("TEST_PARSE_CACHE", "changed")
+    cached_config, parsed = _load(tmp_path, cache_path)
+    assert parsed == 1
+    assert cached_config["password"] == "secret2"
+    assert cached_config["env"] == "changed"
+
+    # Modified files are parsed again
+    (tmp_path / "included.yaml").write_text("- one\n- two\n- three\n")
+    cached_config, parsed = _load(tmp_path, cache_path)
+    assert parsed == 2
+    assert cached_config["included"] == ["one", "two", "three"]
+
+
+def test_parse_cache_prunes_unused_files(tmp_path):
+    """Test files that are no longer loaded are removed from the cache."""
+    cache_path = tmp_path / ".storage" / "core.yaml_parse_cache"
+    (tmp_path / "configuration.yaml").write_text("included: !include included.yaml\n")
+    (tmp_path / "included.yaml").write_text("key: value\n")
+    _load(tmp_path, cache_path)
+
+    parse_cache = ParseCache(str(cache_path))
+    assert parse_cache._get_entries().keys() == {
+        str(tmp_path / "configuration.yaml"),
+        str(tmp_path / "included.yaml"),
+    }
+
+    (tmp_path / "configuration.yaml").write_text("included: false\n")
+    _load(tmp_path, cache_path)
+
+    parse_cache = ParseCache(str(cache_path))
+    assert parse_cache._get_entries().keys() == {str(tmp_path / "configuration.yaml")}
+
+
+def test_parse_cache_saved_on_change(tmp_path):
+    """Test the cache is only written when entries were added or invalidated."""
+    cache_path = tmp_path / ".storage" / "core.yaml_parse_cache"
+    (tmp_path / "configuration.yaml").write_text("included: !include included.yaml\n")
+    (tmp_path / "included.yaml").write_text("key: value\n")
+    _load(tmp_path, cache_path)
+
+    with patch("homeassistant.util.yaml.cache.os.replace") as mock_replace:
+        _load(tmp_path, cache_path)
+    assert not mock_replace.called
+
+    (tmp_path / "included.yaml").write_text("key: changed\n")
+    with patch("homeassistant.util.yaml.cache.os.replace") as mock_replace:
+        config, parsed = _load(tmp_path, cache_path)
+    assert config == {"included": {"key": "changed"}}
+    assert parsed == 1
+    assert mock_replace.called
+
+
+def test_parse_cache_invalid_file(tmp_path):
+    """Test an invalid cache file is ignored."""
+    cache_path = tmp_path / "core.yaml_parse_cache"
+    cache_path.write_bytes(b"not a cache")
+    (tmp_path / "configuration.yaml").write_text("key: value\n")
+
+    config, parsed = _load(tmp_path, cache_path)
+    assert config == {"key": "value"}
+    assert parsed == 1
+
+    config, parsed = _load(tmp_path, cache_path)
+    assert config == {"key": "value"}
+    assert parsed == 0
+
+
+def test_parse_cache_not_writable(tmp_path):
+    """Test the configuration is loaded if the cache can't be saved."""
+    (tmp_path / "configuration.yaml").write_text("key: value\n")
+    with patch("homeassistant.util.yaml.cache.os.replace", side_effect=OSError):
+        config, _ = _load(tmp_path, tmp_path / "core.yaml_parse_cache")
+    assert config == {"key": "value"}
+    assert not os.path.exists(tmp_path / "core.yaml_parse_cache")
@@ -445,3 +445,32 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+@pytest.mark.parametrize("has_c_loader", (True, False))
+def test_include_line_numbers(has_c_loader):
+    """Test both loaders annotate included files with their origin."""
+    files = {
+        YAML_CONFIG_FILE: "key: value\nincluded: !include included.yaml\n",
+        "included.yaml": "- one\n- two\n",
+    }
+    with patch_yaml_files(files), patch.object(
+        yaml_loader, "HAS_C_LOADER", has_c_loader
+    ):
+        config = load_yaml_config_file(YAML_CONFIG_FILE)
+
+    assert config["included"] == ["one", "two"]
+    assert config["included"].__config_file__ == YAML_CONFIG_FILE
+    assert config["included"].__line__ == 1
+
+
+def test_invalid_yaml_falls_back_to_python_loader(caplog):
+    """Test invalid YAML is reported with the errors of the Python loader."""
+    files = {YAML_CONFIG_FILE: "key: [value\n"}
+    with patch_yaml_files(files), patch.object(
+        yaml_loader, "_parse_yaml_python", wraps=yaml_loader._parse_yaml_python
+    ) as mock_parse_python, pytest.raises(HomeAssistantError):
+        load_yaml_config_file(YAML_CONFIG_FILE)
+
+    assert mock_parse_python.call_count == 1
+    assert "while parsing a flow sequence" in caplog.text